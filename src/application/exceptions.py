@@ -0,0 +1,23 @@
+class ApplicationException(Exception):
+    """Базовая ошибка приложения"""
+    pass
+
+
+class InvalidSignatureException(ApplicationException):
+    """Неверная подпись запроса - 401 ошибка"""
+    pass
+
+
+class InvalidPayloadException(ApplicationException):
+    """Тело запроса не разбирается - 400 ошибка"""
+    pass
+
+
+class ServiceOverloadedException(ApplicationException):
+    """Очередь обработки переполнена - 503 ошибка"""
+    pass
+
+
+class SyncInProgressException(ApplicationException):
+    """Репозиторий уже синхронизируется другим процессом - 409 ошибка"""
+    pass
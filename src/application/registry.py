@@ -1,18 +1,75 @@
 from infrastructure.repositories.github_event import TaskRepo
+from infrastructure.repositories.request_cache import RequestCacheRepo
+from infrastructure.repositories.sync_state import SyncStateRepo
+from infrastructure.repositories.monitored_repository import MonitoredRepositoryRepo
+from infrastructure.repositories.payload_archive import PayloadArchiveRepo, PayloadDictionaryRepo
+from infrastructure.repositories.event_partition import EventPartitionRepo
+from infrastructure.repositories.event_stats import EventStatsRepo
 from infrastructure.ws_manager import WSManager
 from infrastructure.nats_manager import NATSClient
+from infrastructure.github_client import GitHubClient
+from infrastructure.compression import PayloadCompressor
+from infrastructure.cache import TTLCache
 
 from .stories.github_event_stories import TaskStories
+from .stories.repository_stories import RepositoryStories
+from .stories.payload_archive_stories import PayloadArchiveStories
+from .stories.partition_stories import PartitionStories
+from .sync_pool import SyncWorkerPool
+from .webhooks import WebhookProcessor
+from config import settings
 
 
 class Application:
     ws_manager = WSManager()
     nats_client = NATSClient()
+    github_client = GitHubClient()
+    payload_compressor = PayloadCompressor(level=settings.RAW_DATA_ZSTD_LEVEL)
+    events_cache = TTLCache(max_bytes=settings.EVENTS_CACHE_MAX_BYTES, ttl=settings.EVENTS_CACHE_TTL)
     
     task_repo = TaskRepo()
+    request_cache_repo = RequestCacheRepo()
+    sync_state_repo = SyncStateRepo()
+    monitored_repository_repo = MonitoredRepositoryRepo()
+    payload_archive_repo = PayloadArchiveRepo()
+    payload_dictionary_repo = PayloadDictionaryRepo()
+    event_partition_repo = EventPartitionRepo()
+    event_stats_repo = EventStatsRepo()
 
     github_stories = TaskStories(
         repo=task_repo,
+        request_cache_repo=request_cache_repo,
+        sync_state_repo=sync_state_repo,
+        stats_repo=event_stats_repo,
         ws_manager=ws_manager, 
-        nats_client=nats_client
+        nats_client=nats_client,
+        github_client=github_client,
+        cache=events_cache
+    )
+    
+    repository_stories = RepositoryStories(
+        repo=monitored_repository_repo
+    )
+    
+    payload_archive_stories = PayloadArchiveStories(
+        repo=payload_archive_repo,
+        dictionary_repo=payload_dictionary_repo,
+        event_repo=task_repo,
+        compressor=payload_compressor
+    )
+    
+    partition_stories = PartitionStories(
+        repo=event_partition_repo
+    )
+    
+    sync_pool = SyncWorkerPool(
+        github_stories=github_stories,
+        repository_stories=repository_stories,
+        size=settings.SYNC_WORKERS
+    )
+    
+    webhook_processor = WebhookProcessor(
+        github_stories=github_stories,
+        repository_stories=repository_stories,
+        queue_size=settings.WEBHOOK_QUEUE_SIZE
     )
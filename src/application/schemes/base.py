@@ -1,18 +1,64 @@
+import enum
 from pydantic import BaseModel
 
 from typing import Generic, TypeVar
+from uuid import UUID
 
 T = TypeVar('T')
 
 
+class CountStrategy(enum.Enum):
+    """Способ подсчёта total_record в списках"""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
+
+
 class ListDTO(BaseModel, Generic[T]):
     page_number: int
     page_size: int
-    total_pages: int
-    total_record: int
+    total_pages: int | None
+    total_record: int | None
     content: list[T]
+    next_cursor: str | None = None
+    count_strategy: CountStrategy = CountStrategy.EXACT
 
     class Config:
         from_attributes = True
         arbitrary_types_allowed=True
-    
+
+
+class BulkItemStatus(enum.Enum):
+    """Результат обработки одного элемента пачки"""
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    CONFLICT = "conflict"
+    NOT_FOUND = "not_found"
+    INVALID = "invalid"
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    status: BulkItemStatus
+    id: UUID | None = None
+    error: str | None = None
+
+
+class BulkResultDTO(BaseModel):
+    succeeded: int
+    failed: int
+    items: list[BulkItemResult]
+
+
+class CacheStatsOut(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    rejected: int
+    items: int
+    size_bytes: int
+    max_bytes: int
@@ -0,0 +1,46 @@
+from uuid import UUID
+from pydantic import BaseModel
+from datetime import datetime
+
+
+class RepositoryInput(BaseModel):
+    owner: str
+    name: str
+    is_active: bool = True
+
+    class Config:
+        from_attributes = True
+
+
+class RepositoryOut(BaseModel):
+    id: UUID
+    
+    owner: str
+    name: str
+    full_name: str
+    is_active: bool
+    
+    sync_interval: float
+    next_sync_at: datetime
+    last_sync_at: datetime | None = None
+    last_success_at: datetime | None = None
+    last_duration: float | None = None
+    last_created: int
+    last_error: str | None = None
+    sync_count: int
+    error_count: int
+    
+    created_at: datetime
+    updated_at: datetime | None = None
+    
+    class Config:
+        from_attributes = True
+
+
+class RepositoryEdit(BaseModel):
+    owner: str | None = None
+    name: str | None = None
+    is_active: bool | None = None
+
+    class Config:
+        from_attributes = True
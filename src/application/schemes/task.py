@@ -1,6 +1,8 @@
+from typing import Any
 from uuid import UUID
-from pydantic import BaseModel
-from datetime import datetime
+from pydantic import BaseModel, model_validator
+from datetime import date, datetime
+import enum
 
 from infrastructure.database.models import EventType
 
@@ -13,7 +15,7 @@ class GitHubInput(BaseModel):
     author: str
     url: str 
     repository: str
-    raw_data: str
+    raw_data: dict[str, Any]
     commit_hash: str | None
     issue_number: int | None
     release_version: str | None
@@ -30,9 +32,10 @@ class GitHubOut(BaseModel):
     title: str
     description: str
     author: str
-    url: str 
+    url: str
     repository: str
-    raw_data: str
+    # None после архивации, полный payload - GET /events/{id}/raw
+    raw_data: dict[str, Any] | None
     commit_hash: str | None
     issue_number: int | None
     release_version: str | None
@@ -44,6 +47,55 @@ class GitHubOut(BaseModel):
         from_attributes = True
 
 
+class GitHubFieldsOut(BaseModel):
+    """Событие в ответах GET с fields=. Поля, кроме id, необязательны:
+    в ответ попадают только запрошенные."""
+    id: UUID
+    
+    event_id: str | None = None
+    event_type: EventType | None = None
+    title: str | None = None
+    description: str | None = None
+    author: str | None = None
+    url: str | None = None
+    repository: str | None = None
+    raw_data: dict[str, Any] | None = None
+    commit_hash: str | None = None
+    issue_number: int | None = None
+    release_version: str | None = None
+    
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    
+    class Config:
+        from_attributes = True
+
+
+class GitHubRawOut(BaseModel):
+    id: UUID
+    raw_data: dict[str, Any]
+
+    class Config:
+        from_attributes = True
+
+
+class GitHubFilter(BaseModel):
+    event_type: EventType | None = None
+    repository: str | None = None
+    author: str | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    issue_number: int | None = None
+    release_version: str | None = None
+    raw_contains: str | None = None
+    raw_path: str | None = None
+
+
+class GitHubSearchOut(GitHubOut):
+    rank: float
+    snippet: str
+
+
 class GitHubEdit(BaseModel):
     event_id: str | None = None
     event_type: EventType | None = None
@@ -52,10 +104,49 @@ class GitHubEdit(BaseModel):
     author: str | None = None
     url: str | None = None
     repository: str | None = None
-    raw_data: str | None = None
+    raw_data: dict[str, Any] | None = None
     commit_hash: str  | None = None
     issue_number: int  | None = None
     release_version: str  | None = None
 
     class Config:
         from_attributes = True
+
+
+class GitHubPatch(GitHubEdit):
+    """PATCH /events/{id}. Если передан expected_updated_at (в том числе null),
+    изменение применяется только когда updated_at в БД совпадает, иначе 409."""
+    expected_updated_at: datetime | None = None
+
+
+class GitHubBulkEdit(GitHubEdit):
+    """Элемент пачки PATCH /events/bulk: меняются только переданные поля"""
+    id: UUID
+
+
+class GitHubBulkDelete(BaseModel):
+    """Элемент пачки DELETE /events/bulk: {"id": ...} или просто id строкой"""
+    id: UUID
+
+    @model_validator(mode="before")
+    @classmethod
+    def from_id(cls, data: Any) -> Any:
+        if isinstance(data, str):
+            return {"id": data}
+        return data
+
+
+class StatsBucket(enum.Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class GitHubStatsOut(BaseModel):
+    """Количество событий за интервал. Поля группировки, не указанные в group_by, не выводятся"""
+    bucket: date
+    count: int
+    
+    event_type: EventType | None = None
+    repository: str | None = None
+    author: str | None = None
@@ -16,6 +16,11 @@ class BaseStory:
         async with StoryContext.begin():
             yield self
 
+    @asynccontextmanager
+    async def begin_read_only(self) -> AsyncIterator[Self]:
+        async with StoryContext.begin_read_only():
+            yield self
+
     async def begin_in_depends(self) -> AsyncIterator[Self]:
         async with StoryContext.begin():
             yield self
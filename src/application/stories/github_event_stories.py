@@ -1,78 +1,287 @@
 import asyncio
-from datetime import datetime
+from contextlib import aclosing, asynccontextmanager
+from datetime import date, datetime, timezone
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
 import uuid
 
-import aiohttp
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from domain.interfaces.github_event import IGitHubEventRepo
+from domain.interfaces.request_cache import IRequestCacheRepo
+from domain.interfaces.sync_state import ISyncStateRepo
+from domain.interfaces.event_stats import IEventStatsRepo, StatsKey
 from infrastructure.nats_manager import NATSClient
+from infrastructure.cache import TTLCache
+from infrastructure.context import StoryContext
+from infrastructure.github_client import GitHubClient, GitHubResponse
+from infrastructure.repositories.base import invalidate_table_counts
 from .base import BaseStory
-from infrastructure.database.models import EventType, GitHubEvent
+from infrastructure.database.models import EventType, GitHubEvent, SyncState
 from infrastructure.ws_manager import WSManager
-from ..schemes.task import GitHubOut
-from ..schemes.base import ListDTO
+from ..schemes.task import (
+    GitHubBulkDelete,
+    GitHubBulkEdit,
+    GitHubFieldsOut,
+    GitHubFilter,
+    GitHubInput,
+    GitHubOut,
+    GitHubSearchOut,
+    GitHubStatsOut,
+    StatsBucket
+)
+from ..schemes.base import BulkItemResult, BulkItemStatus, BulkResultDTO, CacheStatsOut, CountStrategy, ListDTO
+from ..exceptions import SyncInProgressException
+from infrastructure.exceptions import EntityAlreadyExistsException, FieldException
 from uuid import UUID
+from yarl import URL
 from config import settings
 
 _log = logging.getLogger(__name__)
 
+BulkModel = TypeVar("BulkModel", bound=BaseModel)
+
+# Поля списка по умолчанию: raw_data отдаётся отдельным endpoint
+LIST_FIELDS = [field for field in GitHubFieldsOut.model_fields if field != "raw_data"]
+
+# Колонки NOT NULL: явный null в изменении - ошибка 400 (в пачке - ошибка элемента), а не 500 от БД
+NOT_NULL_FIELDS = frozenset(
+    column.name for column in GitHubEvent.__table__.columns if not column.nullable  # type: ignore
+)
+
+# Поля группировки github_event_stats (помимо дня)
+STATS_FIELDS = ("repository", "event_type", "author")
+
 
 class TaskStories(BaseStory):
 
     repo: IGitHubEventRepo
+    request_cache_repo: IRequestCacheRepo
+    sync_state_repo: ISyncStateRepo
+    stats_repo: IEventStatsRepo
     ws_manager: WSManager
     nats_client: NATSClient
+    github_client: GitHubClient
+    cache: TTLCache
     
-    @property
-    def base_url(self) -> str:
-        return "https://api.github.com"
-    
+    @asynccontextmanager
     async def _make_request(
         self, 
-        endpoint: str, 
-        owner: str, 
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        validators: Optional[dict[str, tuple[str | None, str | None]]] = None
+    ) -> AsyncIterator[GitHubResponse]:
+        """Условный потоковый запрос: validators хранит (ETag, Last-Modified) по ключу URL и обновляется на месте"""
+        url = self.github_client.build_url(path, params)
+        key = self._cache_key(url)
+        
+        headers: dict[str, str] = {}
+        if validators is not None and key in validators:
+            etag, last_modified = validators[key]
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        async with self.github_client.stream(url, headers=headers) as response:
+            if validators is not None and response.status == 200:
+                validators[key] = (
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified")
+                )
+            
+            yield response
+    
+    async def _paginate(
+        self,
+        endpoint: str,
+        owner: str,
         repo: str,
-        params: Optional[dict[str, Any]] = None
-    ) -> list[dict[str, Any]]:
-        url = f"{self.base_url}/repos/{owner}/{repo}/{endpoint}"
+        params: Optional[dict[str, Any]] = None,
+        validators: Optional[dict[str, tuple[str | None, str | None]]] = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Обходит все страницы ресурса по заголовку Link.
         
-        headers = {
-            'Authorization': f"token {settings.GITHUB_TOKEN}",
-            'Accept': 'application/vnd.github.v3+json'
-        }
+        Условный запрос (validators) - только для первой страницы: если она изменилась,
+        последующие страницы сдвинуты и их сохранённые валидаторы всё равно не совпадут.
         
-        async with aiohttp.ClientSession() as session:
-            response = await session.get(url, headers=headers, params=params)
-
-            return await response.json()
+        Страницы читает фоновая задача: элементы декодируются из тела потоково и
+        пачками по GITHUB_STREAM_BATCH уходят в очередь, вызывающий код пишет их в БД,
+        пока страница ещё дочитывается. Очередь вмещает целую страницу, поэтому чтение
+        не ждёт записи в БД и не держит соединение и слот семафора дольше, чем идёт
+        ответ. Следующая страница запрашивается после обработки всех пачек предыдущей:
+        в памяти не больше одной страницы.
+        """
+        batches_per_page = -(-settings.GITHUB_PER_PAGE // settings.GITHUB_STREAM_BATCH)
+        queue: asyncio.Queue[list[dict[str, Any]] | BaseException | None] = asyncio.Queue(
+            maxsize=batches_per_page
+        )
         
-    async def get_commits(
-        self
-    ):
-        return await self._make_request(endpoint="commits", owner=settings.GITHUB_OWNER, repo=settings.GITHUB_REPO)
+        async def produce() -> None:
+            nonlocal validators
+            path: str | None = f"repos/{owner}/{repo}/{endpoint}"
+            page_params: dict[str, Any] | None = {"per_page": settings.GITHUB_PER_PAGE, **(params or {})}
+            
+            try:
+                while path is not None:
+                    await queue.join()
+                    async with self._make_request(path, params=page_params, validators=validators) as response:
+                        validators = None
+                        if response.status == 304:
+                            # Страница не изменилась - более старые страницы уже загружены
+                            _log.debug(f"Не изменилось: {response.url}")
+                            break
+                        
+                        batch: list[dict[str, Any]] = []
+                        async for item in response.data:
+                            batch.append(item)
+                            if len(batch) >= settings.GITHUB_STREAM_BATCH:
+                                await queue.put(batch)
+                                batch = []
+                        if batch:
+                            await queue.put(batch)
+                    
+                    # next-ссылка уже содержит все параметры запроса
+                    path, page_params = response.next_url, None
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(None)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                if isinstance(batch, BaseException):
+                    raise batch
+                yield batch
+                queue.task_done()
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+        
+    def _cache_key(self, url: str) -> str:
+        """Ключ валидаторов без since: иначе на каждую синхронизацию появлялась бы новая строка.
+        
+        Совпадение ETag означает то же тело ответа, поэтому валидаторы с другим since безопасны.
+        """
+        return str(URL(url).without_query_params("since"))
     
-    async def get_releases(
-        self
-    ):
-        return await self._make_request(endpoint="releases", owner=settings.GITHUB_OWNER, repo=settings.GITHUB_REPO)
+    def _first_page_key(self, owner: str, repo: str, endpoint: str) -> str:
+        return self._cache_key(self.github_client.build_url(
+            f"repos/{owner}/{repo}/{endpoint}", {"per_page": settings.GITHUB_PER_PAGE}
+        ))
     
-    async def get_issues(
-        self
-    ):
-        return await self._make_request(endpoint="issues", owner=settings.GITHUB_OWNER, repo=settings.GITHUB_REPO)
+    def _since_params(self, since: datetime | None) -> dict[str, Any]:
+        if since is None:
+            return {}
+        return {"since": since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")}
+    
+    def get_commits(
+        self,
+        owner: str,
+        name: str,
+        validators: Optional[dict[str, tuple[str | None, str | None]]] = None,
+        since: datetime | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        return self._paginate(endpoint="commits", owner=owner, repo=name, params=self._since_params(since), validators=validators)
+    
+    def get_releases(
+        self,
+        owner: str,
+        name: str,
+        validators: Optional[dict[str, tuple[str | None, str | None]]] = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        return self._paginate(endpoint="releases", owner=owner, repo=name, validators=validators)
+    
+    def get_issues(
+        self,
+        owner: str,
+        name: str,
+        validators: Optional[dict[str, tuple[str | None, str | None]]] = None,
+        since: datetime | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        return self._paginate(endpoint="issues", owner=owner, repo=name, params=self._since_params(since), validators=validators)
+    
+    async def _take_new(
+        self,
+        event_type: EventType,
+        stream: AsyncIterator[list[dict[str, Any]]],
+        state: SyncState | None,
+        marks: dict[EventType, tuple[str, datetime | None]]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Отдаёт записи до последней загруженной и запоминает самую новую в marks"""
+        last_seen_id = state.last_seen_id if state is not None else None
+        
+        async with aclosing(stream):
+            async for page in stream:
+                if page and event_type not in marks:
+                    marks[event_type] = self._event_mark(event_type, page[0])
+                
+                new_items: list[dict[str, Any]] = []
+                reached = False
+                for item in page:
+                    if self._event_mark(event_type, item)[0] == last_seen_id:
+                        reached = True
+                        break
+                    new_items.append(item)
+                
+                if new_items:
+                    yield new_items
+                if reached:
+                    return
+    
+    async def _merge_pages(
+        self,
+        streams: dict[EventType, AsyncIterator[list[dict[str, Any]]]]
+    ) -> AsyncIterator[tuple[EventType, list[dict[str, Any]]]]:
+        """Загружает ресурсы параллельно и отдаёт страницы по мере получения"""
+        queue: asyncio.Queue[tuple[EventType, list[dict[str, Any]] | Exception | None]] = asyncio.Queue(
+            maxsize=len(streams) * 2
+        )
+        
+        async def produce(event_type: EventType, stream: AsyncIterator[list[dict[str, Any]]]):
+            try:
+                async for page in stream:
+                    await queue.put((event_type, page))
+            except Exception as e:
+                await queue.put((event_type, e))
+                return
+            await queue.put((event_type, None))
+        
+        tasks = [asyncio.create_task(produce(t, s)) for t, s in streams.items()]
+        try:
+            finished = 0
+            while finished < len(tasks):
+                event_type, page = await queue.get()
+                if page is None:
+                    finished += 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    yield event_type, page
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     async def _send_ws_message(
         self, 
         type: str,
         id: UUID | None = None,
+        ids: list[UUID] | None = None,
     ):
         message: dict[str, Any] = {"type": type}
         if id is not None:
             message["id"] = str(id)
+        if ids is not None:
+            message["ids"] = [str(i) for i in ids]
         await self.ws_manager.broadcast(message=message)
         
     
@@ -86,69 +295,498 @@ class TaskStories(BaseStory):
         
         
 
+    def _load_fields(self, fields: list[str], *required: str | None) -> tuple[list[str], list[LoaderOption]]:
+        """Колонки для load_only: запрошенные поля плюс нужные для запроса (сортировка)"""
+        unknown = [field for field in fields if field not in GitHubFieldsOut.model_fields]
+        if unknown:
+            raise FieldException(
+                f"Поля {', '.join(unknown)} не найдены"
+            )
+        
+        columns = {"id", *fields, *(field for field in required if field and hasattr(GitHubEvent, field))}
+        return fields, [load_only(*(getattr(GitHubEvent, column) for column in columns))]
+    
+    def _to_out(self, obj: GitHubEvent, fields: list[str]) -> GitHubFieldsOut:
+        """Только загруженные поля: остальные не попадут в ответ (exclude_unset)"""
+        return GitHubFieldsOut.model_validate({
+            "id": obj.id,
+            **{field: getattr(obj, field) for field in fields}
+        })
+    
+    def _cache_set(self, key: tuple[Any, ...], value: BaseModel, tags: tuple[str, ...], generation: int) -> None:
+        self.cache.set(key, value, size=len(value.model_dump_json()), tags=tags, generation=generation)
+    
+    async def _invalidate_cache(self, ids: list[UUID]) -> None:
+        """Сбрасывает кэш чтения событий после commit: здесь и на других репликах через NATS.
+        
+        Чтение, начатое до инвалидации, свой результат в кэш уже не положит (generation).
+        Окно устаревания остаётся: другие реплики видят запись до прихода сообщения NATS,
+        а чтение с реплики БД, отстающей от основной, может закэшировать старые данные до TTL.
+        """
+        tags = ["list", *(f"event:{id}" for id in ids)]
+        
+        async def invalidate():
+            self.cache.invalidate(*tags)
+            await self._publish_nats_message(
+                type="cache_invalidate",
+                data={"origin": self.cache.instance_id, "tags": tags}
+            )
+        
+        await StoryContext.after_commit(invalidate)
+    
+    async def publish_count_invalidation(self, table: str) -> None:
+        """Рассылает другим репликам сброс кэша количества записей таблицы"""
+        await self._publish_nats_message(
+            type="count_invalidate",
+            data={"origin": self.cache.instance_id, "table": table}
+        )
+    
+    async def handle_nats_message(self, msg: Any) -> None:
+        """Инвалидация кэшей по сообщениям других реплик, остальные сообщения игнорируются"""
+        try:
+            message = json.loads(msg.data)
+        except ValueError:
+            return
+        if message.get("origin") == self.cache.instance_id:
+            return
+        if message.get("type") == "cache_invalidate":
+            self.cache.invalidate(*message.get("tags", []))
+        elif message.get("type") == "count_invalidate":
+            invalidate_table_counts(message.get("table", ""))
+    
+    async def get_version(self) -> int:
+        """Версия содержимого событий для ETag списков"""
+        return await self.repo.get_version()
+    
+    async def get_modified_at(self, id: UUID) -> datetime:
+        return await self.repo.get_modified_at(id=id)
+    
+    def cache_stats(self) -> CacheStatsOut:
+        return CacheStatsOut.model_validate(self.cache.stats())
+    
     async def get_by_id(
         self, 
-        id: UUID
-    ) -> GitHubOut:
-        res = await self.repo.get(id=id)
-        obj_out = GitHubOut.model_validate(res)
+        id: UUID,
+        fields: list[str] | None = None,
+        modified_at: datetime | None = None
+    ) -> GitHubFieldsOut:
+        """modified_at - валидатор ответа, прочитанный до данных.
+        
+        Кэш используется только с ним: запись ключуется валидатором, поэтому
+        тело из кэша никогда не старше ETag, который с ним отдаётся.
+        """
+        fields = fields or list(GitHubFieldsOut.model_fields)
+        key = ("event", id, tuple(fields), modified_at)
+        obj_out = self.cache.get(key) if modified_at is not None else None
+        if obj_out is None:
+            generation = self.cache.generation
+            fields, options = self._load_fields(fields)
+            res = await self.repo.get(id=id, options=options)
+            obj_out = self._to_out(res, fields)
+            if modified_at is not None:
+                self._cache_set(key, obj_out, tags=(f"event:{id}",), generation=generation)
         
         await self._send_ws_message(type="get_by_id", id=obj_out.id)
         
         return obj_out
     
+    def _list_filters(self, filters: GitHubFilter | None) -> dict[str, Any]:
+        if filters is None:
+            return {}
+        
+        data = filters.model_dump(exclude_none=True)
+        if "created_from" in data:
+            data["created_at__gte"] = data.pop("created_from")
+        if "created_to" in data:
+            data["created_at__lt"] = data.pop("created_to")
+        if "raw_contains" in data:
+            try:
+                data["raw_data__contains"] = json.loads(data.pop("raw_contains"))
+            except json.JSONDecodeError:
+                raise FieldException("raw_contains должен быть JSON")
+        if "raw_path" in data:
+            data["raw_data__path"] = data.pop("raw_path")
+        return data
+    
     async def get_all(
         self,
         search: str | None = None,
         sort_by: str | None = None,
         desc: int = 0,
         page: int = 1,
-        limit: int = -1
-    ) -> ListDTO[GitHubOut]:
+        limit: int = settings.PAGE_SIZE_DEFAULT,
+        cursor: str | None = None,
+        count: CountStrategy = CountStrategy.EXACT,
+        filters: GitHubFilter | None = None,
+        fields: list[str] | None = None,
+        version: int | None = None
+    ) -> ListDTO[GitHubFieldsOut]:
+        """version - версия событий (ETag), прочитанная до данных, ключ записи кэша"""
+        fields = fields or LIST_FIELDS
+        # Кэшируется только первая страница: её запрашивают чаще всего
+        key = None
+        if page == 1 and cursor is None and version is not None:
+            key = (
+                "list", search, sort_by, desc, limit, count.value,
+                filters.model_dump_json(exclude_none=True) if filters else None, tuple(fields), version
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                await self._send_ws_message(type="get_all")
+                return cached
+        
+        if filters is not None and filters.raw_path is not None:
+            await self.repo.check_jsonpath(filters.raw_path)
+        
+        generation = self.cache.generation
+        fields, options = self._load_fields(fields, sort_by, "created_at")
         res = await self.repo.all_list(
             search=search,
-            search_by=["name"],
+            search_by=["title", "description", "author"],
             sort_by=sort_by,
             desc=desc,
             page=page,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            count_strategy=count,
+            options=options,
+            **self._list_filters(filters)
         )
         await self._send_ws_message(type="get_all")
-        return ListDTO[GitHubOut].model_validate(res)
+        objs_out = ListDTO[GitHubFieldsOut].model_validate({
+            **res.model_dump(exclude={"content"}),
+            "content": [self._to_out(obj, fields) for obj in res.content]
+        })
+        if key is not None:
+            self._cache_set(key, objs_out, tags=("list",), generation=generation)
+        return objs_out
+    
+    async def search(
+        self,
+        query: str,
+        limit: int = settings.PAGE_SIZE_DEFAULT
+    ) -> list[GitHubSearchOut]:
+        res = await self.repo.search(query=query, limit=limit)
+        # Одна валидация на строку: атрибуты события вместе с rank и snippet
+        return [
+            GitHubSearchOut.model_validate({
+                **{field: getattr(obj, field) for field in GitHubOut.model_fields},
+                "rank": rank,
+                "snippet": snippet
+            })
+            for obj, rank, snippet in res
+        ]
+    
+    async def stats(
+        self,
+        bucket: StatsBucket = StatsBucket.DAY,
+        group_by: list[str] | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        repository: str | None = None,
+        event_type: EventType | None = None,
+        author: str | None = None
+    ) -> list[GitHubStatsOut]:
+        """Количество событий по интервалам из github_event_stats, без чтения самих событий"""
+        group_by = group_by or []
+        unknown = [field for field in group_by if field not in STATS_FIELDS]
+        if unknown:
+            raise FieldException(
+                f"Группировка по {', '.join(unknown)} не поддерживается"
+            )
+        
+        filters = {
+            key: value
+            for key, value in dict(repository=repository, event_type=event_type, author=author).items()
+            if value is not None
+        }
+        rows = await self.stats_repo.get_stats(
+            bucket=bucket.value,
+            group_by=group_by,
+            date_from=date_from,
+            date_to=date_to,
+            **filters
+        )
+        return [GitHubStatsOut.model_validate(row) for row in rows]
     
     async def create(
         self, 
         **data: Any
     ) -> GitHubOut:
-        obj = GitHubEvent(
-            **data
-        )
-        
-        await self.repo.save(objs=obj)
+        # Дубликат (repository, event_id) пропускается триггером github_event_keys
+        objs = await self.repo.bulk_create(rows=[data])
+        if not objs:
+            raise EntityAlreadyExistsException(
+                f"Событие {data['event_id']} в {data['repository']} уже существует"
+            )
+        obj = objs[0]
+        await self._update_stats(added=[self._stats_key(obj)])
+        await self._invalidate_cache([obj.id])
         
         obj_out = GitHubOut.model_validate(obj)
         
-        await self._send_ws_message(type="create", id=obj_out.id)
-        await self._publish_nats_message(type="create", data=obj_out.model_dump(mode="json"))
+        await self._notify(type="create", id=obj_out.id, data=obj_out.model_dump(mode="json"))
         
         return obj_out
         
+    async def create_many(
+        self,
+        items: list[dict[str, Any]]
+    ) -> list[GitHubOut]:
+        """Создаёт пачку событий одним запросом, уведомления уходят один раз на пачку"""
+        objs = await self.repo.bulk_create(rows=items)
+        if not objs:
+            return []
+        await self._update_stats(added=[self._stats_key(obj) for obj in objs])
+        
+        objs_out = [GitHubOut.model_validate(obj) for obj in objs]
+        await self._notify_many(type="create_many", ids=[obj.id for obj in objs_out])
+        
+        return objs_out
+    
+    def _stats_key(self, obj: GitHubEvent) -> StatsKey:
+        return (obj.created_at.astimezone(timezone.utc).date(), obj.repository, obj.event_type, obj.author)
+    
+    async def _update_stats(
+        self,
+        added: list[StatsKey] | None = None,
+        removed: list[StatsKey] | None = None
+    ) -> None:
+        """Изменяет счётчики github_event_stats в текущей транзакции одним запросом"""
+        deltas: dict[StatsKey, int] = {}
+        for key in added or []:
+            deltas[key] = deltas.get(key, 0) + 1
+        for key in removed or []:
+            deltas[key] = deltas.get(key, 0) - 1
+        await self.stats_repo.apply(deltas)
+    
+    async def _stats_keys(self, ids: list[UUID]) -> list[StatsKey]:
+        """Текущие ключи статистики событий, нужны до изменения полей группировки"""
+        if not ids:
+            return []
+        objs = await self.repo.all(
+            options=[load_only(*(getattr(GitHubEvent, field) for field in ("created_at", *STATS_FIELDS)))],
+            id__in=ids
+        )
+        return [self._stats_key(obj) for obj in objs]
+    
+    async def _notify(self, type: str, id: UUID, data: dict[str, Any]) -> None:
+        """WS- и NATS-сообщение об одном событии после commit"""
+        async def notify():
+            await self._send_ws_message(type=type, id=id)
+            await self._publish_nats_message(type=type, data=data)
+        
+        await StoryContext.after_commit(notify)
+    
+    async def _notify_many(self, type: str, ids: list[UUID]) -> None:
+        """Уведомления о пачке после commit: одно WS-сообщение, в NATS - только id частями.
+        
+        Полные строки (с raw_data) в сообщение не кладутся: пачка легко превышает
+        max_payload сервера NATS, а ошибка публикации не должна откатывать запись.
+        """
+        await self._invalidate_cache(ids)
+        
+        async def notify():
+            await self._send_ws_message(type=type, ids=ids)
+            chunk_size = settings.NATS_NOTIFY_CHUNK_SIZE
+            for start in range(0, len(ids), chunk_size):
+                await self._publish_nats_message(
+                    type=type,
+                    data={"ids": [str(id) for id in ids[start:start + chunk_size]]}
+                )
+        
+        await StoryContext.after_commit(notify)
+    
+    def _null_fields(self, data: dict[str, Any], not_null: frozenset[str]) -> list[str]:
+        """Поля из not_null, явно переданные как null"""
+        return sorted(field for field in data.keys() & not_null if data[field] is None)
+    
+    def _parse_bulk(
+        self,
+        body: bytes,
+        ndjson: bool,
+        model: type[BulkModel],
+        not_null: frozenset[str] = frozenset()
+    ) -> tuple[dict[int, BulkModel], list[BulkItemResult]]:
+        """Разбор пачки из JSON-массива или NDJSON.
+        
+        Возвращает валидные элементы по индексу и ошибки невалидных.
+        not_null - поля, которые нельзя явно передать как null.
+        """
+        items: list[Any] = []
+        errors: list[BulkItemResult] = []
+        if ndjson:
+            lines = [line for line in body.splitlines() if line.strip()]
+            for index, line in enumerate(lines):
+                try:
+                    items.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    items.append(None)
+                    errors.append(BulkItemResult(index=index, status=BulkItemStatus.INVALID, error=f"Невалидный JSON: {e}"))
+        else:
+            try:
+                items = json.loads(body)
+            except json.JSONDecodeError as e:
+                raise FieldException(f"Невалидный JSON: {e}")
+            if not isinstance(items, list):
+                raise FieldException("Ожидался JSON-массив")
+        
+        if len(items) > settings.BULK_MAX_ITEMS:
+            raise FieldException(f"В пачке больше {settings.BULK_MAX_ITEMS} элементов")
+        
+        invalid = {error.index for error in errors}
+        valid: dict[int, BulkModel] = {}
+        for index, item in enumerate(items):
+            if index in invalid:
+                continue
+            try:
+                obj = model.model_validate(item)
+            except ValidationError as e:
+                errors.append(BulkItemResult(
+                    index=index,
+                    status=BulkItemStatus.INVALID,
+                    error="; ".join(
+                        f"{'.'.join(str(loc) for loc in error['loc']) or 'item'}: {error['msg']}"
+                        for error in e.errors()
+                    )
+                ))
+                continue
+            
+            nulls = self._null_fields(obj.model_dump(exclude_unset=True), not_null)
+            if nulls:
+                errors.append(BulkItemResult(
+                    index=index,
+                    status=BulkItemStatus.INVALID,
+                    error="; ".join(f"{field}: значение не может быть null" for field in nulls)
+                ))
+                continue
+            valid[index] = obj
+        return valid, errors
+    
+    def _bulk_result(self, results: list[BulkItemResult]) -> BulkResultDTO:
+        results.sort(key=lambda result: result.index)
+        succeeded = sum(
+            result.status in (BulkItemStatus.CREATED, BulkItemStatus.UPDATED, BulkItemStatus.DELETED)
+            for result in results
+        )
+        return BulkResultDTO(succeeded=succeeded, failed=len(results) - succeeded, items=results)
+    
+    async def create_bulk(
+        self,
+        body: bytes,
+        ndjson: bool = False
+    ) -> BulkResultDTO:
+        """Пакетное создание: один INSERT ... ON CONFLICT DO NOTHING на всю пачку"""
+        valid, results = self._parse_bulk(body, ndjson, GitHubInput)
+        
+        rows = {index: item.model_dump() for index, item in valid.items()}
+        objs = await self.repo.bulk_create(rows=list(rows.values()))
+        created = {(obj.repository, obj.event_id): obj for obj in objs}
+        
+        for index, row in rows.items():
+            # Повтор ключа внутри пачки или уже существующее событие
+            obj = created.pop((row["repository"], row["event_id"]), None)
+            if obj is None:
+                results.append(BulkItemResult(
+                    index=index,
+                    status=BulkItemStatus.CONFLICT,
+                    error=f"Событие {row['event_id']} в {row['repository']} уже существует"
+                ))
+            else:
+                results.append(BulkItemResult(index=index, status=BulkItemStatus.CREATED, id=obj.id))
+        
+        if objs:
+            await self._update_stats(added=[self._stats_key(obj) for obj in objs])
+            await self._notify_many(type="create_many", ids=[obj.id for obj in objs])
+        return self._bulk_result(results)
+    
+    async def update_bulk(
+        self,
+        body: bytes,
+        ndjson: bool = False
+    ) -> BulkResultDTO:
+        """Пакетное изменение: UPDATE по id через executemany"""
+        valid, results = self._parse_bulk(body, ndjson, GitHubBulkEdit, not_null=NOT_NULL_FIELDS)
+        
+        existing = await self.repo.get_existing_values("id", list({item.id for item in valid.values()}))
+        rows: list[dict[str, Any]] = []
+        for index, item in valid.items():
+            if item.id not in existing:
+                results.append(BulkItemResult(
+                    index=index,
+                    status=BulkItemStatus.NOT_FOUND,
+                    error=f"Событие {item.id} не найдено"
+                ))
+                continue
+            
+            row = item.model_dump(exclude_unset=True)
+            if len(row) > 1:
+                rows.append(row)
+            results.append(BulkItemResult(index=index, status=BulkItemStatus.UPDATED, id=item.id))
+        
+        touched = list({row["id"] for row in rows if set(STATS_FIELDS) & row.keys()})
+        removed = await self._stats_keys(touched)
+        
+        await self.repo.bulk_update(rows)
+        
+        if rows:
+            objs = await self.repo.all(id__in=list({row["id"] for row in rows}))
+            await self._update_stats(
+                added=[self._stats_key(obj) for obj in objs if obj.id in touched],
+                removed=removed
+            )
+            await self._notify_many(type="update_many", ids=[obj.id for obj in objs])
+        return self._bulk_result(results)
+    
+    async def delete_bulk(
+        self,
+        body: bytes,
+        ndjson: bool = False
+    ) -> BulkResultDTO:
+        """Пакетное удаление: один DELETE ... RETURNING на всю пачку"""
+        valid, results = self._parse_bulk(body, ndjson, GitHubBulkDelete)
+        
+        objs = await self.repo.bulk_delete(list({item.id for item in valid.values()}))
+        deleted = {obj.id for obj in objs}
+        for index, item in valid.items():
+            if item.id in deleted:
+                results.append(BulkItemResult(index=index, status=BulkItemStatus.DELETED, id=item.id))
+            else:
+                results.append(BulkItemResult(
+                    index=index,
+                    status=BulkItemStatus.NOT_FOUND,
+                    error=f"Событие {item.id} не найдено"
+                ))
+        
+        if deleted:
+            await self._update_stats(removed=[self._stats_key(obj) for obj in objs])
+            await self._notify_many(type="delete_many", ids=list(deleted))
+        return self._bulk_result(results)
+        
     async def update(
         self, 
         id: UUID,
         **data: Any
     ) -> GitHubOut:
-        obj = await self.repo.get(id=id)
-            
-        for key, value in data.items():
-            setattr(obj, key, value)
-                
-        await self.repo.update(obj=obj)
+        """Частичное изменение: только переданные поля, одним UPDATE ... RETURNING"""
+        nulls = self._null_fields(data, NOT_NULL_FIELDS)
+        if nulls:
+            raise FieldException("; ".join(f"{field}: значение не может быть null" for field in nulls))
+        
+        expected = None
+        if "expected_updated_at" in data:
+            expected = {"updated_at": data.pop("expected_updated_at")}
+        
+        removed = await self._stats_keys([id]) if set(STATS_FIELDS) & data.keys() else []
+        
+        obj = await self.repo.update_returning(fields=data, expected=expected, id=id)
+        if removed:
+            await self._update_stats(added=[self._stats_key(obj)], removed=removed)
+        await self._invalidate_cache([id])
         
         obj_out = GitHubOut.model_validate(obj)
         
-        await self._send_ws_message(type="update", id=obj_out.id)
-        await self._publish_nats_message(type="update", data=obj_out.model_dump(mode="json"))
+        await self._notify(type="update", id=obj_out.id, data=obj_out.model_dump(mode="json"))
         
         return obj_out
     
@@ -156,9 +794,11 @@ class TaskStories(BaseStory):
         self, 
         id: UUID
     ) -> None:
-        await self._send_ws_message(type="delete", id=id)
-        await self._publish_nats_message(type="delete", data={"id": str(id)})
-        return await self.repo.delete(id=id)
+        obj = await self.repo.delete_returning(id=id)
+        await self._update_stats(removed=[self._stats_key(obj)])
+        await self._invalidate_cache([id])
+        
+        await self._notify(type="delete", id=id, data={"id": str(id)})
     
     async def ws_connect(self, websocket: WebSocket):
         id = str(uuid.uuid4())
@@ -170,76 +810,164 @@ class TaskStories(BaseStory):
         except WebSocketDisconnect:
             self.ws_manager.disconnect(id)
     
-    async def get_from_repo(self):
-        commits = await self.get_commits()
-        issues = await self.get_issues()
-        releases = await self.get_releases()
+    def _commit_to_event(self, repository: str, commit: dict[str, Any]) -> dict[str, Any]:
+        return dict(
+            event_id=str(commit["sha"]),
+            event_type=EventType.COMMIT,
+            title=commit["commit"]["message"].split("\n")[0],
+            description=commit["commit"]["message"],
+            author=commit["commit"]["author"]["name"],
+            url=commit["html_url"],
+            repository=repository,
+            commit_hash=commit["sha"],
+            raw_data=commit
+        )
+    
+    def _push_commit_to_event(self, repository: str, commit: dict[str, Any]) -> dict[str, Any]:
+        """Коммит из push-вебхука (формат отличается от REST API)"""
+        return dict(
+            event_id=str(commit["id"]),
+            event_type=EventType.COMMIT,
+            title=commit["message"].split("\n")[0],
+            description=commit["message"],
+            author=commit["author"]["name"],
+            url=commit["url"],
+            repository=repository,
+            commit_hash=commit["id"],
+            raw_data=commit
+        )
+    
+    def _issue_to_event(self, repository: str, issue: dict[str, Any]) -> dict[str, Any]:
+        return dict(
+            event_id=str(issue["number"]),
+            event_type=EventType.ISSUE,
+            title=issue["title"],
+            description=issue["body"],
+            author=issue["user"]["login"],
+            url=issue["html_url"],
+            repository=repository,
+            issue_number=int(issue["number"]),
+            raw_data=issue
+        )
+    
+    def _release_to_event(self, repository: str, releas: dict[str, Any]) -> dict[str, Any]:
+        return dict(
+            event_id=releas["tag_name"],
+            event_type=EventType.RELEASE,
+            title=releas["name"],
+            description=releas["body"],
+            author=releas["author"]["login"],
+            url=releas["html_url"],
+            repository=repository,
+            release_version=releas["tag_name"],
+            raw_data=releas
+        )
+    
+    def _event_mark(self, event_type: EventType, item: dict[str, Any]) -> tuple[str, datetime | None]:
+        """Идентификатор и время создания записи GitHub для отметки синхронизации"""
+        if event_type == EventType.COMMIT:
+            event_id, created = str(item["sha"]), item["commit"]["committer"]["date"]
+        elif event_type == EventType.ISSUE:
+            event_id, created = str(item["number"]), item["created_at"]
+        else:
+            event_id, created = item["tag_name"], item.get("published_at") or item.get("created_at")
+        
+        if created is None:
+            return event_id, None
+        return event_id, datetime.fromisoformat(created.replace("Z", "+00:00"))
+    
+    @property
+    def _event_mappers(self) -> dict[EventType, Callable[[str, dict[str, Any]], dict[str, Any]]]:
+        return {
+            EventType.COMMIT: self._commit_to_event,
+            EventType.ISSUE: self._issue_to_event,
+            EventType.RELEASE: self._release_to_event,
+        }
+    
+    async def sync_repo(self, owner: str, name: str) -> int:
+        """Загружает новые события репозитория из GitHub, возвращает количество созданных"""
+        repository = f"{owner}/{name}"
+        created = 0
         
-        for commit in commits:
-            commit_obj = await self.repo.get_or_none(
-                event_id=str(commit["sha"])
+        if not await self.sync_state_repo.try_lock(repository):
+            raise SyncInProgressException(
+                f"Репозиторий {repository} уже синхронизируется"
             )
+        
+        keys = [self._first_page_key(owner, name, endpoint) for endpoint in ("commits", "issues", "releases")]
+        cached = {
+            obj.url: (obj.etag, obj.last_modified)
+            for obj in await self.request_cache_repo.all(repository=repository, url__in=keys)
+        }
+        validators = dict(cached)
+        
+        states = {
+            obj.event_type: obj
+            for obj in await self.sync_state_repo.all(repository=repository)
+        }
+        marks: dict[EventType, tuple[str, datetime | None]] = {}
+        
+        def since(event_type: EventType) -> datetime | None:
+            state = states.get(event_type)
+            return state.last_seen_at if state is not None else None
+        
+        streams = {
+            EventType.COMMIT: self.get_commits(owner, name, validators=validators, since=since(EventType.COMMIT)),
+            EventType.ISSUE: self.get_issues(owner, name, validators=validators, since=since(EventType.ISSUE)),
+            EventType.RELEASE: self.get_releases(owner, name, validators=validators),
+        }
+        streams = {
+            event_type: self._take_new(event_type, stream, states.get(event_type), marks)
+            for event_type, stream in streams.items()
+        }
+        
+        async for event_type, page in self._merge_pages(streams):
+            to_event = self._event_mappers[event_type]
+            rows = [to_event(repository, item) for item in page]
             
-            if commit_obj is None:
-                await self.create(
-                    event_id=str(commit["sha"]),
-                    event_type=EventType.COMMIT,
-                    title=commit["commit"]["message"].split("\n")[0],
-                    description=commit["commit"]["message"],
-                    author=commit["commit"]["author"]["name"],
-                    url=commit["html_url"],
-                    repository=settings.GITHUB_REPO,
-                    commit_hash=commit["sha"],
-                    raw_data=json.dumps(commit)
-                )
-                
-        for issue in issues:
-            issue_obj = await self.repo.get_or_none(
-                event_id=str(issue["number"])
+            existing = await self.repo.get_existing_values(
+                field="event_id",
+                values=[row["event_id"] for row in rows],
+                repository=repository
             )
-            
-            if issue_obj is None:
-                await self.create(
-                    event_id=str(issue["number"]),
-                    event_type=EventType.ISSUE,
-                    title=issue["title"],
-                    description=issue["body"],
-                    author=issue["user"]["login"],
-                    url=issue["html_url"],
-                    repository=settings.GITHUB_REPO,
-                    issue_number=int(issue["number"]),
-                    raw_data=json.dumps(issue)
-                )
+            objs = await self.create_many(
+                [row for row in rows if row["event_id"] not in existing]
+            )
+            created += len(objs)
         
-        for releas in releases:
-            release_obj = await self.repo.get_or_none(
-                event_id=releas["tag_name"]
+        for event_type, (last_seen_id, last_seen_at) in marks.items():
+            await self.sync_state_repo.save_mark(
+                repository=repository,
+                event_type=event_type,
+                last_seen_at=last_seen_at,
+                last_seen_id=last_seen_id
             )
-            
-            if release_obj is None:
-                await self.create(
-                    event_id=releas["tag_name"],
-                    event_type=EventType.RELEASE,
-                    title=releas["name"],
-                    description=releas["body"],
-                    author=releas["author"]["login"],
-                    url=releas["html_url"],
-                    repository=settings.GITHUB_REPO,
-                    release_version=releas["tag_name"],
-                    raw_data=json.dumps(releas)
-                )
-                
-        return {"status": "ok"}
-                    
-    async def periodic_task(self, interval_seconds: int = 60):
-        """Фоновая задача, выполняющаяся раз в interval_seconds секунд"""
-        while True:
-            try:
-                _log.info("Выполняется фоновая задача")
-                async with self.begin() as stories:
-                    await stories.get_from_repo()
+        
+        await self.request_cache_repo.save_validators(
+            repository=repository,
+            validators={
+                url: value for url, value in validators.items()
+                if cached.get(url) != value
+            }
+        )
+        await self.request_cache_repo.delete_except(repository=repository, urls=keys)
                 
-            except Exception as e:
-                print(f"Ошибка в фоновой задаче: {e}")
-            
-            await asyncio.sleep(interval_seconds)
\ No newline at end of file
+        return created
+    
+    async def ingest_webhook(self, event: str, payload: dict[str, Any]) -> int:
+        """Создаёт события из доставки вебхука GitHub, возвращает количество созданных"""
+        if "repository" not in payload:
+            return 0
+        repository = payload["repository"]["full_name"]
+        
+        if event == "push":
+            rows = [self._push_commit_to_event(repository, commit) for commit in payload.get("commits", [])]
+        elif event == "issues":
+            rows = [self._issue_to_event(repository, payload["issue"])]
+        elif event == "release":
+            rows = [self._release_to_event(repository, payload["release"])]
+        else:
+            return 0
+        
+        objs = await self.create_many(rows)
+        return len(objs)
@@ -0,0 +1,118 @@
+import asyncio
+from datetime import date, datetime, timezone
+import logging
+import os
+
+from domain.interfaces.event_partition import IEventPartitionRepo
+from infrastructure.compression import ZstdFileWriter
+from .base import BaseStory
+from config import settings
+
+_log = logging.getLogger(__name__)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class PartitionStories(BaseStory):
+    """Обслуживание месячных партиций github_events: создание заранее и retention"""
+
+    repo: IEventPartitionRepo
+
+    def _current_month(self) -> date:
+        return datetime.now(timezone.utc).date().replace(day=1)
+
+    async def ensure_partitions(self) -> list[date]:
+        """Создаёт партиции на текущий месяц и EVENTS_PARTITIONS_AHEAD вперёд"""
+        if not await self.repo.try_lock():
+            return []
+        
+        created = []
+        current = self._current_month()
+        for offset in range(settings.EVENTS_PARTITIONS_AHEAD + 1):
+            month = _add_months(current, offset)
+            if await self.repo.create_partition(month):
+                created.append(month)
+        return created
+
+    async def split_default(self) -> list[date]:
+        """Разносит строки секции DEFAULT по месячным секциям, чтобы на них действовал retention"""
+        if not await self.repo.try_lock():
+            return []
+        return await self.repo.split_default()
+
+    async def detach_expired(self) -> list[date]:
+        """Отключает партиции старше EVENTS_RETENTION_MONTHS (0 - хранить всё)"""
+        if settings.EVENTS_RETENTION_MONTHS <= 0 or not await self.repo.try_lock():
+            return []
+        
+        cutoff = _add_months(self._current_month(), -settings.EVENTS_RETENTION_MONTHS)
+        expired = [month for month in await self.repo.get_partitions() if month < cutoff]
+        for month in expired:
+            await self.repo.detach_partition(month)
+        return expired
+
+    async def get_detached(self) -> list[date]:
+        return await self.repo.get_detached()
+
+    async def export_partition(self, month: date) -> str | None:
+        """Выгружает отключённую партицию в EVENTS_EXPORT_DIR (NDJSON + zstd) и удаляет её"""
+        if not await self.repo.try_lock():
+            return None
+        
+        os.makedirs(settings.EVENTS_EXPORT_DIR, exist_ok=True)
+        path = os.path.join(settings.EVENTS_EXPORT_DIR, f"github_events_{month:%Y_%m}.ndjson.zst")
+        # Месяц мог выгружаться раньше (строки из DEFAULT): прежний файл не перезаписываем
+        suffix = 1
+        while os.path.exists(path):
+            path = os.path.join(settings.EVENTS_EXPORT_DIR, f"github_events_{month:%Y_%m}_{suffix}.ndjson.zst")
+            suffix += 1
+        tmp_path = f"{path}.tmp"
+        
+        writer = await asyncio.to_thread(ZstdFileWriter, tmp_path, settings.EVENTS_EXPORT_ZSTD_LEVEL)
+        try:
+            async for lines in self.repo.export_partition(month, settings.EVENTS_EXPORT_BATCH):
+                await asyncio.to_thread(writer.write, "".join(f"{line}\n" for line in lines).encode())
+        finally:
+            await asyncio.to_thread(writer.close)
+        
+        # Файл на месте до удаления партиции: при сбое выгрузка повторится
+        os.replace(tmp_path, path)
+        await self.repo.drop_partition(month)
+        return path
+
+    async def maintain(self) -> None:
+        async with self.begin() as stories:
+            created = await stories.ensure_partitions()
+        if created:
+            _log.info(f"Созданы партиции github_events: {', '.join(f'{month:%Y-%m}' for month in created)}")
+        
+        async with self.begin() as stories:
+            moved = await stories.split_default()
+        if moved:
+            _log.info(f"Строки секции DEFAULT перенесены в партиции: {', '.join(f'{month:%Y-%m}' for month in moved)}")
+        
+        async with self.begin() as stories:
+            detached = await stories.detach_expired()
+        if detached:
+            _log.info(f"Отключены партиции github_events: {', '.join(f'{month:%Y-%m}' for month in detached)}")
+        
+        async with self.begin() as stories:
+            months = await stories.get_detached()
+        for month in months:
+            async with self.begin() as stories:
+                path = await stories.export_partition(month)
+            if path:
+                _log.info(f"Партиция github_events {month:%Y-%m} выгружена в {path}")
+
+    async def periodic_task(self):
+        """Фоновое обслуживание партиций, первый запуск сразу при старте"""
+        while True:
+            try:
+                await self.maintain()
+            except Exception as e:
+                _log.exception(f"Ошибка обслуживания партиций: {e}")
+            
+            await asyncio.sleep(settings.EVENTS_PARTITION_INTERVAL)
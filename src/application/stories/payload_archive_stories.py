@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+import logging
+from uuid import UUID
+
+from sqlalchemy.orm import load_only
+
+from domain.interfaces.github_event import IGitHubEventRepo
+from domain.interfaces.payload_archive import IPayloadArchiveRepo, IPayloadDictionaryRepo
+from infrastructure.compression import PayloadCompressor
+from infrastructure.database.models import GitHubEvent, PayloadDictionary
+from .base import BaseStory
+from ..schemes.task import GitHubRawOut
+from config import settings
+
+_log = logging.getLogger(__name__)
+
+
+class PayloadArchiveStories(BaseStory):
+    """Архивация raw_data старых событий в сжатом виде и чтение по запросу.
+    
+    Архивированные payload'ы не участвуют в JSONB-фильтрах raw_contains/raw_path.
+    """
+
+    repo: IPayloadArchiveRepo
+    dictionary_repo: IPayloadDictionaryRepo
+    event_repo: IGitHubEventRepo
+    compressor: PayloadCompressor
+
+    def _encode(self, raw_data: dict) -> bytes:
+        return json.dumps(raw_data, separators=(",", ":"), ensure_ascii=False).encode()
+
+    async def _load_dictionary(self, id: UUID) -> None:
+        if self.compressor.has_dictionary(id):
+            return
+        dictionary = await self.dictionary_repo.get(id=id)
+        self.compressor.add_dictionary(dictionary.id, dictionary.data)
+
+    async def _get_dictionary(self, samples: list[bytes]) -> UUID | None:
+        """Общий словарь: последний сохранённый или обученный на текущей пачке"""
+        if not settings.RAW_DATA_ZSTD_DICT:
+            return None
+        
+        dictionary = await self.dictionary_repo.get_latest()
+        if dictionary is None:
+            if len(samples) < settings.RAW_DATA_DICT_MIN_SAMPLES:
+                return None
+            dictionary = PayloadDictionary(
+                data=await asyncio.to_thread(
+                    self.compressor.train_dictionary, samples, settings.RAW_DATA_DICT_SIZE
+                )
+            )
+            await self.dictionary_repo.save(objs=dictionary)
+        
+        await self._load_dictionary(dictionary.id)
+        return dictionary.id
+
+    async def archive_batch(self) -> int:
+        """Сжимает raw_data одной пачки старых событий, возвращает число фактически архивированных"""
+        before = datetime.now(timezone.utc) - timedelta(days=settings.RAW_DATA_ARCHIVE_AFTER_DAYS)
+        candidates = await self.repo.get_candidates(before=before, limit=settings.RAW_DATA_ARCHIVE_BATCH)
+        if not candidates:
+            return 0
+        
+        # Кодирование, обучение словаря и сжатие - в потоке, чтобы не блокировать event loop
+        encoded = await asyncio.to_thread(lambda: [self._encode(raw_data) for _, raw_data in candidates])
+        dictionary_id = await self._get_dictionary(encoded)
+        compressed = await asyncio.to_thread(self.compressor.compress_many, encoded, dictionary_id)
+        
+        return await self.repo.archive([
+            {
+                "event_id": id,
+                "dictionary_id": dictionary_id,
+                "data": data,
+                "raw_size": len(raw),
+            }
+            for (id, _), raw, data in zip(candidates, encoded, compressed)
+        ])
+
+    async def get_modified_at(self, id: UUID) -> datetime:
+        return await self.event_repo.get_modified_at(id=id)
+
+    async def get_raw(
+        self,
+        id: UUID
+    ) -> GitHubRawOut:
+        """raw_data события: из таблицы событий или распакованный из архива"""
+        event = await self.event_repo.get(id=id, options=[load_only(GitHubEvent.id, GitHubEvent.raw_data)])
+        if event.raw_data is not None:
+            return GitHubRawOut(id=event.id, raw_data=event.raw_data)
+        
+        payload = await self.repo.get(event_id=id)
+        if payload.dictionary_id is not None:
+            await self._load_dictionary(payload.dictionary_id)
+        data = self.compressor.decompress(payload.data, payload.dictionary_id)
+        
+        return GitHubRawOut(id=event.id, raw_data=json.loads(data))
+
+    async def periodic_task(self):
+        """Фоновая архивация: пачки подряд, пока есть что архивировать"""
+        while True:
+            try:
+                while True:
+                    async with self.begin() as stories:
+                        archived = await stories.archive_batch()
+                    if archived:
+                        _log.info(f"Архивировано payload'ов: {archived}")
+                    if archived < settings.RAW_DATA_ARCHIVE_BATCH:
+                        break
+            except Exception as e:
+                _log.exception(f"Ошибка архивации payload'ов: {e}")
+            
+            await asyncio.sleep(settings.RAW_DATA_ARCHIVE_INTERVAL)
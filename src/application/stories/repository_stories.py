@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+import random
+from typing import Any
+from uuid import UUID
+
+from domain.interfaces.monitored_repository import IMonitoredRepositoryRepo
+from infrastructure.database.models import MonitoredRepository
+from infrastructure.exceptions import EntityAlreadyExistsException
+from .base import BaseStory
+from ..schemes.repository import RepositoryOut
+from ..schemes.base import ListDTO
+from config import settings
+
+
+class RepositoryStories(BaseStory):
+
+    repo: IMonitoredRepositoryRepo
+
+    async def get_by_id(
+        self, 
+        id: UUID
+    ) -> RepositoryOut:
+        res = await self.repo.get(id=id)
+        return RepositoryOut.model_validate(res)
+    
+    async def get_all(
+        self,
+        search: str | None = None,
+        sort_by: str | None = None,
+        desc: int = 0,
+        page: int = 1,
+        limit: int = -1,
+        **filters: Any
+    ) -> ListDTO[RepositoryOut]:
+        res = await self.repo.all_list(
+            search=search,
+            search_by=["owner", "name"],
+            sort_by=sort_by,
+            desc=desc,
+            page=page,
+            limit=limit,
+            **filters
+        )
+        return ListDTO[RepositoryOut].model_validate(res)
+    
+    async def is_monitored(self, full_name: str) -> bool:
+        owner, _, name = full_name.partition("/")
+        return await self.repo.is_monitored(owner=owner, name=name)
+    
+    async def get_due(self, limit: int) -> list[RepositoryOut]:
+        res = await self.repo.get_due(now=datetime.now(timezone.utc), limit=limit)
+        return [RepositoryOut.model_validate(obj) for obj in res]
+    
+    async def create(
+        self, 
+        **data: Any
+    ) -> RepositoryOut:
+        if await self.repo.exist(owner=data["owner"], name=data["name"]):
+            raise EntityAlreadyExistsException(
+                f"Репозиторий {data['owner']}/{data['name']} уже отслеживается"
+            )
+        
+        obj = MonitoredRepository(
+            **data,
+            sync_interval=settings.SYNC_MIN_INTERVAL,
+            next_sync_at=datetime.now(timezone.utc)
+        )
+        await self.repo.save(objs=obj)
+        
+        return RepositoryOut.model_validate(obj)
+        
+    async def update(
+        self, 
+        id: UUID,
+        **data: Any
+    ) -> RepositoryOut:
+        obj = await self.repo.update_returning(fields=data, id=id)
+        
+        return RepositoryOut.model_validate(obj)
+    
+    async def delete(
+        self, 
+        id: UUID
+    ) -> None:
+        await self.repo.delete_returning(id=id)
+    
+    async def postpone(self, id: UUID) -> None:
+        """Переносит next_sync_at на текущий интервал без записи статистики"""
+        obj = await self.repo.get(id=id)
+        obj.next_sync_at = datetime.now(timezone.utc) + timedelta(seconds=obj.sync_interval * random.uniform(0.9, 1.1))
+        await self.repo.update(obj=obj)
+    
+    async def record_sync(
+        self,
+        id: UUID,
+        created: int,
+        duration: float,
+        error: str | None = None
+    ) -> RepositoryOut:
+        """Сохраняет статистику синхронизации и планирует следующий запуск.
+        
+        Если появились новые события - следующий запуск через SYNC_MIN_INTERVAL,
+        иначе и при ошибках интервал удваивается до SYNC_MAX_INTERVAL (с jitter).
+        """
+        obj = await self.repo.get(id=id)
+        now = datetime.now(timezone.utc)
+        
+        obj.last_sync_at = now
+        obj.last_duration = duration
+        obj.sync_count += 1
+        
+        if error is None:
+            obj.last_success_at = now
+            obj.last_created = created
+            obj.last_error = None
+        else:
+            obj.error_count += 1
+            obj.last_error = error
+        
+        if error is None and created:
+            obj.sync_interval = settings.SYNC_MIN_INTERVAL
+        else:
+            obj.sync_interval = min(obj.sync_interval * 2, settings.SYNC_MAX_INTERVAL)
+        obj.next_sync_at = now + timedelta(seconds=obj.sync_interval * random.uniform(0.9, 1.1))
+        
+        await self.repo.update(obj=obj)
+        
+        return RepositoryOut.model_validate(obj)
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import time
+from uuid import UUID
+
+from config import settings
+from .exceptions import SyncInProgressException
+from .stories.github_event_stories import TaskStories
+from .stories.repository_stories import RepositoryStories
+from .schemes.repository import RepositoryOut
+
+_log = logging.getLogger(__name__)
+
+
+class SyncWorkerPool:
+    """Пул воркеров, синхронизирующих отслеживаемые репозитории.
+    
+    Планировщик раз в SYNC_POLL_INTERVAL ставит в очередь репозитории, у которых
+    наступил next_sync_at (самые просроченные первыми, каждый не более одного раза),
+    а SYNC_WORKERS воркеров разбирают очередь. Каждый репозиторий синхронизируется
+    в своей транзакции с таймаутом SYNC_REPO_TIMEOUT, поэтому ошибка или медленный
+    ответ одного репозитория не задерживают остальные.
+    """
+
+    def __init__(
+        self,
+        github_stories: TaskStories,
+        repository_stories: RepositoryStories,
+        size: int
+    ):
+        self.github_stories = github_stories
+        self.repository_stories = repository_stories
+        self.size = size
+        self.queue: asyncio.Queue[UUID] = asyncio.Queue()
+        self.queued: set[UUID] = set()
+        self.tasks: list[asyncio.Task[None]] = []
+        self.in_flight: dict[UUID, asyncio.Task[int]] = {}
+
+    async def start(self):
+        """Запуск планировщика и воркеров"""
+        self.tasks = [asyncio.create_task(self._scheduler())]
+        self.tasks += [asyncio.create_task(self._worker()) for _ in range(self.size)]
+        _log.info(f"Запущен пул синхронизации на {self.size} воркеров")
+
+    async def stop(self):
+        """Остановка планировщика и воркеров"""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        _log.info("Пул синхронизации остановлен")
+
+    def enqueue(self, id: UUID) -> None:
+        if id in self.queued:
+            return
+        self.queued.add(id)
+        self.queue.put_nowait(id)
+
+    async def _scheduler(self):
+        while True:
+            try:
+                async with self.repository_stories.begin() as stories:
+                    due = await stories.get_due(limit=settings.SYNC_SCHEDULE_BATCH)
+                for repository in due:
+                    self.enqueue(repository.id)
+            except Exception as e:
+                _log.exception(f"Ошибка планировщика синхронизации: {e}")
+            
+            await asyncio.sleep(settings.SYNC_POLL_INTERVAL)
+
+    async def _worker(self):
+        while True:
+            id = await self.queue.get()
+            try:
+                await self.sync(id)
+            except SyncInProgressException:
+                # Уже записано в _sync, запуск отложен
+                pass
+            except Exception as e:
+                _log.exception(f"Ошибка воркера синхронизации для репозитория {id}: {e}")
+            finally:
+                self.queued.discard(id)
+                self.queue.task_done()
+
+    async def sync(self, id: UUID) -> int:
+        """Синхронизирует один репозиторий или присоединяется к уже идущему запуску"""
+        task = self.in_flight.get(id)
+        if task is None:
+            task = asyncio.create_task(self._sync(id))
+            self.in_flight[id] = task
+            task.add_done_callback(lambda _: self.in_flight.pop(id, None))
+        
+        # shield: отмена одного ожидающего не отменяет общий запуск
+        return await asyncio.shield(task)
+
+    async def _sync(self, id: UUID) -> int:
+        """Синхронизирует один репозиторий и сохраняет его статистику"""
+        async with self.repository_stories.begin() as stories:
+            repository: RepositoryOut = await stories.get_by_id(id=id)
+        
+        created = 0
+        error: Exception | None = None
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(settings.SYNC_REPO_TIMEOUT):
+                async with self.github_stories.begin() as stories:
+                    created = await stories.sync_repo(
+                        owner=repository.owner,
+                        name=repository.name
+                    )
+        except SyncInProgressException:
+            # Синхронизирует другая реплика, она же обновит статистику. Запуск откладываем,
+            # иначе планировщик будет ставить репозиторий в очередь каждые SYNC_POLL_INTERVAL
+            _log.info(f"{repository.full_name} синхронизируется другой репликой")
+            async with self.repository_stories.begin() as stories:
+                await stories.postpone(id=id)
+            raise
+        except Exception as e:
+            _log.exception(f"Ошибка синхронизации {repository.full_name}: {e}")
+            error = e
+        duration = time.monotonic() - started
+        
+        async with self.repository_stories.begin() as stories:
+            await stories.record_sync(
+                id=id,
+                created=created,
+                duration=duration,
+                error=None if error is None else repr(error)
+            )
+        
+        if error is not None:
+            raise error
+        return created
+
+    async def sync_all(self) -> dict[str, str]:
+        """Синхронизирует все активные репозитории, не более size одновременно"""
+        async with self.repository_stories.begin() as stories:
+            repositories = (await stories.get_all(is_active=True)).content
+        
+        semaphore = asyncio.Semaphore(self.size)
+        
+        async def run(repository: RepositoryOut) -> int:
+            async with semaphore:
+                return await self.sync(repository.id)
+        
+        results = await asyncio.gather(
+            *(run(repository) for repository in repositories),
+            return_exceptions=True
+        )
+        return {
+            repository.full_name: repr(result) if isinstance(result, BaseException) else "ok"
+            for repository, result in zip(repositories, results)
+        }
@@ -0,0 +1,85 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+from typing import Any
+
+from config import settings
+from .exceptions import InvalidPayloadException, InvalidSignatureException, ServiceOverloadedException
+from .stories.github_event_stories import TaskStories
+from .stories.repository_stories import RepositoryStories
+
+_log = logging.getLogger(__name__)
+
+
+class WebhookProcessor:
+    """Принимает доставки вебхуков GitHub и обрабатывает их в фоне.
+    
+    Endpoint только проверяет подпись и кладёт доставку в очередь, поэтому
+    GitHub получает ответ сразу, а запись в БД идёт в отдельной задаче.
+    """
+
+    def __init__(self, github_stories: TaskStories, repository_stories: RepositoryStories, queue_size: int):
+        self.github_stories = github_stories
+        self.repository_stories = repository_stories
+        self.queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue(maxsize=queue_size)
+        self.task: asyncio.Task[None] | None = None
+
+    async def start(self):
+        """Запуск обработчика очереди"""
+        self.task = asyncio.create_task(self._consume())
+
+    async def stop(self):
+        """Остановка обработчика очереди"""
+        if self.task is None:
+            return
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        self.task = None
+
+    def verify_signature(self, body: bytes, signature: str | None) -> None:
+        """Проверка заголовка X-Hub-Signature-256"""
+        if not settings.GITHUB_WEBHOOK_SECRET:
+            raise InvalidSignatureException("Секрет вебхука не настроен")
+        if signature is None or not signature.startswith("sha256="):
+            raise InvalidSignatureException("Нет подписи вебхука")
+
+        expected = hmac.new(
+            settings.GITHUB_WEBHOOK_SECRET.encode(),
+            body,
+            hashlib.sha256
+        ).hexdigest()
+        if not hmac.compare_digest(expected, signature.removeprefix("sha256=")):
+            raise InvalidSignatureException("Неверная подпись вебхука")
+
+    def submit(self, event: str, body: bytes, signature: str | None) -> None:
+        """Проверяет доставку и ставит её в очередь"""
+        self.verify_signature(body, signature)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise InvalidPayloadException("Тело вебхука должно быть JSON (Content type: application/json)")
+        if not isinstance(payload, dict):
+            raise InvalidPayloadException("Тело вебхука должно быть JSON-объектом")
+        
+        try:
+            self.queue.put_nowait((event, payload))
+        except asyncio.QueueFull:
+            raise ServiceOverloadedException("Очередь вебхуков переполнена")
+
+    async def _consume(self):
+        while True:
+            event, payload = await self.queue.get()
+            try:
+                repository = (payload.get("repository") or {}).get("full_name")
+                async with self.github_stories.begin() as stories:
+                    # Доставки по репозиториям, которые не отслеживаются, пропускаются
+                    if isinstance(repository, str) and await self.repository_stories.is_monitored(repository):
+                        await stories.ingest_webhook(event=event, payload=payload)
+                    else:
+                        _log.info(f"Вебхук {event} для неотслеживаемого репозитория {repository} пропущен")
+            except Exception as e:
+                _log.exception(f"Ошибка обработки вебхука {event}: {e}")
+            finally:
+                self.queue.task_done()
@@ -11,18 +11,71 @@ class Settings(BaseSettings):
     VIEW_DOCS: bool = True
     ROOT_PATH: str = ""
     
+    # Репозиторий, добавляемый в отслеживаемые при первой миграции
     GITHUB_OWNER: str = "ErJokeCode"
     GITHUB_REPO: str = "monitoring_github"
     GITHUB_TOKEN: str
+    GITHUB_API_URL: str = "https://api.github.com"
+    GITHUB_POOL_LIMIT: int = 100
+    GITHUB_POOL_LIMIT_PER_HOST: int = 10
+    GITHUB_KEEPALIVE_TIMEOUT: float = 30
+    GITHUB_DNS_CACHE_TTL: int = 300
+    GITHUB_CONNECT_TIMEOUT: float = 10
+    GITHUB_READ_TIMEOUT: float = 30
+    GITHUB_TOTAL_TIMEOUT: float = 60
+    GITHUB_MAX_CONCURRENCY: int = 8
+    GITHUB_PER_PAGE: int = 100
+    GITHUB_STREAM_CHUNK_SIZE: int = 65536
+    GITHUB_STREAM_BATCH: int = 20
+    GITHUB_RATE_LIMIT: int = 5000
+    GITHUB_RATE_BURST: int = 10
+    GITHUB_MAX_RETRIES: int = 5
+    GITHUB_BACKOFF_BASE: float = 1
+    GITHUB_BACKOFF_MAX: float = 60
+    GITHUB_WEBHOOK_SECRET: str = ""
+    WEBHOOK_QUEUE_SIZE: int = 10000
+    
+    SYNC_MIN_INTERVAL: float = 60
+    SYNC_MAX_INTERVAL: float = 3600
+    SYNC_WORKERS: int = 8
+    SYNC_POLL_INTERVAL: float = 5
+    SYNC_SCHEDULE_BATCH: int = 100
+    SYNC_REPO_TIMEOUT: float = 600
 
     POSTGRES_HOST: str
     POSTGRES_PORT: int
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
     
     NATS_HOST: str
     NATS_PORT: int
+    NATS_NOTIFY_CHUNK_SIZE: int = 1000
+
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 1000
+    COUNT_CACHE_TTL: float = 60
+    COUNT_CACHE_MAX_ITEMS: int = 1000
+    BULK_MAX_ITEMS: int = 10000
+    EVENTS_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    EVENTS_CACHE_TTL: float = 30
+
+    RAW_DATA_ARCHIVE_AFTER_DAYS: int = 30
+    RAW_DATA_ARCHIVE_BATCH: int = 500
+    RAW_DATA_ARCHIVE_INTERVAL: float = 3600
+    RAW_DATA_ZSTD_LEVEL: int = 10
+    RAW_DATA_ZSTD_DICT: bool = True
+    RAW_DATA_DICT_SIZE: int = 112640
+    RAW_DATA_DICT_MIN_SAMPLES: int = 100
+
+    EVENTS_PARTITIONS_AHEAD: int = 3
+    EVENTS_RETENTION_MONTHS: int = 0
+    EVENTS_PARTITION_INTERVAL: float = 86400
+    EVENTS_EXPORT_DIR: str = "exports"
+    EVENTS_EXPORT_BATCH: int = 1000
+    EVENTS_EXPORT_ZSTD_LEVEL: int = 10
 
     LOG_LEVEL: str = "INFO"
 
@@ -55,6 +108,14 @@ class Settings(BaseSettings):
     def DATABASE_URL_asyncpg(self):
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
     
+    @property
+    def DATABASE_REPLICA_URL_asyncpg(self):
+        """Реплика для чтения, без POSTGRES_REPLICA_HOST - основная БД"""
+        if not self.POSTGRES_REPLICA_HOST:
+            return None
+        port = self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_HOST}:{port}/{self.POSTGRES_DB}"
+    
     @property
     def NATS_URL(self):
         return f"nats://{self.NATS_HOST}:{self.NATS_PORT}"
@@ -2,7 +2,8 @@ from abc import ABC, abstractmethod
 from typing import Any, Generic, List, Type, TypeVar
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import Select
-from application.schemes.base import ListDTO
+from sqlalchemy.orm.interfaces import LoaderOption
+from application.schemes.base import CountStrategy, ListDTO
 
 Aggregate = TypeVar("Aggregate", bound=DeclarativeBase)
 
@@ -14,7 +15,7 @@ class IBaseRepo(ABC, Generic[Aggregate]):
     def __init__(self): ...
 
     @abstractmethod
-    async def all(self, **kwargs: Any) -> List[Aggregate]:
+    async def all(self, options: list[LoaderOption] | None = None, **filters: Any) -> List[Aggregate]:
         raise NotImplementedError
 
     @abstractmethod
@@ -27,16 +28,19 @@ class IBaseRepo(ABC, Generic[Aggregate]):
         page: int = 1,
         limit: int = -1,
         stmt: Select[Any] | None = None,
+        cursor: str | None = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        options: list[LoaderOption] | None = None,
         **filters: Any
     ) -> ListDTO[Aggregate]:
         raise NotImplementedError
 
     @abstractmethod
-    async def get(self, **filters: Any) -> Aggregate:
+    async def get(self, options: list[LoaderOption] | None = None, **filters: Any) -> Aggregate:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_or_none(self, **filters: Any) -> Aggregate | None:
+    async def get_or_none(self, options: list[LoaderOption] | None = None, **filters: Any) -> Aggregate | None:
         raise NotImplementedError
     
     @abstractmethod
@@ -47,6 +51,22 @@ class IBaseRepo(ABC, Generic[Aggregate]):
     async def save(self, objs: list[Aggregate] | Aggregate) -> None:
         raise NotImplementedError
     
+    @abstractmethod
+    async def get_existing_values(self, field: str, values: list[Any], **filters: Any) -> set[Any]:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def bulk_create(self, rows: list[dict[str, Any]], index_elements: list[str] | None = None) -> list[Aggregate]:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def bulk_update(self, rows: list[dict[str, Any]]) -> None:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def bulk_delete(self, ids: list[Any]) -> list[Aggregate]:
+        raise NotImplementedError
+    
     @abstractmethod
     async def update(self, obj: Aggregate) -> None:
         raise NotImplementedError
@@ -55,10 +75,27 @@ class IBaseRepo(ABC, Generic[Aggregate]):
     async def update_fields(self, fields: dict[str, Any], **filters: Any) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_returning(
+        self,
+        fields: dict[str, Any],
+        expected: dict[str, Any] | None = None,
+        **filters: Any
+    ) -> Aggregate:
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, **filters: Any) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def delete_returning(self, expected: dict[str, Any] | None = None, **filters: Any) -> Aggregate:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def check_jsonpath(self, path: str) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def exist(self, **filters: Any) -> bool:
         raise NotImplementedError
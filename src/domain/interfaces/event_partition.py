@@ -0,0 +1,41 @@
+from abc import abstractmethod
+from datetime import date
+from typing import AsyncIterator
+
+from .base import IBaseRepo
+from infrastructure.database.models import GitHubEvent
+
+
+class IEventPartitionRepo(IBaseRepo[GitHubEvent]):
+    
+    @abstractmethod
+    async def try_lock(self) -> bool:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_partitions(self) -> list[date]:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_detached(self) -> list[date]:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def create_partition(self, month: date) -> bool:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def split_default(self) -> list[date]:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def detach_partition(self, month: date) -> None:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def export_partition(self, month: date, batch: int) -> AsyncIterator[list[str]]:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def drop_partition(self, month: date) -> None:
+        raise NotImplementedError
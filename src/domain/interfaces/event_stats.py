@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from datetime import date
+from typing import Any
+
+from .base import IBaseRepo
+from infrastructure.database.models import EventType, GitHubEventStats
+
+
+StatsKey = tuple[date, str, EventType, str]
+
+
+class IEventStatsRepo(IBaseRepo[GitHubEventStats]):
+    
+    @abstractmethod
+    async def apply(self, deltas: dict[StatsKey, int]) -> None:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_stats(
+        self,
+        bucket: str,
+        group_by: list[str],
+        date_from: date | None = None,
+        date_to: date | None = None,
+        **filters: Any
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
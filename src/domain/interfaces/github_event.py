@@ -1,6 +1,21 @@
+from abc import abstractmethod
+from datetime import datetime
+from uuid import UUID
+
 from .base import IBaseRepo
 from infrastructure.database.models import GitHubEvent
 
 
 class IGitHubEventRepo(IBaseRepo[GitHubEvent]):
-    pass
+    
+    @abstractmethod
+    async def search(self, query: str, limit: int) -> list[tuple[GitHubEvent, float, str]]:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_version(self) -> int:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def get_modified_at(self, id: UUID) -> datetime:
+        raise NotImplementedError
@@ -0,0 +1,16 @@
+from abc import abstractmethod
+from datetime import datetime
+
+from .base import IBaseRepo
+from infrastructure.database.models import MonitoredRepository
+
+
+class IMonitoredRepositoryRepo(IBaseRepo[MonitoredRepository]):
+    
+    @abstractmethod
+    async def get_due(self, now: datetime, limit: int) -> list[MonitoredRepository]:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def is_monitored(self, owner: str, name: str) -> bool:
+        raise NotImplementedError
@@ -0,0 +1,25 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from .base import IBaseRepo
+from infrastructure.database.models import GitHubEventPayload, PayloadDictionary
+
+
+class IPayloadArchiveRepo(IBaseRepo[GitHubEventPayload]):
+    
+    @abstractmethod
+    async def get_candidates(self, before: datetime, limit: int) -> list[tuple[UUID, dict[str, Any]]]:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def archive(self, rows: list[dict[str, Any]]) -> int:
+        raise NotImplementedError
+
+
+class IPayloadDictionaryRepo(IBaseRepo[PayloadDictionary]):
+    
+    @abstractmethod
+    async def get_latest(self) -> PayloadDictionary | None:
+        raise NotImplementedError
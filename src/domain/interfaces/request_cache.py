@@ -0,0 +1,15 @@
+from abc import abstractmethod
+
+from .base import IBaseRepo
+from infrastructure.database.models import GitHubRequestCache
+
+
+class IRequestCacheRepo(IBaseRepo[GitHubRequestCache]):
+    
+    @abstractmethod
+    async def save_validators(self, repository: str, validators: dict[str, tuple[str | None, str | None]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_except(self, repository: str, urls: list[str]) -> None:
+        raise NotImplementedError
@@ -0,0 +1,22 @@
+from abc import abstractmethod
+from datetime import datetime
+
+from .base import IBaseRepo
+from infrastructure.database.models import EventType, SyncState
+
+
+class ISyncStateRepo(IBaseRepo[SyncState]):
+    
+    @abstractmethod
+    async def save_mark(
+        self,
+        repository: str,
+        event_type: EventType,
+        last_seen_at: datetime | None,
+        last_seen_id: str
+    ) -> None:
+        raise NotImplementedError
+    
+    @abstractmethod
+    async def try_lock(self, repository: str) -> bool:
+        raise NotImplementedError
@@ -0,0 +1,132 @@
+from collections import OrderedDict, deque
+import logging
+import time
+from typing import Any, Hashable
+import uuid
+
+_log = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """LRU-кэш в памяти процесса с TTL и ограничением общего размера.
+    
+    Записи помечаются тегами, инвалидация идёт по тегу. Размер записи задаёт
+    вызывающий код (например, длина JSON), при превышении max_bytes вытесняются
+    давно не читанные записи.
+    
+    Чтение из БД, начатое до инвалидации, не должно положить в кэш старые данные
+    после неё: вызывающий код берёт generation до чтения и передаёт его в set,
+    запись отклоняется, если её теги инвалидировались после этого поколения.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float, invalidation_log: int = 1024):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # Отличает свои сообщения об инвалидации от сообщений других реплик
+        self.instance_id = uuid.uuid4().hex
+        
+        self.entries: OrderedDict[Hashable, tuple[float, int, Any, tuple[str, ...]]] = OrderedDict()
+        self.tags: dict[str, set[Hashable]] = {}
+        self.size = 0
+        
+        # Номер последней инвалидации и недавние инвалидации (номер, теги)
+        self.generation = 0
+        self.invalidation_log: deque[tuple[int, frozenset[str]]] = deque(maxlen=invalidation_log)
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.rejected = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, _, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _invalidated_since(self, generation: int, tags: tuple[str, ...]) -> bool:
+        if generation == self.generation:
+            return False
+        if not self.invalidation_log or self.invalidation_log[0][0] > generation + 1:
+            # Нужная часть журнала вытеснена: считаем, что теги могли инвалидироваться
+            return True
+        return any(
+            number > generation and not invalidated.isdisjoint(tags)
+            for number, invalidated in self.invalidation_log
+        )
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        size: int,
+        tags: tuple[str, ...] = (),
+        generation: int | None = None
+    ) -> None:
+        """generation - значение self.generation до чтения value из источника"""
+        if size > self.max_bytes:
+            return
+        if generation is not None and self._invalidated_since(generation, tags):
+            self.rejected += 1
+            return
+        if key in self.entries:
+            self._remove(key)
+        
+        self.entries[key] = (time.monotonic() + self.ttl, size, value, tags)
+        self.size += size
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(key)
+        
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def invalidate(self, *tags: str) -> None:
+        self.generation += 1
+        self.invalidation_log.append((self.generation, frozenset(tags)))
+        for tag in tags:
+            for key in self.tags.pop(tag, set()):
+                if key in self.entries:
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.tags.clear()
+        self.size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _, tags = self.entries.pop(key)
+        self.size -= size
+        for tag in tags:
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "rejected": self.rejected,
+            "items": len(self.entries),
+            "size_bytes": self.size,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,63 @@
+import logging
+import threading
+from uuid import UUID
+
+import zstandard
+
+_log = logging.getLogger(__name__)
+
+
+class PayloadCompressor:
+    """Сжатие JSON-payload'ов zstd, опционально с общим обученным словарём.
+    
+    Методы синхронные и тяжёлые: из async-кода их вызывают через asyncio.to_thread.
+    """
+
+    def __init__(self, level: int):
+        self.level = level
+        self.dictionaries: dict[UUID, zstandard.ZstdCompressionDict] = {}
+        # Компрессор со словарём дорого создавать: один на словарь. Экземпляр
+        # ZstdCompressor не потокобезопасен, поэтому сжатие идёт под блокировкой
+        self.compressors: dict[UUID | None, zstandard.ZstdCompressor] = {}
+        self.lock = threading.Lock()
+
+    def train_dictionary(self, samples: list[bytes], size: int) -> bytes:
+        """Обучение словаря на примерах payload'ов"""
+        dictionary = zstandard.train_dictionary(size, samples)
+        _log.info(f"Обучен словарь zstd на {len(samples)} примерах")
+        return dictionary.as_bytes()
+
+    def has_dictionary(self, id: UUID) -> bool:
+        return id in self.dictionaries
+
+    def add_dictionary(self, id: UUID, data: bytes) -> None:
+        self.dictionaries[id] = zstandard.ZstdCompressionDict(data)
+
+    def compress(self, data: bytes, dictionary_id: UUID | None = None) -> bytes:
+        return self.compress_many([data], dictionary_id)[0]
+
+    def compress_many(self, items: list[bytes], dictionary_id: UUID | None = None) -> list[bytes]:
+        with self.lock:
+            compressor = self.compressors.get(dictionary_id)
+            if compressor is None:
+                dictionary = self.dictionaries[dictionary_id] if dictionary_id is not None else None
+                compressor = zstandard.ZstdCompressor(level=self.level, dict_data=dictionary)
+                self.compressors[dictionary_id] = compressor
+            return [compressor.compress(data) for data in items]
+
+    def decompress(self, data: bytes, dictionary_id: UUID | None = None) -> bytes:
+        dictionary = self.dictionaries[dictionary_id] if dictionary_id is not None else None
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(data)
+
+
+class ZstdFileWriter:
+    """Потоковая запись в файл .zst: данные сжимаются по мере записи"""
+
+    def __init__(self, path: str, level: int):
+        self.writer = zstandard.ZstdCompressor(level=level).stream_writer(open(path, "wb"))
+
+    def write(self, data: bytes) -> None:
+        self.writer.write(data)
+
+    def close(self) -> None:
+        self.writer.close()
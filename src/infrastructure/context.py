@@ -1,17 +1,19 @@
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 import logging
-from typing import AsyncIterator
+from typing import AsyncIterator, Awaitable, Callable
 from sqlalchemy.ext.asyncio import AsyncSession
 from .database.client_db import ClientDB
 
 _log = logging.getLogger(__name__)
 
 _current_session: ContextVar[AsyncSession] = ContextVar("_current_session")
+_after_commit: ContextVar[list[Callable[[], Awaitable[None]]]] = ContextVar("_after_commit")
 
 
 class StoryContext:
     session_factory = ClientDB.session_factory
+    read_session_factory = ClientDB.read_session_factory
 
     @classmethod
     @asynccontextmanager
@@ -21,11 +23,13 @@ class StoryContext:
             async with session.begin():
                 # Устанавливаем в контекст
                 token = _current_session.set(session)
+                callbacks_token = _after_commit.set([])
                 try:
                     _log.debug("Start transaction")
                     yield
                     _log.debug("Commit transaction")
                     await session.commit()
+                    await cls._run_after_commit(_after_commit.get())
                 except Exception as e:
                     await session.rollback()
                     _log.info("Transaction failed. Rollback transaction")
@@ -33,8 +37,37 @@ class StoryContext:
                     raise e
                 finally:
                     await session.close()
+                    _after_commit.reset(callbacks_token)
                     _current_session.reset(token)
 
+    @classmethod
+    @asynccontextmanager
+    async def begin_read_only(cls) -> AsyncIterator[None]:
+        """Транзакция только на чтение: без flush и commit, завершается rollback."""
+        async with cls.read_session_factory() as session:
+            token = _current_session.set(session)
+            try:
+                yield
+            finally:
+                await session.rollback()
+                _current_session.reset(token)
+
+    @classmethod
+    async def _run_after_commit(cls, callbacks: list[Callable[[], Awaitable[None]]]) -> None:
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                _log.exception(f"Ошибка обработчика после commit: {e}")
+
+    @classmethod
+    async def after_commit(cls, callback: Callable[[], Awaitable[None]]) -> None:
+        """Выполняет callback после commit текущей транзакции, вне транзакции - сразу"""
+        try:
+            _after_commit.get().append(callback)
+        except LookupError:
+            await cls._run_after_commit([callback])
+
     @classmethod
     def get_current_session(cls) -> AsyncSession:
         """Получает текущую сессию из контекста"""
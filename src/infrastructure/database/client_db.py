@@ -8,6 +8,13 @@ class ClientDB:
 
     engine = create_async_engine(async_url)
     session_factory = async_sessionmaker(engine)
+    
+    # Чтение: реплика, если задана, транзакции BEGIN READ ONLY и без autoflush
+    read_engine = (
+        create_async_engine(settings.DATABASE_REPLICA_URL_asyncpg)
+        if settings.DATABASE_REPLICA_URL_asyncpg else engine
+    ).execution_options(postgresql_readonly=True)
+    read_session_factory = async_sessionmaker(read_engine, autoflush=False, expire_on_commit=False)
 
     @classmethod
     async def init_db(cls):
@@ -1,7 +1,10 @@
+from datetime import date, datetime, timezone
 import enum
-from typing import Annotated
+from typing import Annotated, Any
+import uuid
 
-from sqlalchemy import Enum, Integer, String, Text
+from sqlalchemy import UUID, BigInteger, Boolean, Computed, Date, DateTime, Enum, Float, ForeignKey, Index, Integer, LargeBinary, PrimaryKeyConstraint, String, Text, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from .base_model import Base
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -15,18 +18,162 @@ class EventType(enum.Enum):
 
 class GitHubEvent(Base):
     __tablename__ = "github_events"
+    # Секции по месяцам created_at (github_events_YYYY_MM) создаются заранее PartitionStories.
+    # Уникальность (repository, event_id) между секциями держит github_event_keys с триггерами.
+    __table_args__ = (
+        # Порядок колонок PK: BaseRepo использует pks[0] (id) как идентификатор записи
+        PrimaryKeyConstraint("id", "created_at"),
+        Index("ix_github_events_created_at_id", "created_at", "id"),
+        Index("ix_github_events_repository_type_created_at", "repository", "event_type", "created_at"),
+        Index("ix_github_events_type_created_at", "event_type", "created_at"),
+        Index("ix_github_events_author_created_at", "author", "created_at"),
+        Index("ix_github_events_issue_number", "issue_number", postgresql_where="issue_number IS NOT NULL"),
+        Index("ix_github_events_release_version", "release_version", postgresql_where="release_version IS NOT NULL"),
+        Index("ix_github_events_raw_data", "raw_data", postgresql_using="gin", postgresql_ops={"raw_data": "jsonb_path_ops"}),
+        Index("ix_github_events_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_github_events_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_github_events_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+        Index("ix_github_events_author_trgm", "author", postgresql_using="gin", postgresql_ops={"author": "gin_trgm_ops"}),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
-    event_id: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
+    event_id: Mapped[str] = mapped_column(String(100), index=True, nullable=False)
     event_type: Mapped[EventType] = mapped_column(Enum(EventType), nullable=False)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[str] = mapped_column(Text)
     author: Mapped[str] = mapped_column(String(200))
     url: Mapped[str] = mapped_column(String(500))
     repository: Mapped[str] = mapped_column(String(200), nullable=False)
-    raw_data: Mapped[str] = mapped_column(Text) 
+    # SQL NULL после архивации в github_event_payloads (None не пишется как JSON 'null')
+    raw_data: Mapped[dict[str, Any] | None] = mapped_column(JSONB(none_as_null=True), nullable=True)
     
     commit_hash: Mapped[str | None] = mapped_column(String(100), nullable=True)
     issue_number: Mapped[int | None] = mapped_column(Integer, nullable=True)
     release_version: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    
+    # Ключ секционирования обязан входить в первичный ключ
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now()
+    )
+    
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(author, '')), 'C')",
+            persisted=True
+        ),
+        deferred=True
+    )
+
+
+class GitHubEventKey(Base):
+    """Глобальная уникальность (repository, event_id) для секционированной github_events"""
+    __tablename__ = "github_event_keys"
+    __table_args__ = (
+        UniqueConstraint("repository", "event_id"),
+    )
+    
+    # Строки вставляет триггер github_events, поэтому id генерируется и на стороне БД
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid()
+    )
+    repository: Mapped[str] = mapped_column(String(200), nullable=False)
+    event_id: Mapped[str] = mapped_column(String(100), nullable=False)
+
+
+class GitHubEventsVersion(Base):
+    """Версия содержимого github_events для ETag списков.
+    
+    Увеличивается триггером на каждую пишущую команду в случайном шарде,
+    чтобы параллельные транзакции не ждали друг друга; версия - сумма шардов.
+    """
+    __tablename__ = "github_events_version"
+    
+    shard: Mapped[int] = mapped_column(Integer, unique=True, nullable=False)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class GitHubEventStats(Base):
+    """Количество событий по дням (UTC) created_at, обновляется в транзакции записи событий"""
+    __tablename__ = "github_event_stats"
+    __table_args__ = (
+        UniqueConstraint("day", "repository", "event_type", "author"),
+        Index("ix_github_event_stats_repository_day", "repository", "day"),
+    )
+    
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    repository: Mapped[str] = mapped_column(String(200), nullable=False)
+    event_type: Mapped[EventType] = mapped_column(Enum(EventType), nullable=False)
+    author: Mapped[str] = mapped_column(String(200), nullable=False)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class GitHubRequestCache(Base):
+    __tablename__ = "github_request_cache"
+    
+    repository: Mapped[str] = mapped_column(String(200), index=True, nullable=False)
+    url: Mapped[str] = mapped_column(String(1000), unique=True, index=True, nullable=False)
+    etag: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+
+class SyncState(Base):
+    __tablename__ = "sync_state"
+    __table_args__ = (
+        UniqueConstraint("repository", "event_type"),
+    )
+    
+    repository: Mapped[str] = mapped_column(String(200), nullable=False)
+    event_type: Mapped[EventType] = mapped_column(Enum(EventType), nullable=False)
+    last_seen_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_seen_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+
+class MonitoredRepository(Base):
+    __tablename__ = "monitored_repositories"
+    __table_args__ = (
+        UniqueConstraint("owner", "name"),
+    )
+    
+    owner: Mapped[str] = mapped_column(String(100), nullable=False)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default="true", nullable=False)
+    
+    sync_interval: Mapped[float] = mapped_column(Float, nullable=False)
+    next_sync_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_sync_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_success_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_duration: Mapped[float | None] = mapped_column(Float, nullable=True)
+    last_created: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    sync_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    error_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    
+    @property
+    def full_name(self) -> str:
+        return f"{self.owner}/{self.name}"
 
 
+class PayloadDictionary(Base):
+    __tablename__ = "payload_dictionaries"
+    
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class GitHubEventPayload(Base):
+    __tablename__ = "github_event_payloads"
+    
+    # Без FK: ключ секционированной github_events составной, удаление - триггером
+    event_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(), unique=True, index=True, nullable=False
+    )
+    dictionary_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("payload_dictionaries.id"), nullable=True
+    )
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    raw_size: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -18,6 +18,11 @@ class EntityAlreadyExistsException(InfrastructureException):
     pass
 
 
+class ConcurrentUpdateException(InfrastructureException):
+    """Запись изменена другим запросом - 409 ошибка"""
+    pass
+
+
 class FieldException(InfrastructureException):
     """Поле не найдено - 400 ошибка"""
     pass
@@ -0,0 +1,315 @@
+import asyncio
+import codecs
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import json
+import logging
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Mapping
+
+import aiohttp
+from yarl import URL
+
+from config import settings
+from .rate_limiter import RateLimiter
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class GitHubResponse:
+    status: int
+    data: Any
+    headers: Mapping[str, str]
+    url: str
+    next_url: str | None = None
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-After в секундах: число секунд или HTTP-дата. None - заголовка нет или он не разбирается"""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+_ARRAY_TOKENS = re.compile(r'[\[\]{}",\\]')
+
+
+class _JsonArrayScanner:
+    """Находит границы элементов JSON-массива в тексте, поступающем кусками.
+    
+    Каждый символ просматривается один раз, элемент декодируется целиком, когда
+    найдена запятая или закрывающая скобка после него. Так большой элемент,
+    пришедший многими чанками, разбирается за линейное время.
+    """
+
+    def __init__(self):
+        self.parts: list[str] = []
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.finished = False
+
+    def _item(self, text: str, start: int, end: int, last: bool) -> list[Any]:
+        self.parts.append(text[start:end])
+        item = "".join(self.parts)
+        self.parts = []
+        if not item.strip():
+            if last:
+                return []
+            raise ValueError("Пустой элемент JSON-массива")
+        return [json.loads(item)]
+
+    def feed(self, text: str) -> list[Any]:
+        items: list[Any] = []
+        start = 0
+        skip = 0
+        if self.escape and text:
+            self.escape = False
+            skip = 1
+        
+        for match in _ARRAY_TOKENS.finditer(text, skip):
+            if self.finished:
+                break
+            pos = match.start()
+            if pos < skip:
+                continue
+            char = match.group()
+            
+            if self.in_string:
+                if char == "\\":
+                    if pos + 1 == len(text):
+                        self.escape = True
+                    skip = pos + 2
+                elif char == '"':
+                    self.in_string = False
+                continue
+            
+            if self.depth == 0:
+                if char != "[" or text[start:pos].strip():
+                    raise ValueError("Ожидался JSON-массив")
+                self.depth = 1
+                start = pos + 1
+            elif char == '"':
+                self.in_string = True
+            elif char in "[{":
+                self.depth += 1
+            elif char in "]}":
+                self.depth -= 1
+                if self.depth == 0:
+                    items += self._item(text, start, pos, last=True)
+                    self.finished = True
+            elif char == "," and self.depth == 1:
+                items += self._item(text, start, pos, last=False)
+                start = pos + 1
+        
+        if not self.finished:
+            if self.depth == 0:
+                if text[start:].strip():
+                    raise ValueError("Ожидался JSON-массив")
+            else:
+                self.parts.append(text[start:])
+        return items
+
+
+async def _iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """Отдаёт элементы JSON-массива по мере чтения тела ответа.
+    
+    В памяти держится только текущий недочитанный элемент, а не весь ответ.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    scanner = _JsonArrayScanner()
+    
+    async for chunk in chunks:
+        for item in scanner.feed(utf8.decode(chunk)):
+            yield item
+    
+    if not scanner.finished:
+        raise ValueError("JSON-массив оборван")
+
+
+class GitHubClient:
+    def __init__(self):
+        self.base_url = settings.GITHUB_API_URL
+        self.session: aiohttp.ClientSession | None = None
+        self.semaphore = asyncio.Semaphore(settings.GITHUB_MAX_CONCURRENCY)
+        self.rate_limiter = RateLimiter(
+            capacity=settings.GITHUB_RATE_BURST,
+            rate=settings.GITHUB_RATE_LIMIT / 3600
+        )
+
+    async def connect(self):
+        """Создание общей сессии с пулом keep-alive соединений"""
+        if self.session is not None and not self.session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=settings.GITHUB_POOL_LIMIT,
+            limit_per_host=settings.GITHUB_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=settings.GITHUB_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=settings.GITHUB_DNS_CACHE_TTL,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=settings.GITHUB_TOTAL_TIMEOUT,
+            connect=settings.GITHUB_CONNECT_TIMEOUT,
+            sock_read=settings.GITHUB_READ_TIMEOUT,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={
+                'Authorization': f"token {settings.GITHUB_TOKEN}",
+                'Accept': 'application/vnd.github.v3+json'
+            },
+        )
+        _log.info(f"Открыта сессия GitHub {self.base_url}")
+
+    def build_url(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None
+    ) -> str:
+        """Полный URL запроса. Принимает путь или полный URL (ссылки пагинации)"""
+        if path.startswith("http"):
+            url = URL(path)
+        else:
+            url = URL(f"{self.base_url}/{path.lstrip('/')}")
+        if params:
+            url = url.update_query({k: str(v) for k, v in params.items()})
+        return str(url)
+
+    @asynccontextmanager
+    async def _send(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Запрос с учётом лимитов и повторами. Тело ответа читается внутри контекста"""
+        if self.session is None or self.session.closed:
+            await self.connect()
+        assert self.session is not None
+
+        for attempt in range(settings.GITHUB_MAX_RETRIES + 1):
+            await self.rate_limiter.acquire()
+
+            async with self.semaphore:
+                # Повторяются только ошибки до получения ответа: исключения из тела
+                # контекста вызывающего кода сюда не попадают
+                try:
+                    response = await self.session.get(URL(url, encoded=True), headers=headers)
+                except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                    if attempt == settings.GITHUB_MAX_RETRIES:
+                        raise
+                    delay = self._backoff(attempt)
+                    _log.warning(f"Ошибка запроса к GitHub ({e!r}), повтор через {delay:.1f} c: {url}")
+                else:
+                    async with response:
+                        self._track_rate_limit(response.headers)
+
+                        delay = self._retry_delay(response, attempt)
+                        if delay is None or attempt == settings.GITHUB_MAX_RETRIES:
+                            response.raise_for_status()
+                            yield response
+                            return
+                    _log.warning(f"GitHub ответил {response.status}, повтор через {delay:.1f} c: {url}")
+
+            await asyncio.sleep(delay)
+
+    def _to_response(self, response: aiohttp.ClientResponse, data: Any) -> GitHubResponse:
+        next_link = response.links.get("next")
+        return GitHubResponse(
+            status=response.status,
+            data=data,
+            headers=response.headers,
+            url=str(response.url),
+            next_url=str(next_link["url"]) if next_link else None,
+        )
+
+    async def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None
+    ) -> GitHubResponse:
+        """GET запрос к GitHub API. При 304 Not Modified data = None"""
+        async with self._send(self.build_url(path, params), headers=headers) as response:
+            return self._to_response(
+                response,
+                None if response.status == 304 else await response.json()
+            )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None
+    ) -> AsyncIterator[GitHubResponse]:
+        """GET запрос со списком в ответе: data - асинхронный итератор элементов.
+        
+        Элементы декодируются по мере чтения тела, поэтому их нужно перебрать
+        внутри контекста. При 304 Not Modified data = None.
+        """
+        async with self._send(self.build_url(path, params), headers=headers) as response:
+            items = None
+            if response.status != 304:
+                items = _iter_json_array(
+                    response.content.iter_chunked(settings.GITHUB_STREAM_CHUNK_SIZE)
+                )
+            yield self._to_response(response, items)
+
+    def _track_rate_limit(self, headers: Mapping[str, str]) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        self.rate_limiter.update(int(remaining), float(reset))
+
+    def _retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> float | None:
+        """Пауза перед повтором для 403 (лимит), 429 и 5xx. None - повтор не нужен"""
+        rate_limited = response.status == 429 or (
+            response.status == 403 and (
+                response.headers.get("X-RateLimit-Remaining") == "0"
+                or "Retry-After" in response.headers
+            )
+        )
+        if not rate_limited and response.status < 500:
+            return None
+
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            self.rate_limiter.block(retry_after)
+            return retry_after
+
+        reset = response.headers.get("X-RateLimit-Reset")
+        if response.headers.get("X-RateLimit-Remaining") == "0" and reset is not None:
+            return max(float(reset) - time.time(), 1.0)
+
+        return self._backoff(attempt)
+
+    def _backoff(self, attempt: int) -> float:
+        """Экспоненциальная задержка с full jitter"""
+        cap = min(settings.GITHUB_BACKOFF_MAX, settings.GITHUB_BACKOFF_BASE * 2 ** attempt)
+        return random.uniform(0, cap)
+
+    async def close(self):
+        """Закрытие сессии и всех соединений пула"""
+        if self.session is None:
+            return
+        await self.session.close()
+        self.session = None
+        _log.info("Сессия GitHub закрыта")
@@ -0,0 +1,64 @@
+import asyncio
+import logging
+import time
+
+_log = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket, скорость пополнения которого подстраивается под оставшийся лимит GitHub"""
+
+    def __init__(self, capacity: int, rate: float, min_rate: float = 0.01):
+        self.capacity = capacity
+        self.rate = rate
+        self.min_rate = min_rate
+        self.tokens = float(capacity)
+        self.remaining: int | None = None
+        self.reset_at: float | None = None
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    async def acquire(self) -> None:
+        """Ожидает свободный токен перед запросом"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def update(self, remaining: int | None, reset_at: float | None) -> None:
+        """Пересчитывает скорость по X-RateLimit-Remaining и X-RateLimit-Reset (unix time)"""
+        if remaining is None or reset_at is None:
+            return
+
+        self.remaining = remaining
+        self.reset_at = reset_at
+
+        window = max(reset_at - time.time(), 1.0)
+        self.rate = max(remaining / window, self.min_rate)
+        self._refill(time.monotonic())
+        self.tokens = min(self.tokens, float(remaining))
+
+        if remaining == 0:
+            _log.warning(f"Лимит GitHub исчерпан, ожидание {window:.0f} c")
+            self.block(window)
+
+    def block(self, seconds: float) -> None:
+        """Приостанавливает все запросы на seconds секунд"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
@@ -1,20 +1,50 @@
+import base64
+from datetime import datetime, timezone
+import enum
+import json
 import logging
-from typing import Any, Sequence, Type, TypeVar
-from sqlalchemy import Select, String, cast, delete, select, update, asc,  desc as func_desc, func,  or_
+from typing import Any, Awaitable, Callable, ClassVar, Sequence, Type, TypeVar
+from uuid import UUID
+from sqlalchemy import Select, String, and_, any_, bindparam, cast, delete, literal, select, tuple_, update, asc,  desc as func_desc, func,  or_
+from sqlalchemy.dialects.postgresql import ARRAY, JSONPATH, insert
+from sqlalchemy.exc import CompileError, DBAPIError
+from ..cache import TTLCache
 from ..context import StoryContext
 from sqlalchemy.orm import DeclarativeBase, class_mapper
 from sqlalchemy.orm.interfaces import LoaderOption
 
 from domain.interfaces.base import IBaseRepo
-from application.schemes.base import ListDTO
-from ..exceptions import FieldException, PageNotFoundException, EntityNotFoundException
+from application.schemes.base import CountStrategy, ListDTO
+from config import settings
+from ..exceptions import ConcurrentUpdateException, FieldException, PageNotFoundException, EntityNotFoundException
     
 _log = logging.getLogger(__name__)
 
 Aggregate = TypeVar("Aggregate", bound=DeclarativeBase)
 
+# Кэши количества записей общие для всех репозиториев одной таблицы:
+# запись через любой из них должна сбрасывать закэшированные количества
+_count_caches: dict[str, TTLCache] = {}
+# Тег всех записей кэша количества: инвалидация через него двигает generation
+COUNT_TAG = "count"
+
+
+def invalidate_table_counts(table: str) -> None:
+    """Сбрасывает кэш количества записей таблицы (в том числе по сообщению другой реплики)"""
+    cache = _count_caches.get(table)
+    if cache is not None:
+        cache.invalidate(COUNT_TAG)
+
+
+def like_pattern(value: str) -> str:
+    """Шаблон ILIKE для поиска подстроки: %, _ и \\ в value - обычные символы"""
+    return "%" + value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
 
 class BaseRepo(IBaseRepo[Aggregate]):
+    # Рассылка инвалидации кэша количества другим репликам, задаётся при старте приложения
+    count_publisher: ClassVar[Callable[[str], Awaitable[None]] | None] = None
+    
     def __init__(self):
 
         if not hasattr(self, "model"):
@@ -30,21 +60,198 @@ class BaseRepo(IBaseRepo[Aggregate]):
             column.key for column in class_mapper(self.model).relationships
         ]
 
+        # Кэш количества записей для CountStrategy.CACHED: ключ - поиск и фильтры.
+        # LRU с TTL: число разных ключей не ограничено, поэтому ограничен размер
+        self.count_cache = _count_caches.setdefault(
+            self.model.__tablename__,  # type: ignore
+            TTLCache(max_bytes=settings.COUNT_CACHE_MAX_ITEMS, ttl=settings.COUNT_CACHE_TTL)
+        )
+
     @property
     def session(self):
         return StoryContext.get_current_session()
 
-    async def all(self, **filters: Any) -> list[Aggregate]:
-        """Получает все записи"""
-        stmt = select(
-            self.model
-        ).filter_by(
-            **filters
-        )
+    async def all(self, options: list[LoaderOption] | None = None, **filters: Any) -> list[Aggregate]:
+        """Получает все записи, фильтры как в all_list (field__op=value)"""
+        stmt = self._apply_filters(select(self.model), filters)
+        if options:
+            stmt = stmt.options(*options)
 
         result = await self.session.execute(stmt)
         return [entity for entity in result.scalars().all()]
 
+    def _encode_cursor(self, sort_by: str, desc: int, entity: Aggregate) -> str:
+        value = getattr(entity, sort_by)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, enum.Enum):
+            value = value.value
+        elif isinstance(value, UUID):
+            value = str(value)
+        
+        pk = self.pks[0]
+        data = {"s": sort_by, "d": desc, "v": value, "id": str(getattr(entity, pk))}
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+    
+    def _decode_cursor(self, cursor: str, sort_by: str, desc: int) -> tuple[Any, Any]:
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if data["s"] != sort_by or data["d"] != desc:
+                raise ValueError("cursor sort mismatch")
+            
+            value = data["v"]
+            if value is not None:
+                python_type = getattr(self.model, sort_by).type.python_type
+                if python_type is datetime:
+                    value = datetime.fromisoformat(value)
+                else:
+                    value = python_type(value)
+            
+            pk_column = getattr(self.model, self.pks[0])
+            return value, pk_column.type.python_type(data["id"])
+        except (ValueError, KeyError, TypeError, NotImplementedError) as e:
+            # NotImplementedError - у типа колонки нет python_type
+            raise FieldException("Некорректный курсор") from e
+    
+    def _after_cursor(self, sort_by: str, desc: int, value: Any, last_pk: Any) -> Any:
+        """Условие keyset-пагинации: строки после (value, last_pk) в порядке (sort_by, pk).
+        
+        NULL в Postgres идут последними при ASC и первыми при DESC.
+        """
+        column = getattr(self.model, sort_by)
+        pk_column = getattr(self.model, self.pks[0])
+        
+        if sort_by == self.pks[0]:
+            return pk_column < last_pk if desc == 1 else pk_column > last_pk
+        
+        if value is None:
+            if desc == 1:
+                return or_(and_(column.is_(None), pk_column < last_pk), column.is_not(None))
+            return and_(column.is_(None), pk_column > last_pk)
+        
+        key = tuple_(column, pk_column)
+        bound = tuple_(literal(value, column.type), literal(last_pk, pk_column.type))
+        if desc == 1:
+            return key < bound
+        nullable = self.model.__table__.columns[sort_by].nullable  # type: ignore
+        return or_(key > bound, column.is_(None)) if nullable else key > bound
+    
+    _filter_ops = {
+        "gt": lambda column, value: column > value,
+        "gte": lambda column, value: column >= value,
+        "lt": lambda column, value: column < value,
+        "lte": lambda column, value: column <= value,
+        "in": lambda column, value: column.in_(value),
+        # JSONB: содержит (@>) и совпадение по JSON path (@?), используют GIN jsonb_path_ops
+        "contains": lambda column, value: column.contains(value),
+        "path": lambda column, value: column.op("@?")(cast(value, JSONPATH)),
+    }
+    
+    def _apply_filters(self, stmt: Select[Any], filters: dict[str, Any]) -> Select[Any]:
+        """Фильтры вида field=value или field__op=value (op: gt, gte, lt, lte, in, contains, path)"""
+        for key, value in filters.items():
+            field, _, op = key.partition("__")
+            if not hasattr(self.model, field):
+                raise FieldException(
+                    f"Поле {field} для фильтрации не найдено"
+                )
+            column = getattr(self.model, field)
+            
+            if not op:
+                stmt = stmt.filter(column == value)
+            elif op in self._filter_ops:
+                stmt = stmt.filter(self._filter_ops[op](column, value))
+            else:
+                raise FieldException(
+                    f"Операция {op} для фильтрации не поддерживается"
+                )
+        return stmt
+    
+    async def invalidate_counts(self) -> None:
+        """Сбрасывает кэш количества записей после commit: здесь и на других репликах.
+        
+        Вызывается при любой записи. Подсчёт, начатый до инвалидации,
+        свой результат в кэш уже не положит (generation).
+        """
+        table = self.model.__tablename__  # type: ignore
+        
+        async def invalidate():
+            invalidate_table_counts(table)
+            if BaseRepo.count_publisher is not None:
+                await BaseRepo.count_publisher(table)
+        
+        await StoryContext.after_commit(invalidate)
+    
+    async def _exact_count(self, stmt: Select[Any]) -> int:
+        stmt = stmt.with_only_columns(
+            func.count(getattr(self.model, self.pks[0]))  # type: ignore
+        )
+        result = await self.session.execute(stmt)
+        total_record = result.scalar_one_or_none()
+        return total_record if total_record is not None else 0
+    
+    async def _estimated_count(self, stmt: Select[Any], unfiltered: bool) -> int | None:
+        """Оценка количества: pg_class.reltuples без фильтров, иначе оценка планировщика.
+        
+        None, если оценка недоступна (таблица ещё не анализировалась и т.п.).
+        """
+        conn = await self.session.connection()
+        
+        if unfiltered:
+            # У секционированной таблицы своей статистики нет: сумма по секциям
+            result = await conn.exec_driver_sql(
+                "SELECT CASE WHEN c.relkind = 'p' THEN ("
+                "SELECT sum(greatest(p.reltuples, 0))::bigint FROM pg_inherits i "
+                "JOIN pg_class p ON p.oid = i.inhrelid WHERE i.inhparent = c.oid"
+                ") ELSE c.reltuples::bigint END FROM pg_class c WHERE c.oid = $1::regclass",
+                (self.model.__tablename__,)  # type: ignore
+            )
+            estimate = result.scalar_one_or_none()
+            return int(estimate) if estimate is not None and estimate >= 0 else None
+        
+        try:
+            sql = stmt.compile(
+                dialect=conn.dialect,
+                compile_kwargs={"literal_binds": True}
+            )
+        except CompileError:
+            return None
+        
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    
+    async def _count(
+        self,
+        stmt: Select[Any],
+        count_strategy: CountStrategy,
+        cache_key: str | None,
+        unfiltered: bool
+    ) -> tuple[int | None, CountStrategy]:
+        """Количество записей выбранным способом и фактически использованный способ"""
+        if count_strategy == CountStrategy.NONE:
+            return None, CountStrategy.NONE
+        
+        if count_strategy == CountStrategy.CACHED and cache_key is not None:
+            cached = self.count_cache.get(cache_key)
+            if cached is not None:
+                return cached, CountStrategy.CACHED
+            
+            generation = self.count_cache.generation
+            total_record = await self._exact_count(stmt)
+            # Размер записи 1: max_bytes кэша задаёт число записей
+            self.count_cache.set(cache_key, total_record, size=1, tags=(COUNT_TAG,), generation=generation)
+            return total_record, CountStrategy.CACHED
+        
+        if count_strategy == CountStrategy.ESTIMATED:
+            estimate = await self._estimated_count(stmt, unfiltered)
+            if estimate is not None:
+                return estimate, CountStrategy.ESTIMATED
+        
+        return await self._exact_count(stmt), CountStrategy.EXACT
+    
     async def all_list(
         self,
         search: str | None = None,
@@ -54,9 +261,21 @@ class BaseRepo(IBaseRepo[Aggregate]):
         page: int = 1,
         limit: int = -1,
         stmt: Select[Any] | None = None,
+        cursor: str | None = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        options: list[LoaderOption] | None = None,
         **filters: Any
     ) -> ListDTO[Aggregate]:
+        """Список с пагинацией.
+        
+        По номеру страницы (OFFSET) или, если передан cursor, по ключу
+        (sort_by, pk) - тогда стоимость не зависит от глубины. next_cursor
+        возвращается для каждой полной страницы.
+        total_record считается способом count_strategy.
+        """
+        cache_key = None
         if stmt is None:
+            cache_key = json.dumps([search, search_by, sorted(filters.items())], default=str)
             stmt = select(
                 self.model
             )
@@ -66,9 +285,12 @@ class BaseRepo(IBaseRepo[Aggregate]):
             for field in search_by:
                 if hasattr(self.model, field):
                     column = getattr(self.model, field)
+                    if not isinstance(column.type, String):
+                        # Без лишнего CAST, чтобы работали триграммные индексы
+                        column = cast(column, String)
                     search_conditions.append(  # type: ignore
                         # type: ignore
-                        cast(column, String).ilike(f"%{search}%"))
+                        column.ilike(like_pattern(search)))
                 else:
                     raise FieldException(
                         f"Поле {field} для поиска не найдено"
@@ -79,7 +301,7 @@ class BaseRepo(IBaseRepo[Aggregate]):
                     or_(*search_conditions))  # type: ignore
 
         if filters:
-            stmt = stmt.filter_by(**filters)
+            stmt = self._apply_filters(stmt, filters)
 
         if page < 1:
             raise PageNotFoundException(
@@ -88,53 +310,74 @@ class BaseRepo(IBaseRepo[Aggregate]):
 
         stmt_total_record = stmt
 
+        if sort_by is None and (limit != -1 or cursor is not None):
+            # Стабильный порядок нужен для пагинации
+            sort_by = "created_at" if hasattr(self.model, "created_at") else self.pks[0]
+
         if sort_by:
             if hasattr(self.model, sort_by):
+                order = func_desc if desc == 1 else asc
                 stmt = stmt.order_by(
-                    func_desc(getattr(self.model, sort_by)) if desc == 1 else asc(
-                        getattr(self.model, sort_by))
+                    order(getattr(self.model, sort_by)),
+                    order(getattr(self.model, self.pks[0]))
                 )
             else:
                 raise FieldException(
                     f"Поле {sort_by} для сортировки не найдено"
                 )
 
-        stmt = stmt.offset((page - 1) * limit)
+        if options:
+            stmt = stmt.options(*options)
+
+        if cursor is not None:
+            assert sort_by is not None
+            value, last_pk = self._decode_cursor(cursor, sort_by, desc)
+            stmt = stmt.filter(self._after_cursor(sort_by, desc, value, last_pk))
+        elif limit != -1:
+            stmt = stmt.offset((page - 1) * limit)
         if limit != -1:
             stmt = stmt.limit(limit)
 
         result = await self.session.execute(stmt)
         content = result.scalars().all()
 
-        stmt_total_record = stmt_total_record.with_only_columns(
-            # type: ignore
-            func.count(*[getattr(self.model, pk) for pk in self.pks]))  # type: ignore
-        stmt_total_record = await self.session.execute(stmt_total_record)
-        total_record = stmt_total_record.scalar_one_or_none()  # type: ignore
+        next_cursor = None
+        if sort_by and limit != -1 and len(content) == limit:
+            next_cursor = self._encode_cursor(sort_by, desc, content[-1])
 
-        if total_record is None:
-            total_record = 0
+        total_record, count_strategy = await self._count(
+            stmt_total_record,
+            count_strategy=count_strategy,
+            cache_key=cache_key,
+            unfiltered=cache_key is not None and not search and not filters
+        )
 
         if limit == -1:
             pages = 1
+        elif total_record is None:
+            pages = None
         else:
             pages = total_record // limit if total_record % limit == 0 else total_record // limit + 1
 
         return ListDTO[Aggregate](
             page_number=page,
-            page_size=limit if limit != -1 else total_record,
+            page_size=limit if limit != -1 else len(content),
             total_pages=pages,
             total_record=total_record,
             content=[entity for entity in content],
+            next_cursor=next_cursor,
+            count_strategy=count_strategy,
         )
     
-    async def get_or_none(self, **filters: Any) -> Aggregate | None:
+    async def get_or_none(self, options: list[LoaderOption] | None = None, **filters: Any) -> Aggregate | None:
         """Получает запись"""
         stmt = select(
             self.model
         ).filter_by(
             **filters
         )
+        if options:
+            stmt = stmt.options(*options)
 
         result = await self.session.execute(stmt)
         entity = result.scalars().first()
@@ -144,9 +387,9 @@ class BaseRepo(IBaseRepo[Aggregate]):
 
         return entity
 
-    async def get(self, **filters: Any) -> Aggregate:
+    async def get(self, options: list[LoaderOption] | None = None, **filters: Any) -> Aggregate:
         """Получает запись"""
-        entity = await self.get_or_none(**filters)
+        entity = await self.get_or_none(options=options, **filters)
 
         if entity is None:
             raise EntityNotFoundException("Объект не найден")
@@ -159,6 +402,7 @@ class BaseRepo(IBaseRepo[Aggregate]):
             objs = [objs]
         self.session.add_all(objs)
         await self.session.flush()
+        await self.invalidate_counts()
         
     async def get_or_create(self, data: dict[str, Any] | None = None, **filters: Any) -> Aggregate:
         get_obj = await self.get_or_none(**filters)
@@ -175,8 +419,97 @@ class BaseRepo(IBaseRepo[Aggregate]):
         
         return obj
         
+    async def get_existing_values(self, field: str, values: list[Any], **filters: Any) -> set[Any]:
+        """Возвращает значения поля, которые уже есть в БД, одним запросом"""
+        if not values:
+            return set()
+        
+        if not hasattr(self.model, field):
+            raise FieldException(
+                f"Поле {field} не найдено"
+            )
+        column = getattr(self.model, field)
+        
+        stmt = select(
+            column
+        ).where(
+            column == any_(literal(values, ARRAY(column.type)))
+        ).filter_by(
+            **filters
+        )
+        
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+    
+    async def bulk_create(self, rows: list[dict[str, Any]], index_elements: list[str] | None = None) -> list[Aggregate]:
+        """Вставляет записи одним INSERT ... ON CONFLICT DO NOTHING, возвращает только созданные.
+        
+        Без index_elements конфликт по любому ограничению (или пропуск строки триггером).
+        """
+        if not rows:
+            return []
+        
+        stmt = insert(
+            self.model
+        ).on_conflict_do_nothing(
+            index_elements=index_elements
+        ).returning(
+            self.model
+        )
+        
+        result = await self.session.scalars(stmt, rows)
+        await self.invalidate_counts()
+        return [entity for entity in result.all()]
+    
+    async def bulk_update(self, rows: list[dict[str, Any]]) -> None:
+        """UPDATE по первичному ключу через executemany. Строки могут менять разные наборы полей"""
+        if not rows:
+            return
+        
+        now = datetime.now(timezone.utc)
+        if "updated_at" in self.model.__table__.columns:  # type: ignore
+            rows = [{**row, "updated_at": now} for row in rows]
+        
+        # executemany требует одинаковый набор полей: группируем строки по нему
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        
+        table = self.model.__table__  # type: ignore
+        for keys, group in groups.items():
+            stmt = update(
+                table
+            ).where(
+                *(table.c[key] == bindparam(f"b_{key}") for key in keys if key in self.pks)
+            ).values({
+                key: bindparam(f"b_{key}") for key in keys if key not in self.pks
+            })
+            await self.session.execute(stmt, [
+                {f"b_{key}": value for key, value in row.items()} for row in group
+            ])
+        await self.invalidate_counts()
+    
+    async def bulk_delete(self, ids: list[Any]) -> list[Aggregate]:
+        """Удаляет записи по первичному ключу одним DELETE ... RETURNING, возвращает удалённые"""
+        if not ids:
+            return []
+        
+        pk_column = getattr(self.model, self.pks[0])
+        stmt = delete(
+            self.model
+        ).where(
+            pk_column == any_(literal(ids, ARRAY(pk_column.type)))
+        ).returning(
+            self.model
+        )
+        
+        result = await self.session.execute(stmt)
+        await self.invalidate_counts()
+        return list(result.scalars().all())
+        
     async def update(self, obj: Aggregate) -> None:
         await self.session.flush()
+        await self.invalidate_counts()
         
     async def update_fields(self, fields: dict[str, Any], **filters: Any) -> None:
         stmt = update(
@@ -189,6 +522,48 @@ class BaseRepo(IBaseRepo[Aggregate]):
         await self.session.execute(stmt)
         
         await self.session.flush()
+        await self.invalidate_counts()
+
+    async def _raise_missing(self, expected: dict[str, Any] | None, **filters: Any) -> None:
+        """Запись не найдена по filters + expected: отличает удалённую от изменённой другим запросом"""
+        if expected and await self.exist(**filters):
+            raise ConcurrentUpdateException("Объект изменён другим запросом")
+        raise EntityNotFoundException("Объект не найден")
+    
+    async def update_returning(
+        self,
+        fields: dict[str, Any],
+        expected: dict[str, Any] | None = None,
+        **filters: Any
+    ) -> Aggregate:
+        """Частичное изменение одним UPDATE ... RETURNING.
+        
+        expected - ожидаемые текущие значения (например updated_at) для оптимистичной блокировки.
+        """
+        expected = expected or {}
+        if not fields:
+            entity = await self.get_or_none(**filters, **expected)
+        else:
+            stmt = update(
+                self.model
+            ).filter_by(
+                **filters,
+                **expected
+            ).values(
+                **fields
+            ).returning(
+                self.model
+            ).execution_options(
+                populate_existing=True
+            )
+            result = await self.session.execute(stmt)
+            entity = result.scalars().first()
+        
+        if entity is None:
+            await self._raise_missing(expected, **filters)
+        
+        await self.invalidate_counts()
+        return entity  # type: ignore
 
     async def delete(self, **filters: Any) -> None:
         """Удаляет запись в БД."""
@@ -200,6 +575,34 @@ class BaseRepo(IBaseRepo[Aggregate]):
         await self.session.execute(query)
 
         await self.session.flush()
+        await self.invalidate_counts()
+
+    async def delete_returning(self, expected: dict[str, Any] | None = None, **filters: Any) -> Aggregate:
+        """Удаляет запись одним DELETE ... RETURNING, возвращает удалённую"""
+        expected = expected or {}
+        stmt = delete(
+            self.model
+        ).filter_by(
+            **filters,
+            **expected
+        ).returning(
+            self.model
+        )
+        result = await self.session.execute(stmt)
+        entity = result.scalars().first()
+        
+        if entity is None:
+            await self._raise_missing(expected, **filters)
+        
+        await self.invalidate_counts()
+        return entity  # type: ignore
+
+    async def check_jsonpath(self, path: str) -> None:
+        """Проверяет синтаксис JSON path для фильтра field__path: иначе запрос списка падает с 500"""
+        try:
+            await self.session.execute(select(cast(path, JSONPATH)))
+        except DBAPIError as e:
+            raise FieldException(f"Некорректный JSON path: {path}") from e
 
     async def exist(self, **filters: Any) -> bool:
         stmt = select(
@@ -0,0 +1,141 @@
+from datetime import date
+import re
+from typing import AsyncIterator
+
+from sqlalchemy import func, select, text, update
+
+from ..database.models import GitHubEvent, GitHubEventKey, GitHubEventPayload, GitHubEventsVersion
+from domain.interfaces.event_partition import IEventPartitionRepo
+from .base import BaseRepo
+
+
+class EventPartitionRepo(IEventPartitionRepo, BaseRepo[GitHubEvent]):
+    """Месячные партиции github_events (github_events_YYYY_MM) по created_at в UTC"""
+    model = GitHubEvent
+    
+    def _name(self, month: date) -> str:
+        return f"{self.model.__tablename__}_{month:%Y_%m}"
+    
+    def _months(self, names: list[str]) -> list[date]:
+        pattern = re.compile(rf"^{self.model.__tablename__}_(\d{{4}})_(\d{{2}})$")
+        months = []
+        for name in names:
+            match = pattern.match(name)
+            if match:
+                months.append(date(int(match[1]), int(match[2]), 1))
+        return sorted(months)
+    
+    async def try_lock(self) -> bool:
+        """Advisory-блокировка обслуживания партиций до конца транзакции: его выполняет одна реплика"""
+        stmt = select(
+            func.pg_try_advisory_xact_lock(func.hashtext(f"partitions:{self.model.__tablename__}"))
+        )
+        result = await self.session.execute(stmt)
+        return bool(result.scalar_one())
+    
+    async def get_partitions(self) -> list[date]:
+        """Месяцы подключённых партиций"""
+        result = await self.session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:table AS regclass)"
+            ).bindparams(table=self.model.__tablename__)
+        )
+        return self._months(list(result.scalars().all()))
+    
+    async def get_detached(self) -> list[date]:
+        """Месяцы отключённых, но ещё не выгруженных партиций"""
+        result = await self.session.execute(
+            text(
+                "SELECT relname FROM pg_class "
+                "WHERE relkind = 'r' AND NOT relispartition AND relname LIKE :prefix"
+            ).bindparams(prefix=f"{self.model.__tablename__}\\_%")
+        )
+        return self._months(list(result.scalars().all()))
+    
+    async def create_partition(self, month: date) -> bool:
+        """Создаёт партицию на месяц, если её ещё нет. True - создана"""
+        name = self._name(month)
+        exists = await self.session.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL").bindparams(name=name)
+        )
+        if exists.scalar_one():
+            return False
+        
+        end = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+        await self.session.execute(text(
+            f'CREATE TABLE "{name}" PARTITION OF {self.model.__tablename__} '
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+        ))
+        return True
+    
+    async def split_default(self) -> list[date]:
+        """Переносит строки из секции DEFAULT в месячные секции, возвращает их месяцы.
+        
+        Пока строки лежат в DEFAULT, на их месяц нельзя создать секцию и на них
+        не действует retention. DEFAULT отключается и пересоздаётся пустой, строки
+        вставляются заново через родительскую таблицу. Ключи этих строк удаляются
+        заранее, иначе триггер вставки примет их за дубликаты.
+        """
+        table = self.model.__tablename__
+        default = f"{table}_default"
+        result = await self.session.execute(text(
+            "SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC')::date "
+            f'FROM "{default}"'
+        ))
+        months = sorted(result.scalars().all())
+        if not months:
+            return []
+        
+        old = f"{default}_old"
+        await self.session.execute(text(f'ALTER TABLE {table} DETACH PARTITION "{default}"'))
+        await self.session.execute(text(f'ALTER TABLE "{default}" RENAME TO "{old}"'))
+        await self.session.execute(text(f'CREATE TABLE "{default}" PARTITION OF {table} DEFAULT'))
+        for month in months:
+            await self.create_partition(month)
+        
+        columns = ", ".join(
+            column.name for column in self.model.__table__.columns if column.computed is None  # type: ignore
+        )
+        await self.session.execute(text(
+            f"DELETE FROM {GitHubEventKey.__tablename__} k "
+            f'USING "{old}" e WHERE k.repository = e.repository AND k.event_id = e.event_id'
+        ))
+        await self.session.execute(text(
+            f'INSERT INTO {table} ({columns}) SELECT {columns} FROM "{old}"'
+        ))
+        await self.session.execute(text(f'DROP TABLE "{old}"'))
+        return months
+    
+    async def detach_partition(self, month: date) -> None:
+        await self.session.execute(text(
+            f'ALTER TABLE {self.model.__tablename__} DETACH PARTITION "{self._name(month)}"'
+        ))
+        # DETACH не вызывает триггеры, версию для ETag списков меняем сами
+        await self.session.execute(
+            update(GitHubEventsVersion).where(GitHubEventsVersion.shard == 0).values(version=GitHubEventsVersion.version + 1)
+        )
+        await self.invalidate_counts()
+    
+    async def export_partition(self, month: date, batch: int) -> AsyncIterator[list[str]]:
+        """Строки отключённой партиции JSON-ом вместе с архивированным payload (base64 zstd)"""
+        result = await self.session.stream(text(
+            "SELECT ((to_jsonb(e) - 'search_vector') || CASE WHEN p.id IS NULL THEN '{}'::jsonb "
+            "ELSE jsonb_build_object('payload', encode(p.data, 'base64'), 'payload_dictionary_id', p.dictionary_id) "
+            f'END)::text FROM "{self._name(month)}" e '
+            f"LEFT JOIN {GitHubEventPayload.__tablename__} p ON p.event_id = e.id"
+        ))
+        async for lines in result.scalars().partitions(batch):
+            yield list(lines)
+    
+    async def drop_partition(self, month: date) -> None:
+        """Удаляет выгруженную партицию и её архивированные payload'ы.
+        
+        Ключи в github_event_keys остаются, чтобы удалённые события не загрузились повторно.
+        """
+        name = self._name(month)
+        await self.session.execute(text(
+            f"DELETE FROM {GitHubEventPayload.__tablename__} p "
+            f'USING "{name}" e WHERE p.event_id = e.id'
+        ))
+        await self.session.execute(text(f'DROP TABLE "{name}"'))
@@ -0,0 +1,77 @@
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from ..database.models import GitHubEventStats
+from domain.interfaces.event_stats import IEventStatsRepo, StatsKey
+from .base import BaseRepo
+
+
+class EventStatsRepo(IEventStatsRepo, BaseRepo[GitHubEventStats]):
+    model = GitHubEventStats
+    
+    async def apply(self, deltas: dict[StatsKey, int]) -> None:
+        """Прибавляет изменения счётчиков одним upsert-запросом.
+        
+        Ключи сортируются, чтобы параллельные транзакции блокировали строки в одном порядке.
+        """
+        rows = [
+            dict(day=day, repository=repository, event_type=event_type, author=author, count=delta)
+            for (day, repository, event_type, author), delta in sorted(
+                deltas.items(), key=lambda item: (item[0][0], item[0][1], item[0][2].value, item[0][3])
+            )
+            if delta
+        ]
+        if not rows:
+            return
+        
+        stmt = insert(
+            self.model
+        ).values(
+            rows
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.day, self.model.repository, self.model.event_type, self.model.author],
+            set_={
+                "count": self.model.count + stmt.excluded.count,
+                "updated_at": func.now(),
+            }
+        )
+        await self.session.execute(stmt)
+        await self.invalidate_counts()
+    
+    async def get_stats(
+        self,
+        bucket: str,
+        group_by: list[str],
+        date_from: date | None = None,
+        date_to: date | None = None,
+        **filters: Any
+    ) -> list[dict[str, Any]]:
+        """Сумма счётчиков по интервалам bucket (day, week, month) и полям group_by"""
+        bucket_column = cast(func.date_trunc(bucket, self.model.day), Date).label("bucket")
+        group_columns = [getattr(self.model, field) for field in group_by]
+        
+        stmt = select(
+            bucket_column,
+            *group_columns,
+            func.sum(self.model.count).label("count")
+        ).group_by(
+            bucket_column,
+            *group_columns
+        ).having(
+            func.sum(self.model.count) > 0
+        ).order_by(
+            bucket_column,
+            *group_columns
+        )
+        if date_from is not None:
+            stmt = stmt.where(self.model.day >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(self.model.day < date_to)
+        stmt = self._apply_filters(stmt, filters)
+        
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
@@ -1,7 +1,85 @@
-from ..database.models import GitHubEvent
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import func, or_, select
+
+from ..database.models import GitHubEvent, GitHubEventsVersion
+from ..exceptions import EntityNotFoundException
 from domain.interfaces.github_event import IGitHubEventRepo
-from .base import BaseRepo
+from .base import BaseRepo, like_pattern
 
 
 class TaskRepo(IGitHubEventRepo, BaseRepo[GitHubEvent]):
     model = GitHubEvent
+    
+    async def search(self, query: str, limit: int) -> list[tuple[GitHubEvent, float, str]]:
+        """Полнотекстовый поиск по title, description и author.
+        
+        Совпадения по словам ищутся через GIN-индекс search_vector, части слов -
+        через триграммные индексы. Возвращает (событие, ранг, фрагмент с <mark>).
+        """
+        ts_query = func.websearch_to_tsquery("simple", query)
+        pattern = like_pattern(query)
+        
+        rank = (
+            func.ts_rank_cd(self.model.search_vector, ts_query)
+            + func.similarity(self.model.title, query)
+        ).label("rank")
+        
+        # Сначала отбираем и ранжируем id, фрагменты строим только для страницы
+        ranked = select(
+            self.model.id,
+            rank
+        ).where(
+            or_(
+                self.model.search_vector.op("@@")(ts_query),
+                self.model.title.ilike(pattern),
+                self.model.description.ilike(pattern),
+                self.model.author.ilike(pattern)
+            )
+        ).order_by(
+            rank.desc()
+        ).limit(
+            limit
+        ).subquery()
+        
+        snippet = func.ts_headline(
+            "simple",
+            func.coalesce(func.nullif(self.model.description, ""), self.model.title),
+            ts_query,
+            "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=30, MinWords=10"
+        ).label("snippet")
+        
+        stmt = select(
+            self.model,
+            ranked.c.rank,
+            snippet
+        ).join(
+            ranked, ranked.c.id == self.model.id
+        ).order_by(
+            ranked.c.rank.desc()
+        )
+        
+        result = await self.session.execute(stmt)
+        return [(entity, float(rank), snippet) for entity, rank, snippet in result.all()]
+    
+    async def get_version(self) -> int:
+        """Версия содержимого таблицы: меняется после каждой зафиксированной записи"""
+        stmt = select(
+            func.coalesce(func.sum(GitHubEventsVersion.version), 0)
+        )
+        result = await self.session.execute(stmt)
+        return int(result.scalar_one())
+    
+    async def get_modified_at(self, id: UUID) -> datetime:
+        """Время последнего изменения события без загрузки самой строки"""
+        stmt = select(
+            func.coalesce(self.model.updated_at, self.model.created_at)
+        ).where(
+            self.model.id == id
+        )
+        result = await self.session.execute(stmt)
+        modified_at = result.scalar_one_or_none()
+        if modified_at is None:
+            raise EntityNotFoundException("Объект не найден")
+        return modified_at
@@ -0,0 +1,42 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from ..database.models import MonitoredRepository
+from domain.interfaces.monitored_repository import IMonitoredRepositoryRepo
+from .base import BaseRepo
+
+
+class MonitoredRepositoryRepo(IMonitoredRepositoryRepo, BaseRepo[MonitoredRepository]):
+    model = MonitoredRepository
+    
+    async def get_due(self, now: datetime, limit: int) -> list[MonitoredRepository]:
+        """Активные репозитории, которым пора синхронизироваться, самые просроченные первыми"""
+        stmt = select(
+            self.model
+        ).where(
+            self.model.is_active.is_(True),
+            self.model.next_sync_at <= now
+        ).order_by(
+            self.model.next_sync_at
+        ).limit(
+            limit
+        )
+        
+        result = await self.session.execute(stmt)
+        return [entity for entity in result.scalars().all()]
+    
+    async def is_monitored(self, owner: str, name: str) -> bool:
+        """Активный репозиторий с таким owner/name, без учёта регистра как в GitHub"""
+        stmt = select(
+            self.model.id
+        ).where(
+            self.model.is_active.is_(True),
+            func.lower(self.model.owner) == owner.lower(),
+            func.lower(self.model.name) == name.lower()
+        ).limit(
+            1
+        )
+        
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import null, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from ..database.models import GitHubEvent, GitHubEventPayload, PayloadDictionary
+from domain.interfaces.payload_archive import IPayloadArchiveRepo, IPayloadDictionaryRepo
+from .base import BaseRepo
+
+
+class PayloadArchiveRepo(IPayloadArchiveRepo, BaseRepo[GitHubEventPayload]):
+    model = GitHubEventPayload
+    
+    async def get_candidates(self, before: datetime, limit: int) -> list[tuple[UUID, dict[str, Any]]]:
+        """События старше before, у которых raw_data ещё не архивирован"""
+        stmt = select(
+            GitHubEvent.id,
+            GitHubEvent.raw_data
+        ).where(
+            GitHubEvent.raw_data.is_not(None),
+            GitHubEvent.created_at < before
+        ).order_by(
+            GitHubEvent.created_at
+        ).limit(
+            limit
+        ).with_for_update(
+            skip_locked=True
+        )
+        
+        result = await self.session.execute(stmt)
+        return [(id, raw_data) for id, raw_data in result.all()]
+    
+    async def archive(self, rows: list[dict[str, Any]]) -> int:
+        """Сохраняет сжатые payload'ы и очищает raw_data у событий, возвращает число архивированных.
+        
+        Payload, оставшийся от прежней архивации, заменяется: raw_data события могли перезаписать.
+        """
+        if not rows:
+            return 0
+        
+        stmt = insert(
+            self.model
+        ).on_conflict_do_update(
+            index_elements=["event_id"],
+            set_={
+                "dictionary_id": insert(self.model).excluded.dictionary_id,
+                "data": insert(self.model).excluded.data,
+                "raw_size": insert(self.model).excluded.raw_size,
+            }
+        )
+        await self.session.execute(stmt, rows)
+        
+        stmt = update(
+            GitHubEvent
+        ).where(
+            GitHubEvent.id.in_([row["event_id"] for row in rows]),
+            GitHubEvent.raw_data.is_not(None)
+        ).values(
+            # Явное значение отключает onupdate: архивация не меняет событие для клиентов
+            raw_data=null(),
+            updated_at=GitHubEvent.updated_at
+        ).returning(
+            GitHubEvent.id
+        ).execution_options(
+            synchronize_session=False
+        )
+        result = await self.session.execute(stmt)
+        archived = len(result.all())
+        
+        await self.session.flush()
+        return archived
+
+
+class PayloadDictionaryRepo(IPayloadDictionaryRepo, BaseRepo[PayloadDictionary]):
+    model = PayloadDictionary
+    
+    async def get_latest(self) -> PayloadDictionary | None:
+        stmt = select(
+            self.model
+        ).order_by(
+            self.model.created_at.desc()
+        ).limit(
+            1
+        )
+        
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
@@ -0,0 +1,45 @@
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from ..database.models import GitHubRequestCache
+from domain.interfaces.request_cache import IRequestCacheRepo
+from .base import BaseRepo
+
+
+class RequestCacheRepo(IRequestCacheRepo, BaseRepo[GitHubRequestCache]):
+    model = GitHubRequestCache
+    
+    async def save_validators(self, repository: str, validators: dict[str, tuple[str | None, str | None]]) -> None:
+        """Сохраняет ETag/Last-Modified по URL одним upsert-запросом"""
+        if not validators:
+            return
+        
+        stmt = insert(
+            self.model
+        ).values(
+            [
+                {"repository": repository, "url": url, "etag": etag, "last_modified": last_modified}
+                for url, (etag, last_modified) in validators.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.url],
+            set_={
+                "etag": stmt.excluded.etag,
+                "last_modified": stmt.excluded.last_modified,
+                "updated_at": func.now(),
+            }
+        )
+        await self.session.execute(stmt)
+        
+        await self.session.flush()
+
+    
+    async def delete_except(self, repository: str, urls: list[str]) -> None:
+        """Удаляет устаревшие валидаторы репозитория: ключи старого формата и более не запрашиваемые URL"""
+        await self.session.execute(
+            delete(self.model).where(
+                self.model.repository == repository,
+                self.model.url.not_in(urls)
+            )
+        )
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from ..database.models import EventType, SyncState
+from domain.interfaces.sync_state import ISyncStateRepo
+from .base import BaseRepo
+
+
+class SyncStateRepo(ISyncStateRepo, BaseRepo[SyncState]):
+    model = SyncState
+    
+    async def save_mark(
+        self,
+        repository: str,
+        event_type: EventType,
+        last_seen_at: datetime | None,
+        last_seen_id: str
+    ) -> None:
+        """Сохраняет отметку последней загруженной записи одним upsert-запросом"""
+        stmt = insert(
+            self.model
+        ).values(
+            repository=repository,
+            event_type=event_type,
+            last_seen_at=last_seen_at,
+            last_seen_id=last_seen_id
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.repository, self.model.event_type],
+            set_={
+                "last_seen_at": stmt.excluded.last_seen_at,
+                "last_seen_id": stmt.excluded.last_seen_id,
+                "updated_at": func.now(),
+            }
+        )
+        await self.session.execute(stmt)
+        
+        await self.session.flush()
+    
+    async def try_lock(self, repository: str) -> bool:
+        """Advisory-блокировка синхронизации репозитория до конца текущей транзакции.
+        
+        Между репликами синхронизацию одного репозитория выполняет только та,
+        что получила блокировку; она снимается автоматически при commit/rollback.
+        """
+        stmt = select(
+            func.pg_try_advisory_xact_lock(func.hashtext(f"github-sync:{repository}"))
+        )
+        result = await self.session.execute(stmt)
+        return bool(result.scalar_one())
@@ -0,0 +1,49 @@
+"""github events search
+
+Revision ID: 0f6c28d94b3e
+Revises: e71b4d2a6f05
+Create Date: 2026-10-17 13:55:09.471826
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f6c28d94b3e'
+down_revision: Union[str, None] = 'e71b4d2a6f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('github_events', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(author, '')), 'C')",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.create_index('ix_github_events_search_vector', 'github_events', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_github_events_title_trgm', 'github_events', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_github_events_description_trgm', 'github_events', ['description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+    op.create_index('ix_github_events_author_trgm', 'github_events', ['author'], unique=False, postgresql_using='gin', postgresql_ops={'author': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_github_events_author_trgm', table_name='github_events')
+    op.drop_index('ix_github_events_description_trgm', table_name='github_events')
+    op.drop_index('ix_github_events_title_trgm', table_name='github_events')
+    op.drop_index('ix_github_events_search_vector', table_name='github_events')
+    op.drop_column('github_events', 'search_vector')
@@ -0,0 +1,100 @@
+"""github event payload archive
+
+Revision ID: 2d7a9f4c1b36
+Revises: 9b5f3c0e8a12
+Create Date: 2026-10-17 16:02:41.318604
+
+"""
+from typing import Sequence, Union
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import zstandard
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d7a9f4c1b36'
+down_revision: Union[str, None] = '9b5f3c0e8a12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('payload_dictionaries',
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('github_event_payloads',
+    sa.Column('event_id', sa.UUID(), nullable=False),
+    sa.Column('dictionary_id', sa.UUID(), nullable=True),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('raw_size', sa.Integer(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['dictionary_id'], ['payload_dictionaries.id'], ),
+    sa.ForeignKeyConstraint(['event_id'], ['github_events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_github_event_payloads_event_id'), 'github_event_payloads', ['event_id'], unique=True)
+    op.alter_column('github_events', 'raw_data',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               nullable=True)
+
+
+RESTORE_BATCH = 1000
+
+
+def restore_payloads() -> None:
+    """Распаковывает архивированные payload'ы обратно в raw_data пачками по event_id"""
+    bind = op.get_bind()
+    decompressors = {
+        id: zstandard.ZstdDecompressor(dict_data=zstandard.ZstdCompressionDict(data))
+        for id, data in bind.execute(sa.text("SELECT id, data FROM payload_dictionaries"))
+    }
+    decompressors[None] = zstandard.ZstdDecompressor()
+    
+    last_id = uuid.UUID(int=0)
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT event_id, dictionary_id, data FROM github_event_payloads "
+                "WHERE event_id > :last_id "
+                "ORDER BY event_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": RESTORE_BATCH}
+        ).all()
+        if not rows:
+            return
+        bind.execute(
+            sa.text(
+                "UPDATE github_events SET raw_data = CAST(:raw_data AS jsonb) "
+                "WHERE id = :id AND raw_data IS NULL"
+            ),
+            [
+                {"id": event_id, "raw_data": decompressors[dictionary_id].decompress(data).decode()}
+                for event_id, dictionary_id, data in rows
+            ]
+        )
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    restore_payloads()
+    # Событий без raw_data и без архива быть не должно, NOT NULL требует значения
+    op.execute(
+        "UPDATE github_events SET raw_data = '{}'::jsonb WHERE raw_data IS NULL"
+    )
+    op.alter_column('github_events', 'raw_data',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               nullable=False)
+    op.drop_index(op.f('ix_github_event_payloads_event_id'), table_name='github_event_payloads')
+    op.drop_table('github_event_payloads')
+    op.drop_table('payload_dictionaries')
@@ -0,0 +1,36 @@
+"""github events filter indexes
+
+Revision ID: 4a8d1e6b2c97
+Revises: 0f6c28d94b3e
+Create Date: 2026-10-17 14:48:33.208516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a8d1e6b2c97'
+down_revision: Union[str, None] = '0f6c28d94b3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_github_events_repository_type_created_at', 'github_events', ['repository', 'event_type', 'created_at'], unique=False)
+    op.create_index('ix_github_events_type_created_at', 'github_events', ['event_type', 'created_at'], unique=False)
+    op.create_index('ix_github_events_author_created_at', 'github_events', ['author', 'created_at'], unique=False)
+    op.create_index('ix_github_events_issue_number', 'github_events', ['issue_number'], unique=False, postgresql_where=sa.text('issue_number IS NOT NULL'))
+    op.create_index('ix_github_events_release_version', 'github_events', ['release_version'], unique=False, postgresql_where=sa.text('release_version IS NOT NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_github_events_release_version', table_name='github_events')
+    op.drop_index('ix_github_events_issue_number', table_name='github_events')
+    op.drop_index('ix_github_events_author_created_at', table_name='github_events')
+    op.drop_index('ix_github_events_type_created_at', table_name='github_events')
+    op.drop_index('ix_github_events_repository_type_created_at', table_name='github_events')
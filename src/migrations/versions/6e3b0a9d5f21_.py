@@ -0,0 +1,216 @@
+"""github events monthly partitions
+
+Revision ID: 6e3b0a9d5f21
+Revises: 2d7a9f4c1b36
+Create Date: 2026-10-17 16:48:27.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e3b0a9d5f21'
+down_revision: Union[str, None] = '2d7a9f4c1b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = (
+    "id, created_at, updated_at, event_id, event_type, title, description, author, url, "
+    "repository, raw_data, commit_hash, issue_number, release_version"
+)
+
+INDEXES = (
+    'ix_github_events_event_id',
+    'ix_github_events_created_at_id',
+    'ix_github_events_repository_type_created_at',
+    'ix_github_events_type_created_at',
+    'ix_github_events_author_created_at',
+    'ix_github_events_issue_number',
+    'ix_github_events_release_version',
+    'ix_github_events_raw_data',
+    'ix_github_events_search_vector',
+    'ix_github_events_title_trgm',
+    'ix_github_events_description_trgm',
+    'ix_github_events_author_trgm',
+)
+
+# Партиции на месяцы с данными и PARTITIONS_AHEAD вперёд, дальше их создаёт приложение
+PARTITIONS_AHEAD = 3
+
+
+def _create_table(partitioned: bool) -> None:
+    op.create_table('github_events',
+    sa.Column('event_id', sa.String(length=100), nullable=False),
+    sa.Column('event_type', postgresql.ENUM('COMMIT', 'ISSUE', 'RELEASE', name='eventtype', create_type=False), nullable=False),
+    sa.Column('title', sa.String(length=500), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('author', sa.String(length=200), nullable=False),
+    sa.Column('url', sa.String(length=500), nullable=False),
+    sa.Column('repository', sa.String(length=200), nullable=False),
+    sa.Column('raw_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('commit_hash', sa.String(length=100), nullable=True),
+    sa.Column('issue_number', sa.Integer(), nullable=True),
+    sa.Column('release_version', sa.String(length=50), nullable=True),
+    sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'B') || "
+        "setweight(to_tsvector('simple', coalesce(author, '')), 'C')",
+        persisted=True
+    ), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id', 'created_at') if partitioned else sa.PrimaryKeyConstraint('id'),
+    *(() if partitioned else (sa.UniqueConstraint('repository', 'event_id', name='github_events_repository_event_id_key'),)),
+    **({'postgresql_partition_by': 'RANGE (created_at)'} if partitioned else {})
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_github_events_event_id', 'github_events', ['event_id'], unique=False)
+    op.create_index('ix_github_events_created_at_id', 'github_events', ['created_at', 'id'], unique=False)
+    op.create_index('ix_github_events_repository_type_created_at', 'github_events', ['repository', 'event_type', 'created_at'], unique=False)
+    op.create_index('ix_github_events_type_created_at', 'github_events', ['event_type', 'created_at'], unique=False)
+    op.create_index('ix_github_events_author_created_at', 'github_events', ['author', 'created_at'], unique=False)
+    op.create_index('ix_github_events_issue_number', 'github_events', ['issue_number'], unique=False, postgresql_where=sa.text('issue_number IS NOT NULL'))
+    op.create_index('ix_github_events_release_version', 'github_events', ['release_version'], unique=False, postgresql_where=sa.text('release_version IS NOT NULL'))
+    op.create_index('ix_github_events_raw_data', 'github_events', ['raw_data'], unique=False, postgresql_using='gin', postgresql_ops={'raw_data': 'jsonb_path_ops'})
+    op.create_index('ix_github_events_search_vector', 'github_events', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_github_events_title_trgm', 'github_events', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_github_events_description_trgm', 'github_events', ['description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+    op.create_index('ix_github_events_author_trgm', 'github_events', ['author'], unique=False, postgresql_using='gin', postgresql_ops={'author': 'gin_trgm_ops'})
+
+
+def _drop_indexes(table: str) -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('github_event_payloads_event_id_fkey', 'github_event_payloads', type_='foreignkey')
+
+    op.rename_table('github_events', 'github_events_old')
+    op.execute("ALTER TABLE github_events_old RENAME CONSTRAINT github_events_pkey TO github_events_old_pkey")
+    op.drop_constraint('github_events_repository_event_id_key', 'github_events_old', type_='unique')
+    _drop_indexes('github_events_old')
+
+    _create_table(partitioned=True)
+    op.execute("""
+        DO $$
+        DECLARE
+            month date;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', coalesce(
+                        (SELECT min(created_at) FROM github_events_old), now()
+                    ) AT TIME ZONE 'UTC'),
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + interval '%(ahead)s months',
+                    interval '1 month'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %%I PARTITION OF github_events FOR VALUES FROM (%%L) TO (%%L)',
+                    'github_events_' || to_char(month, 'YYYY_MM'),
+                    month::text || ' 00:00:00+00',
+                    (month + interval '1 month')::date::text || ' 00:00:00+00'
+                );
+            END LOOP;
+        END $$
+    """ % {'ahead': PARTITIONS_AHEAD})
+    # Страховка от вставки за пределы созданных партиций
+    op.execute("CREATE TABLE github_events_default PARTITION OF github_events DEFAULT")
+
+    op.execute(f"INSERT INTO github_events ({COLUMNS}) SELECT {COLUMNS} FROM github_events_old")
+    op.drop_table('github_events_old')
+    _create_indexes()
+
+    # Уникальный индекс секционированной таблицы обязан включать created_at,
+    # поэтому уникальность (repository, event_id) держит отдельная таблица ключей
+    op.create_table('github_event_keys',
+    sa.Column('repository', sa.String(length=200), nullable=False),
+    sa.Column('event_id', sa.String(length=100), nullable=False),
+    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('repository', 'event_id')
+    )
+    op.execute("INSERT INTO github_event_keys (repository, event_id) SELECT repository, event_id FROM github_events")
+
+    # Дубликат (repository, event_id) пропускается как ON CONFLICT DO NOTHING
+    op.execute("""
+        CREATE FUNCTION github_events_insert_key() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO github_event_keys (repository, event_id)
+            VALUES (NEW.repository, NEW.event_id)
+            ON CONFLICT (repository, event_id) DO NOTHING;
+            IF NOT FOUND THEN
+                RETURN NULL;
+            END IF;
+            RETURN NEW;
+        END $$
+    """)
+    op.execute("""
+        CREATE FUNCTION github_events_update_key() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE github_event_keys SET repository = NEW.repository, event_id = NEW.event_id
+            WHERE repository = OLD.repository AND event_id = OLD.event_id;
+            RETURN NEW;
+        END $$
+    """)
+    op.execute("""
+        CREATE FUNCTION github_events_delete_key() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            DELETE FROM github_event_keys WHERE repository = OLD.repository AND event_id = OLD.event_id;
+            DELETE FROM github_event_payloads WHERE event_id = OLD.id;
+            RETURN OLD;
+        END $$
+    """)
+    op.execute("""
+        CREATE TRIGGER github_events_insert_key BEFORE INSERT ON github_events
+        FOR EACH ROW EXECUTE FUNCTION github_events_insert_key()
+    """)
+    op.execute("""
+        CREATE TRIGGER github_events_update_key BEFORE UPDATE OF repository, event_id ON github_events
+        FOR EACH ROW
+        WHEN (OLD.repository IS DISTINCT FROM NEW.repository OR OLD.event_id IS DISTINCT FROM NEW.event_id)
+        EXECUTE FUNCTION github_events_update_key()
+    """)
+    op.execute("""
+        CREATE TRIGGER github_events_delete_key AFTER DELETE ON github_events
+        FOR EACH ROW EXECUTE FUNCTION github_events_delete_key()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER github_events_delete_key ON github_events")
+    op.execute("DROP TRIGGER github_events_update_key ON github_events")
+    op.execute("DROP TRIGGER github_events_insert_key ON github_events")
+    op.execute("DROP FUNCTION github_events_delete_key()")
+    op.execute("DROP FUNCTION github_events_update_key()")
+    op.execute("DROP FUNCTION github_events_insert_key()")
+    op.drop_table('github_event_keys')
+
+    _drop_indexes('github_events')
+    op.rename_table('github_events', 'github_events_old')
+    op.execute("ALTER TABLE github_events_old RENAME CONSTRAINT github_events_pkey TO github_events_old_pkey")
+
+    _create_table(partitioned=False)
+    op.execute(
+        f"INSERT INTO github_events ({COLUMNS}) SELECT {COLUMNS} FROM github_events_old "
+        "ON CONFLICT (repository, event_id) DO NOTHING"
+    )
+    # Вместе с родительской таблицей удаляются все её партиции
+    op.drop_table('github_events_old')
+    _create_indexes()
+
+    op.execute("DELETE FROM github_event_payloads p WHERE NOT EXISTS (SELECT 1 FROM github_events e WHERE e.id = p.event_id)")
+    op.create_foreign_key('github_event_payloads_event_id_fkey', 'github_event_payloads', 'github_events', ['event_id'], ['id'], ondelete='CASCADE')
@@ -0,0 +1,39 @@
+"""github events raw_data jsonb
+
+Revision ID: 9b5f3c0e8a12
+Revises: 4a8d1e6b2c97
+Create Date: 2026-10-17 15:36:12.550947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b5f3c0e8a12'
+down_revision: Union[str, None] = '4a8d1e6b2c97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('github_events', 'raw_data',
+               existing_type=sa.Text(),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               existing_nullable=False,
+               postgresql_using='raw_data::jsonb')
+    op.create_index('ix_github_events_raw_data', 'github_events', ['raw_data'], unique=False, postgresql_using='gin', postgresql_ops={'raw_data': 'jsonb_path_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_github_events_raw_data', table_name='github_events')
+    op.alter_column('github_events', 'raw_data',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=sa.Text(),
+               existing_nullable=False,
+               postgresql_using='raw_data::text')
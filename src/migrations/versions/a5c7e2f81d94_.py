@@ -0,0 +1,50 @@
+"""github event stats rollup
+
+Revision ID: a5c7e2f81d94
+Revises: 6e3b0a9d5f21
+Create Date: 2026-10-17 17:21:05.662190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5c7e2f81d94'
+down_revision: Union[str, None] = '6e3b0a9d5f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('github_event_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('repository', sa.String(length=200), nullable=False),
+    sa.Column('event_type', postgresql.ENUM('COMMIT', 'ISSUE', 'RELEASE', name='eventtype', create_type=False), nullable=False),
+    sa.Column('author', sa.String(length=200), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('day', 'repository', 'event_type', 'author')
+    )
+    op.create_index('ix_github_event_stats_repository_day', 'github_event_stats', ['repository', 'day'], unique=False)
+
+    # Счётчики по уже загруженным событиям, дальше их ведёт приложение
+    op.execute("""
+        INSERT INTO github_event_stats (id, day, repository, event_type, author, count)
+        SELECT gen_random_uuid(), (created_at AT TIME ZONE 'UTC')::date, repository, event_type, author, count(*)
+        FROM github_events
+        GROUP BY 2, 3, 4, 5
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_github_event_stats_repository_day', table_name='github_event_stats')
+    op.drop_table('github_event_stats')
@@ -0,0 +1,50 @@
+"""github events version: one shard per statement
+
+Revision ID: b4e8d2c6a913
+Revises: f3a9c1e7b205
+Create Date: 2026-10-17 20:14:05.663218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e8d2c6a913'
+down_revision: Union[str, None] = 'f3a9c1e7b205'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SHARDS = 16
+
+# random() в WHERE вычислялся для каждой строки: команда могла не увеличить
+# ни один шард (304 на изменённый список) или заблокировать несколько
+BUMP_VERSION_FUNCTION = f"""
+    CREATE OR REPLACE FUNCTION github_events_bump_version() RETURNS trigger LANGUAGE plpgsql AS $$
+    DECLARE
+        target int := floor(random() * {SHARDS})::int;
+    BEGIN
+        UPDATE github_events_version SET version = version + 1 WHERE shard = target;
+        RETURN NULL;
+    END $$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(BUMP_VERSION_FUNCTION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION github_events_bump_version() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE github_events_version SET version = version + 1
+            WHERE shard = floor(random() * {SHARDS})::int;
+            RETURN NULL;
+        END $$
+    """)
@@ -0,0 +1,91 @@
+"""monitored repositories
+
+Revision ID: c3a9e51f7b84
+Revises: 8d42f0a6c1e7
+Create Date: 2026-10-17 11:27:05.114382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9e51f7b84'
+down_revision: Union[str, None] = '8d42f0a6c1e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('monitored_repositories',
+    sa.Column('owner', sa.String(length=100), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('is_active', sa.Boolean(), server_default='true', nullable=False),
+    sa.Column('sync_interval', sa.Float(), nullable=False),
+    sa.Column('next_sync_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_sync_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_success_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_duration', sa.Float(), nullable=True),
+    sa.Column('last_created', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('sync_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('error_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('owner', 'name')
+    )
+
+    # Репозиторий из настроек становится первым отслеживаемым
+    op.execute(
+        sa.text(
+            "INSERT INTO monitored_repositories (id, owner, name, sync_interval) "
+            "VALUES (gen_random_uuid(), :owner, :name, :interval)"
+        ).bindparams(
+            owner=settings.GITHUB_OWNER,
+            name=settings.GITHUB_REPO,
+            interval=settings.SYNC_MIN_INTERVAL
+        )
+    )
+
+    # Раньше в repository хранилось только имя, теперь owner/name
+    for table in ('github_events', 'sync_state'):
+        op.execute(
+            sa.text(
+                f"UPDATE {table} SET repository = :owner || '/' || repository "
+                "WHERE position('/' in repository) = 0"
+            ).bindparams(owner=settings.GITHUB_OWNER)
+        )
+
+    # Номера issue и теги уникальны только в пределах репозитория
+    op.drop_index(op.f('ix_github_events_event_id'), table_name='github_events')
+    op.create_index(op.f('ix_github_events_event_id'), 'github_events', ['event_id'], unique=False)
+    op.create_unique_constraint('github_events_repository_event_id_key', 'github_events', ['repository', 'event_id'])
+
+    op.execute("DELETE FROM github_request_cache")
+    op.add_column('github_request_cache', sa.Column('repository', sa.String(length=200), nullable=False))
+    op.create_index(op.f('ix_github_request_cache_repository'), 'github_request_cache', ['repository'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_github_request_cache_repository'), table_name='github_request_cache')
+    op.drop_column('github_request_cache', 'repository')
+
+    op.drop_constraint('github_events_repository_event_id_key', 'github_events', type_='unique')
+    op.drop_index(op.f('ix_github_events_event_id'), table_name='github_events')
+    op.create_index(op.f('ix_github_events_event_id'), 'github_events', ['event_id'], unique=True)
+
+    for table in ('github_events', 'sync_state'):
+        op.execute(
+            f"UPDATE {table} SET repository = split_part(repository, '/', 2) "
+            "WHERE position('/' in repository) > 0"
+        )
+
+    op.drop_table('monitored_repositories')
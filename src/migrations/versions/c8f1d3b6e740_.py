@@ -0,0 +1,59 @@
+"""github events version for etag
+
+Revision ID: c8f1d3b6e740
+Revises: a5c7e2f81d94
+Create Date: 2026-10-17 17:52:33.140876
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f1d3b6e740'
+down_revision: Union[str, None] = 'a5c7e2f81d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SHARDS = 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('github_events_version',
+    sa.Column('shard', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('shard')
+    )
+    op.execute(
+        "INSERT INTO github_events_version (id, shard, version) "
+        f"SELECT gen_random_uuid(), shard, 0 FROM generate_series(0, {SHARDS - 1}) AS shard"
+    )
+
+    # Транзакционный счётчик: версия меняется только после commit пишущей транзакции
+    op.execute(f"""
+        CREATE FUNCTION github_events_bump_version() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE github_events_version SET version = version + 1
+            WHERE shard = floor(random() * {SHARDS})::int;
+            RETURN NULL;
+        END $$
+    """)
+    op.execute("""
+        CREATE TRIGGER github_events_bump_version AFTER INSERT OR UPDATE OR DELETE ON github_events
+        FOR EACH STATEMENT EXECUTE FUNCTION github_events_bump_version()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER github_events_bump_version ON github_events")
+    op.execute("DROP FUNCTION github_events_bump_version()")
+    op.drop_table('github_events_version')
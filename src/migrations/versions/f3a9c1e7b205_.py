@@ -0,0 +1,29 @@
+"""github events raw_data json null to sql null
+
+Revision ID: f3a9c1e7b205
+Revises: c8f1d3b6e740
+Create Date: 2026-10-17 19:05:12.418730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c1e7b205'
+down_revision: Union[str, None] = 'c8f1d3b6e740'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Архивация писала JSON 'null' вместо SQL NULL: такие события уже в github_event_payloads
+    op.execute("UPDATE github_events SET raw_data = NULL WHERE raw_data = 'null'::jsonb")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    pass
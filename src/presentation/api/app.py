@@ -9,6 +9,7 @@ from sqlalchemy import text
 from config import settings
 from infrastructure.database.client_db import ClientDB
 from application import app_registry
+from infrastructure.repositories.base import BaseRepo
 from .routers.api import api_router
 from .errors.base import ErrorsHandler
 
@@ -18,12 +19,23 @@ _log = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     _log.info("Start server")
-    asyncio.create_task(app_registry.github_stories.periodic_task(3600))
+    await app_registry.github_client.connect()
     
     await app_registry.nats_client.connect()
-    await app_registry.nats_client.subscribe()
+    await app_registry.nats_client.subscribe(callback=app_registry.github_stories.handle_nats_message)
+    BaseRepo.count_publisher = app_registry.github_stories.publish_count_invalidation
+    
+    await app_registry.sync_pool.start()
+    await app_registry.webhook_processor.start()
+    archive_task = asyncio.create_task(app_registry.payload_archive_stories.periodic_task())
+    partition_task = asyncio.create_task(app_registry.partition_stories.periodic_task())
     
     yield
+    partition_task.cancel()
+    archive_task.cancel()
+    await app_registry.webhook_processor.stop()
+    await app_registry.sync_pool.stop()
+    await app_registry.github_client.close()
     _log.info("Stop server")
 
 app = FastAPI(
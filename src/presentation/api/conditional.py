@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: object) -> str:
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def not_modified(
+    request: Request,
+    etag: str,
+    last_modified: datetime | None = None
+) -> bool:
+    """Проверка If-None-Match (приоритетнее) и If-Modified-Since"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag.removeprefix("W/") in tags
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # В HTTP-дате секундная точность
+    return last_modified.replace(microsecond=0) <= since
+
+
+def set_validators(
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None
+) -> None:
+    response.headers["ETag"] = etag
+    # Клиент может хранить ответ, но обязан перепроверять его каждый раз
+    response.headers["Cache-Control"] = "no-cache"
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+
+
+def not_modified_response(etag: str, last_modified: datetime | None = None) -> Response:
+    response = Response(status_code=304)
+    set_validators(response, etag, last_modified)
+    return response
@@ -4,7 +4,14 @@ from typing import Type
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from application.exceptions import (
+    InvalidPayloadException,
+    InvalidSignatureException,
+    ServiceOverloadedException,
+    SyncInProgressException
+)
 from infrastructure.exceptions import (
+    ConcurrentUpdateException,
     DatabaseConnectionException,
     EntityNotFoundException,
     EntityAlreadyExistsException,
@@ -23,8 +30,13 @@ class ErrorsHandler:
             DatabaseConnectionException: 500,
             EntityNotFoundException: 404,
             EntityAlreadyExistsException: 409,
+            ConcurrentUpdateException: 409,
             FieldException: 400,
-            PageNotFoundException: 404
+            PageNotFoundException: 404,
+            InvalidSignatureException: 401,
+            InvalidPayloadException: 400,
+            ServiceOverloadedException: 503,
+            SyncInProgressException: 409
         }
 
         for error in self.errors:
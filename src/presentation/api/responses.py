@@ -0,0 +1,47 @@
+import json
+from typing import Any, Mapping
+
+import orjson
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse
+
+
+class ModelResponse(JSONResponse):
+    """JSON-ответ из уже провалидированных моделей.
+    
+    Возвращённый из роута Response FastAPI не валидирует повторно по response_model,
+    а тело пишется в байты через orjson без промежуточного jsonable_encoder.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        exclude_unset: bool = False
+    ):
+        # render вызывается в конструкторе Response
+        self.exclude_unset = exclude_unset
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def _dump(self, content: Any, mode: str = "python") -> Any:
+        if isinstance(content, BaseModel):
+            return content.model_dump(mode=mode, exclude_unset=self.exclude_unset)
+        if isinstance(content, list):
+            return [self._dump(item, mode) for item in content]
+        return content
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(self._dump(content), option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # Целые больше 64 бит в raw_data orjson не кодирует: значения приводит pydantic,
+            # чтобы enum, datetime и UUID выглядели так же, как в ответе через orjson
+            return json.dumps(
+                self._dump(content, mode="json"),
+                ensure_ascii=False,
+                separators=(",", ":")
+            ).encode()
@@ -1,45 +1,223 @@
-from fastapi import APIRouter, WebSocket
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, Header, Query, Request, Response, WebSocket
 from uuid import UUID
 
 from application import app_registry
-from application.schemes.task import GitHubOut, GitHubInput, GitHubEdit
-from application.schemes.base import ListDTO
+from application.schemes.task import (
+    EventType,
+    GitHubFieldsOut,
+    GitHubOut,
+    GitHubInput,
+    GitHubPatch,
+    GitHubFilter,
+    GitHubRawOut,
+    GitHubSearchOut,
+    GitHubStatsOut,
+    StatsBucket
+)
+from application.schemes.base import BulkResultDTO, CacheStatsOut, CountStrategy, ListDTO
+from config import settings
+from ..conditional import make_etag, not_modified, not_modified_response, set_validators
+from ..responses import ModelResponse
 
 
 router = APIRouter(prefix='/events', tags=['Events'])
+
+
+def _split_fields(fields: str | None) -> list[str] | None:
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def _is_ndjson(request: Request) -> bool:
+    return "ndjson" in request.headers.get("content-type", "")
+
     
 @router.get(
-    ""
+    "",
+    response_model=ListDTO[GitHubFieldsOut],
+    response_model_exclude_unset=True
 )
 async def get_all(
+    request: Request,
     search: str | None = None,
     sort_by: str | None = None,
     desc: int = 0,
     page: int = 1,
-    limit: int = -1
-) -> ListDTO[GitHubOut]:
-    async with app_registry.github_stories.begin() as stories:
+    limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    count: CountStrategy = CountStrategy.EXACT,
+    filters: Annotated[GitHubFilter, Query()] = GitHubFilter(),
+    fields: str | None = Query(default=None, description="Поля через запятую, по умолчанию все кроме raw_data")
+) -> Response:
+    async with app_registry.github_stories.begin_read_only() as stories:
+        # Версия читается до данных: ETag никогда не новее отданного списка
+        version = await stories.get_version()
+        etag = make_etag("v", version)
+        if not_modified(request, etag):
+            return not_modified_response(etag)
+        
         objs = await stories.get_all(
             search=search,
             sort_by=sort_by,
             desc=desc,
             page=page,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            filters=filters,
+            fields=_split_fields(fields),
+            version=version
+        )
+        response = ModelResponse(objs, exclude_unset=True)
+        set_validators(response, etag)
+        return response
+
+
+@router.get(
+    "/search",
+    response_model=list[GitHubSearchOut]
+)
+async def search(
+    q: str = Query(min_length=1),
+    limit: int = Query(default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX)
+) -> Response:
+    async with app_registry.github_stories.begin_read_only() as stories:
+        objs = await stories.search(
+            query=q,
             limit=limit
         )
+        return ModelResponse(objs)
+
+
+@router.get(
+    "/cache/stats"
+)
+async def cache_stats() -> CacheStatsOut:
+    """Метрики кэша чтения событий этой реплики"""
+    return app_registry.github_stories.cache_stats()
+
+
+@router.get(
+    "/stats",
+    response_model_exclude_unset=True
+)
+async def stats(
+    bucket: StatsBucket = StatsBucket.DAY,
+    group_by: str | None = Query(default=None, description="Поля через запятую: repository, event_type, author"),
+    date_from: date | None = None,
+    date_to: date | None = None,
+    repository: str | None = None,
+    event_type: EventType | None = None,
+    author: str | None = None
+) -> list[GitHubStatsOut]:
+    async with app_registry.github_stories.begin_read_only() as stories:
+        objs = await stories.stats(
+            bucket=bucket,
+            group_by=_split_fields(group_by),
+            date_from=date_from,
+            date_to=date_to,
+            repository=repository,
+            event_type=event_type,
+            author=author
+        )
         return objs
 
 
+@router.post(
+    "/bulk"
+)
+async def create_bulk(
+    request: Request
+) -> BulkResultDTO:
+    """Пачка событий JSON-массивом или NDJSON (Content-Type: application/x-ndjson)"""
+    async with app_registry.github_stories.begin() as stories:
+        res = await stories.create_bulk(
+            body=await request.body(),
+            ndjson=_is_ndjson(request)
+        )
+        return res
+
+
+@router.patch(
+    "/bulk"
+)
+async def edit_bulk(
+    request: Request
+) -> BulkResultDTO:
+    """Пачка изменений {"id": ..., поля} JSON-массивом или NDJSON"""
+    async with app_registry.github_stories.begin() as stories:
+        res = await stories.update_bulk(
+            body=await request.body(),
+            ndjson=_is_ndjson(request)
+        )
+        return res
+
+
+@router.delete(
+    "/bulk"
+)
+async def delete_bulk(
+    request: Request
+) -> BulkResultDTO:
+    """Пачка id (строками или {"id": ...}) JSON-массивом или NDJSON"""
+    async with app_registry.github_stories.begin() as stories:
+        res = await stories.delete_bulk(
+            body=await request.body(),
+            ndjson=_is_ndjson(request)
+        )
+        return res
+
+
 @router.get(
-    "/{id}"
+    "/{id}",
+    response_model=GitHubFieldsOut,
+    response_model_exclude_unset=True
 )
 async def get_by_id(
-    id: UUID
-) -> GitHubOut:
-    async with app_registry.github_stories.begin() as stories:
+    id: UUID,
+    request: Request,
+    fields: str | None = Query(default=None, description="Поля через запятую, по умолчанию все")
+) -> Response:
+    async with app_registry.github_stories.begin_read_only() as stories:
+        modified_at = await stories.get_modified_at(id=id)
+        etag = make_etag(id, int(modified_at.timestamp() * 1_000_000))
+        if not_modified(request, etag, modified_at):
+            return not_modified_response(etag, modified_at)
+        
         obj = await stories.get_by_id(
+            id=id,
+            fields=_split_fields(fields),
+            modified_at=modified_at
+        )
+        response = ModelResponse(obj, exclude_unset=True)
+        set_validators(response, etag, modified_at)
+        return response
+
+
+@router.get(
+    "/{id}/raw",
+    response_model=GitHubRawOut
+)
+async def get_raw(
+    id: UUID,
+    request: Request
+) -> Response:
+    async with app_registry.payload_archive_stories.begin_read_only() as stories:
+        modified_at = await stories.get_modified_at(id=id)
+        etag = make_etag(id, int(modified_at.timestamp() * 1_000_000), "raw")
+        if not_modified(request, etag, modified_at):
+            return not_modified_response(etag, modified_at)
+        
+        obj = await stories.get_raw(
             id=id
         )
-        return obj
+        response = ModelResponse(obj)
+        set_validators(response, etag, modified_at)
+        return response
 
 
 @router.patch(
@@ -47,12 +225,12 @@ async def get_by_id(
 )
 async def edit(
     id: UUID,
-    data: GitHubEdit
+    data: GitHubPatch
 ) -> GitHubOut:
     async with app_registry.github_stories.begin() as stories:
         obj = await stories.update(
             id=id,
-            **data.model_dump()
+            **data.model_dump(exclude_unset=True)
         )
         return obj
 
@@ -83,14 +261,30 @@ async def delete(
         )
         return None
     
+@router.post(
+    "/webhook",
+    status_code=202
+)
+async def webhook(
+    request: Request,
+    x_github_event: str = Header(),
+    x_hub_signature_256: str | None = Header(default=None)
+) -> dict[str, str]:
+    app_registry.webhook_processor.submit(
+        event=x_github_event,
+        body=await request.body(),
+        signature=x_hub_signature_256
+    )
+    return {"status": "accepted"}
+
+
 @router.post(
     "/task-generator/run"
 )
 async def run_task() -> dict[str, str]:
-    async with app_registry.github_stories.begin() as stories:
-        return await stories.get_from_repo()
+    return await app_registry.sync_pool.sync_all()
         
 @router.websocket("/ws/events")
 async def ws_connect(websocket: WebSocket):
-    async with app_registry.github_stories.begin() as stories:
+    async with app_registry.github_stories.begin_without_transaction() as stories:
         await stories.ws_connect(websocket)
@@ -0,0 +1,95 @@
+from fastapi import APIRouter
+from uuid import UUID
+
+from application import app_registry
+from application.schemes.repository import RepositoryOut, RepositoryInput, RepositoryEdit
+from application.schemes.base import ListDTO
+
+
+router = APIRouter(prefix='/repositories', tags=['Repositories'])
+    
+@router.get(
+    ""
+)
+async def get_all(
+    search: str | None = None,
+    sort_by: str | None = None,
+    desc: int = 0,
+    page: int = 1,
+    limit: int = -1
+) -> ListDTO[RepositoryOut]:
+    async with app_registry.repository_stories.begin_read_only() as stories:
+        objs = await stories.get_all(
+            search=search,
+            sort_by=sort_by,
+            desc=desc,
+            page=page,
+            limit=limit
+        )
+        return objs
+
+
+@router.get(
+    "/{id}"
+)
+async def get_by_id(
+    id: UUID
+) -> RepositoryOut:
+    async with app_registry.repository_stories.begin_read_only() as stories:
+        obj = await stories.get_by_id(
+            id=id
+        )
+        return obj
+
+
+@router.patch(
+    "/{id}"
+)
+async def edit(
+    id: UUID,
+    data: RepositoryEdit
+) -> RepositoryOut:
+    async with app_registry.repository_stories.begin() as stories:
+        obj = await stories.update(
+            id=id,
+            **data.model_dump(exclude_unset=True)
+        )
+        return obj
+
+
+@router.post(
+    ""
+)
+async def create(
+    data: RepositoryInput
+) -> RepositoryOut:
+    async with app_registry.repository_stories.begin() as stories:
+        obj = await stories.create(
+            **data.model_dump()
+        )
+        return obj
+
+
+@router.delete(
+    "/{id}",
+    status_code=204
+)
+async def delete(
+    id: UUID
+) -> None:
+    async with app_registry.repository_stories.begin() as stories:
+        await stories.delete(
+            id=id
+        )
+        return None
+
+
+@router.post(
+    "/{id}/sync"
+)
+async def sync(
+    id: UUID
+) -> RepositoryOut:
+    await app_registry.sync_pool.sync(id=id)
+    async with app_registry.repository_stories.begin() as stories:
+        return await stories.get_by_id(id=id)
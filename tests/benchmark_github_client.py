@@ -0,0 +1,86 @@
+"""Сравнение общей сессии GitHubClient (пул keep-alive) с новой сессией на каждый запрос.
+
+Запросы идут в локальный aiohttp-сервер, имитирующий страницу списка GitHub API.
+Запуск: python tests/benchmark_github_client.py
+"""
+import asyncio
+import json
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import conftest  # noqa: F401 - src в sys.path и окружение из .env.example
+import aiohttp
+from aiohttp import web
+
+from config import settings
+from infrastructure.github_client import GitHubClient
+
+REQUESTS = 2000
+PAGE = json.dumps([
+    {"sha": f"{n:040x}", "commit": {"message": f"commit {n}", "author": {"name": "octocat"}}}
+    for n in range(100)
+]).encode()
+
+
+async def _commits(request: web.Request) -> web.Response:
+    return web.Response(body=PAGE, content_type="application/json")
+
+
+async def _pooled(client: GitHubClient) -> None:
+    async def get() -> None:
+        # Ответы не копятся: иначе время уходит на сборку мусора, а не на запросы
+        await client.get("repos/octo/repo/commits")
+
+    await asyncio.gather(*(get() for _ in range(REQUESTS)))
+
+
+async def _per_request(url: str) -> None:
+    """Как было до общей сессии: своя сессия и новое соединение на каждый запрос"""
+    semaphore = asyncio.Semaphore(settings.GITHUB_MAX_CONCURRENCY)
+
+    async def get() -> None:
+        async with semaphore:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url) as response:
+                    await response.json()
+
+    await asyncio.gather(*(get() for _ in range(REQUESTS)))
+
+
+async def _measure(name: str, run) -> None:
+    started = time.perf_counter()
+    await run
+    elapsed = time.perf_counter() - started
+    print(f"{name:>12} {elapsed:>8.2f} s {REQUESTS / elapsed:>10.0f} req/s")
+
+
+async def main() -> None:
+    app = web.Application()
+    app.router.add_get("/repos/octo/repo/commits", _commits)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    base_url = f"http://127.0.0.1:{port}"
+
+    # Лимит запросов GitHub к локальному серверу не относится
+    settings.GITHUB_RATE_LIMIT = 10 ** 9
+    settings.GITHUB_RATE_BURST = 10 ** 9
+    client = GitHubClient()
+    client.base_url = base_url
+    await client.connect()
+
+    try:
+        await _measure("pooled", _pooled(client))
+        await _measure("per-request", _per_request(f"{base_url}/repos/octo/repo/commits"))
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
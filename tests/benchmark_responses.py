@@ -0,0 +1,62 @@
+"""Сравнение сериализации списков: ModelResponse против jsonable_encoder + JSONResponse.
+
+Запуск: python tests/benchmark_responses.py
+"""
+from datetime import datetime, timezone
+from pathlib import Path
+import sys
+import timeit
+import uuid
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import conftest  # noqa: F401 - src в sys.path и окружение из .env.example
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from application.schemes.task import EventType, GitHubOut
+from presentation.api.responses import ModelResponse
+
+SIZES = (100, 10_000)
+
+
+def _events(count: int) -> list[GitHubOut]:
+    return [
+        GitHubOut(
+            id=uuid.uuid4(),
+            event_id=str(n),
+            event_type=EventType.COMMIT,
+            title=f"commit {n}",
+            description="Fix flaky test in the sync worker",
+            author="octocat",
+            url=f"https://github.com/octo/repo/commit/{n}",
+            repository="octo/repo",
+            raw_data={"sha": uuid.uuid4().hex, "commit": {"message": f"commit {n}", "tree": {"sha": "abc"}}},
+            commit_hash=uuid.uuid4().hex,
+            issue_number=None,
+            release_version=None,
+            created_at=datetime.now(timezone.utc),
+        )
+        for n in range(count)
+    ]
+
+
+def _best(func, number: int) -> float:
+    """Лучшее среднее время одного вызова из пяти серий, мс"""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1000
+
+
+def main() -> None:
+    print(f"{'items':>7} {'ModelResponse, ms':>18} {'jsonable_encoder, ms':>21} {'speedup':>8}")
+    for size in SIZES:
+        events = _events(size)
+        assert ModelResponse(events).body == JSONResponse(jsonable_encoder(events)).body.replace(b"+00:00", b"Z")
+
+        number = max(1, 10_000 // size)
+        fast = _best(lambda: ModelResponse(events).body, number)
+        slow = _best(lambda: JSONResponse(jsonable_encoder(events)).body, number)
+        print(f"{size:>7} {fast:>18.2f} {slow:>21.2f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import asyncio
+import os
+from pathlib import Path
+import sys
+import tempfile
+from typing import Iterator
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+# Настройки читаются при импорте config: значения по умолчанию из .env.example
+for line in (ROOT / ".env.example").read_text().splitlines():
+    key, sep, value = line.partition("=")
+    if sep and not key.lstrip().startswith("#"):
+        os.environ.setdefault(key.strip(), value.partition("#")[0].strip())
+
+
+@pytest.fixture(scope="session")
+def database_url() -> str:
+    """Postgres для тестов: TEST_DATABASE_URL или локальный сервер pgserver"""
+    url = os.environ.get("TEST_DATABASE_URL")
+    if url:
+        return url
+    pgserver = pytest.importorskip("pgserver")
+    server = pgserver.get_server(tempfile.mkdtemp(prefix="pgtest_"), cleanup_mode="stop")
+    return server.get_uri().replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+@pytest.fixture
+def db_schema(database_url: str) -> Iterator[tuple[str, str]]:
+    """Отдельная схема на тест: (url, schema). Таблицы создаёт сам тест"""
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    
+    async def run(sql: str) -> None:
+        engine = create_async_engine(database_url)
+        async with engine.begin() as conn:
+            await conn.execute(text(sql))
+        await engine.dispose()
+    
+    asyncio.run(run(f'CREATE SCHEMA "{schema}"'))
+    yield database_url, schema
+    asyncio.run(run(f'DROP SCHEMA "{schema}" CASCADE'))
+
+
+def schema_engine(url: str, schema: str) -> AsyncEngine:
+    return create_async_engine(url, connect_args={"server_settings": {"search_path": schema}})
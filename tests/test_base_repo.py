@@ -0,0 +1,86 @@
+import asyncio
+import base64
+import json
+
+import pytest
+
+from application.schemes.base import CountStrategy
+from infrastructure import context
+from infrastructure.context import StoryContext
+from infrastructure.exceptions import FieldException
+from infrastructure.repositories.base import BaseRepo, invalidate_table_counts, like_pattern
+from infrastructure.repositories.github_event import TaskRepo
+
+
+def test_count_started_before_invalidation_is_not_cached():
+    repo = TaskRepo()
+    
+    async def exact_count(stmt):
+        # Запись закоммичена, пока шёл подсчёт
+        invalidate_table_counts("github_events")
+        return 5
+    
+    repo._exact_count = exact_count
+    total, strategy = asyncio.run(repo._count(None, CountStrategy.CACHED, "key", unfiltered=True))
+    
+    assert (total, strategy) == (5, CountStrategy.CACHED)
+    assert repo.count_cache.get("key") is None
+
+
+def test_invalidate_counts_runs_after_commit_and_broadcasts(monkeypatch):
+    repo = TaskRepo()
+    repo.count_cache.set("key", 1, size=1, tags=("count",))
+    published: list[str] = []
+    
+    async def publish(table: str) -> None:
+        published.append(table)
+    
+    monkeypatch.setattr(BaseRepo, "count_publisher", publish)
+    
+    async def run():
+        callbacks = []
+        token = context._after_commit.set(callbacks)
+        try:
+            await repo.invalidate_counts()
+        finally:
+            context._after_commit.reset(token)
+        assert repo.count_cache.get("key") == 1 and published == []
+        for callback in callbacks:
+            await callback()
+    
+    asyncio.run(run())
+    
+    assert repo.count_cache.get("key") is None
+    assert published == ["github_events"]
+
+
+def test_cursor_for_column_without_python_type_is_field_error():
+    cursor = base64.urlsafe_b64encode(json.dumps(
+        {"s": "search_vector", "d": 0, "v": "x", "id": "00000000-0000-0000-0000-000000000000"}
+    ).encode()).decode()
+    
+    with pytest.raises(FieldException):
+        TaskRepo()._decode_cursor(cursor, "search_vector", 0)
+
+
+def test_like_pattern_escapes_wildcards():
+    assert like_pattern("100%_a\\b") == "%100\\%\\_a\\\\b%"
+
+
+def test_invalid_jsonpath_is_field_error(database_url, monkeypatch):
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    
+    async def run() -> None:
+        engine = create_async_engine(database_url)
+        monkeypatch.setattr(StoryContext, "read_session_factory", async_sessionmaker(engine))
+        repo = TaskRepo()
+        try:
+            async with StoryContext.begin_read_only():
+                await repo.check_jsonpath('$.commit ? (@.message like_regex "fix")')
+            with pytest.raises(FieldException):
+                async with StoryContext.begin_read_only():
+                    await repo.check_jsonpath("$.commit[")
+        finally:
+            await engine.dispose()
+    
+    asyncio.run(run())
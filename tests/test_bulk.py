@@ -0,0 +1,77 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+
+from application.schemes.base import BulkItemStatus
+from application.schemes.task import GitHubBulkEdit
+from application.stories.github_event_stories import NOT_NULL_FIELDS, TaskStories
+
+
+def test_null_for_not_null_column_is_item_error():
+    stories = TaskStories.__new__(TaskStories)
+    body = json.dumps([
+        {"id": str(uuid.uuid4()), "title": None},
+        {"id": str(uuid.uuid4()), "commit_hash": None},
+    ]).encode()
+    
+    valid, errors = stories._parse_bulk(body, False, GitHubBulkEdit, not_null=NOT_NULL_FIELDS)
+    
+    assert list(valid) == [1]
+    assert [(error.index, error.status) for error in errors] == [(0, BulkItemStatus.INVALID)]
+    assert "title" in (errors[0].error or "")
+
+
+class _Recorder:
+    def __init__(self):
+        self.messages: list[dict] = []
+    
+    async def broadcast(self, message):
+        self.messages.append(message)
+    
+    async def publish(self, data, subject=None):
+        self.messages.append(data)
+    
+    def invalidate(self, *tags):
+        pass
+
+
+def test_notify_many_publishes_id_chunks_after_commit(monkeypatch):
+    from config import settings
+    from infrastructure import context
+    
+    monkeypatch.setattr(settings, "NATS_NOTIFY_CHUNK_SIZE", 2)
+    stories = TaskStories.__new__(TaskStories)
+    stories.ws_manager = _Recorder()
+    stories.nats_client = _Recorder()
+    stories.cache = _Recorder()
+    stories.cache.instance_id = "test"
+    ids = [uuid.uuid4() for _ in range(5)]
+    
+    async def run():
+        callbacks = []
+        token = context._after_commit.set(callbacks)
+        try:
+            await stories._notify_many(type="create_many", ids=ids)
+        finally:
+            context._after_commit.reset(token)
+        # До commit ничего не отправлено
+        assert stories.nats_client.messages == [] and stories.ws_manager.messages == []
+        for callback in callbacks:
+            await callback()
+    
+    asyncio.run(run())
+    
+    chunks = [message["ids"] for message in stories.nats_client.messages if message["type"] == "create_many"]
+    assert chunks == [[str(id) for id in ids[i:i + 2]] for i in range(0, 5, 2)]
+    assert len(stories.ws_manager.messages) == 1
+
+
+def test_patch_null_for_not_null_column_is_field_error():
+    from infrastructure.exceptions import FieldException
+    
+    stories = TaskStories.__new__(TaskStories)
+    
+    with pytest.raises(FieldException, match="title"):
+        asyncio.run(stories.update(id=uuid.uuid4(), title=None, description=None))
@@ -0,0 +1,34 @@
+from infrastructure.cache import TTLCache
+
+
+def test_set_after_invalidation_is_rejected():
+    cache = TTLCache(max_bytes=1024, ttl=60)
+    generation = cache.generation
+    
+    # Запись закоммичена и инвалидирована, пока чтение шло по старым данным
+    cache.invalidate("event:1")
+    cache.set("a", "old", size=1, tags=("event:1",), generation=generation)
+    
+    assert cache.get("a") is None
+    assert cache.stats()["rejected"] == 1
+
+
+def test_set_with_unrelated_invalidation_is_kept():
+    cache = TTLCache(max_bytes=1024, ttl=60)
+    generation = cache.generation
+    
+    cache.invalidate("event:2")
+    cache.set("a", "value", size=1, tags=("event:1",), generation=generation)
+    
+    assert cache.get("a") == "value"
+
+
+def test_set_rejected_when_log_truncated():
+    cache = TTLCache(max_bytes=1024, ttl=60, invalidation_log=2)
+    generation = cache.generation
+    
+    for n in range(3):
+        cache.invalidate(f"event:{n + 10}")
+    cache.set("a", "value", size=1, tags=("event:1",), generation=generation)
+    
+    assert cache.get("a") is None
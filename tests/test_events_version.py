@@ -0,0 +1,55 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+from sqlalchemy import text
+
+from conftest import schema_engine
+
+MIGRATION = Path(__file__).resolve().parent.parent / "src" / "migrations" / "versions" / "b4e8d2c6a913_.py"
+
+
+def _migration():
+    spec = importlib.util.spec_from_file_location("bump_version_migration", MIGRATION)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_every_write_statement_bumps_version_by_one(db_schema):
+    url, schema = db_schema
+    migration = _migration()
+    
+    async def run() -> None:
+        engine = schema_engine(url, schema)
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE github_events_version (shard int UNIQUE, version bigint NOT NULL)"))
+            await conn.execute(text(
+                f"INSERT INTO github_events_version SELECT shard, 0 FROM generate_series(0, {migration.SHARDS - 1}) shard"
+            ))
+            await conn.execute(text("CREATE TABLE github_events (id int PRIMARY KEY, title text)"))
+            await conn.execute(text(migration.BUMP_VERSION_FUNCTION))
+            await conn.execute(text(
+                "CREATE TRIGGER github_events_bump_version AFTER INSERT OR UPDATE OR DELETE ON github_events "
+                "FOR EACH STATEMENT EXECUTE FUNCTION github_events_bump_version()"
+            ))
+        
+        statements = [
+            "INSERT INTO github_events SELECT n, 't' FROM generate_series(1, 5) n",
+            "UPDATE github_events SET title = 'u'",
+            "UPDATE github_events SET title = 'v' WHERE id = 1",
+            "DELETE FROM github_events WHERE id > 3",
+            "INSERT INTO github_events VALUES (10, 'x')",
+            "DELETE FROM github_events",
+        ] * 50
+        version = 0
+        for statement in statements:
+            async with engine.begin() as conn:
+                await conn.execute(text(statement))
+                new_version = (await conn.execute(text("SELECT sum(version) FROM github_events_version"))).scalar_one()
+            assert new_version == version + 1, statement
+            version = new_version
+        await engine.dispose()
+    
+    asyncio.run(run())
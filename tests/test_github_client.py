@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import json
+from typing import Any, AsyncIterator
+
+import pytest
+
+from infrastructure.github_client import _iter_json_array, _parse_retry_after
+
+
+def _parse(body: bytes, size: int) -> list[Any]:
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(body), size):
+            yield body[start:start + size]
+    
+    async def collect() -> list[Any]:
+        return [item async for item in _iter_json_array(chunks())]
+    
+    return asyncio.run(collect())
+
+
+ITEMS = [
+    {"title": "скобки ] } [ { и запятые , в строке", "body": "кавычка \" и слеш \\"},
+    [1, [2, {"a": []}]],
+    "строка",
+    -12.5e3,
+    True,
+    None,
+    {},
+]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 65536])
+def test_items_split_across_chunks(size):
+    body = json.dumps(ITEMS, ensure_ascii=False).encode()
+    assert _parse(body, size) == ITEMS
+
+
+def test_empty_array():
+    assert _parse(b" [ ] ", 1) == []
+
+
+def test_large_item_in_many_chunks():
+    item = {"body": "x" * 5_000_000, "tail": "\\\\"}
+    body = json.dumps([item, 1]).encode()
+    assert _parse(body, 1024) == [item, 1]
+
+
+@pytest.mark.parametrize("body", [b'{"a": 1}', b"[1, 2", b"[1,,2]"])
+def test_invalid_body(body):
+    with pytest.raises(ValueError):
+        _parse(body, 3)
+
+
+def test_retry_after_seconds_and_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+    
+    assert _parse_retry_after("30") == 30
+    assert 100 < (_parse_retry_after(format_datetime(retry_at, usegmt=True)) or 0) <= 120
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
+
+
+def test_request_cache_key_ignores_since():
+    from application.stories.github_event_stories import TaskStories
+    from infrastructure.github_client import GitHubClient
+    
+    stories = TaskStories.__new__(TaskStories)
+    stories.github_client = GitHubClient()
+    url = stories.github_client.build_url(
+        "repos/octo/repo/commits", {"per_page": 100, "since": "2026-10-17T00:00:00Z"}
+    )
+    
+    assert stories._cache_key(url) == stories._cache_key(url.replace("2026-10-17", "2026-10-18"))
+    assert "since" not in stories._cache_key(url)
+    assert stories._cache_key(url) == stories._first_page_key("octo", "repo", "commits")
+
+
+def test_paginate_streams_batches_and_requests_next_page_after_consumer(monkeypatch):
+    from contextlib import asynccontextmanager
+    from types import SimpleNamespace
+    
+    from application.stories.github_event_stories import TaskStories
+    from config import settings
+    
+    monkeypatch.setattr(settings, "GITHUB_STREAM_BATCH", 20)
+    monkeypatch.setattr(settings, "GITHUB_PER_PAGE", 50)
+    events: list[str] = []
+    pages = {
+        "first": ([{"n": n} for n in range(50)], "second"),
+        "second": ([{"n": n} for n in range(50, 60)], None),
+    }
+    
+    class _Client:
+        def build_url(self, path, params=None):
+            return "first" if path.startswith("repos/") else path
+        
+        @asynccontextmanager
+        async def stream(self, url, headers=None):
+            items, next_url = pages[url]
+            
+            async def data():
+                for item in items:
+                    await asyncio.sleep(0)
+                    yield item
+            
+            events.append(f"open {url}")
+            yield SimpleNamespace(status=200, url=url, next_url=next_url, headers={}, data=data())
+            events.append(f"close {url}")
+    
+    stories = TaskStories.__new__(TaskStories)
+    stories.github_client = _Client()
+    stories._cache_key = lambda url: url
+    
+    async def collect() -> list[list[dict]]:
+        batches = []
+        async for batch in stories._paginate("commits", "octo", "repo"):
+            events.append("batch")
+            batches.append(batch)
+        return batches
+    
+    batches = asyncio.run(collect())
+    
+    assert [len(batch) for batch in batches] == [20, 20, 10, 10]
+    assert sum(batches, []) == pages["first"][0] + pages["second"][0]
+    # Следующая страница запрашивается только после обработки пачек предыдущей
+    batch_indexes = [i for i, event in enumerate(events) if event == "batch"]
+    assert events.index("batch") < events.index("close first") < events.index("open second")
+    assert batch_indexes[2] < events.index("open second") < batch_indexes[3]
@@ -0,0 +1,186 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+import importlib.util
+import json
+from pathlib import Path
+from typing import Any
+import uuid
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker
+import zstandard
+
+from application.stories.payload_archive_stories import PayloadArchiveStories
+from config import settings
+from infrastructure.compression import PayloadCompressor
+from infrastructure.repositories.payload_archive import PayloadArchiveRepo, PayloadDictionaryRepo
+from infrastructure.context import StoryContext
+
+from conftest import schema_engine
+
+MIGRATION = Path(__file__).resolve().parent.parent / "src" / "migrations" / "versions" / "2d7a9f4c1b36_.py"
+
+
+class _Result:
+    def __init__(self, rows: list[tuple[Any, ...]]):
+        self.rows = rows
+
+    def all(self) -> list[tuple[Any, ...]]:
+        return self.rows
+
+
+class _Session:
+    """Сессия, которая запоминает выполненные запросы"""
+
+    def __init__(self, updated: list[uuid.UUID]):
+        self.updated = updated
+        self.statements: list[Any] = []
+
+    async def execute(self, stmt: Any, params: Any = None) -> _Result:
+        self.statements.append(stmt)
+        return _Result([(id,) for id in self.updated])
+
+    async def flush(self) -> None:
+        pass
+
+
+def test_archive_writes_sql_null(monkeypatch):
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    session = _Session(updated=ids[:1])
+    monkeypatch.setattr(StoryContext, "get_current_session", classmethod(lambda cls: session))
+    
+    archived = asyncio.run(PayloadArchiveRepo().archive([
+        {"event_id": id, "dictionary_id": None, "data": b"", "raw_size": 0} for id in ids
+    ]))
+    
+    # Возвращаются только события, у которых raw_data действительно очищен
+    assert archived == 1
+    sql = str(session.statements[-1].compile(dialect=postgresql.dialect()))
+    assert "raw_data=NULL" in sql
+    assert "raw_data IS NOT NULL" in sql
+
+
+TABLES = (
+    "CREATE TABLE github_events (id uuid, created_at timestamptz, updated_at timestamptz, raw_data jsonb, "
+    "PRIMARY KEY (id, created_at))",
+    "CREATE TABLE payload_dictionaries (id uuid PRIMARY KEY, data bytea NOT NULL, "
+    "created_at timestamptz DEFAULT now(), updated_at timestamptz)",
+    "CREATE TABLE github_event_payloads (id uuid PRIMARY KEY, event_id uuid UNIQUE NOT NULL, "
+    "dictionary_id uuid REFERENCES payload_dictionaries (id), data bytea NOT NULL, raw_size int NOT NULL, "
+    "created_at timestamptz DEFAULT now(), updated_at timestamptz)",
+)
+
+
+def _stories(compressor: PayloadCompressor) -> PayloadArchiveStories:
+    return PayloadArchiveStories(
+        repo=PayloadArchiveRepo(),
+        dictionary_repo=PayloadDictionaryRepo(),
+        event_repo=None,  # type: ignore
+        compressor=compressor
+    )
+
+
+def test_archive_batch_selects_only_unarchived_old_events(db_schema, monkeypatch):
+    url, schema = db_schema
+    monkeypatch.setattr(settings, "RAW_DATA_ZSTD_DICT", False)
+    now = datetime.now(timezone.utc)
+    updated_at = now - timedelta(days=300)
+    old = [uuid.uuid4() for _ in range(3)]
+    new = uuid.uuid4()
+    
+    async def run() -> None:
+        engine = schema_engine(url, schema)
+        async with engine.begin() as conn:
+            for table in TABLES:
+                await conn.execute(text(table))
+            await conn.execute(
+                text("INSERT INTO github_events VALUES (:id, :created_at, :updated_at, CAST(:raw_data AS jsonb))"),
+                [
+                    {"id": id, "created_at": now - timedelta(days=365), "updated_at": updated_at, "raw_data": f'{{"n": {n}}}'}
+                    for n, id in enumerate(old)
+                ] + [{"id": new, "created_at": now, "updated_at": updated_at, "raw_data": '{"n": 3}'}]
+            )
+        
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        monkeypatch.setattr(StoryContext, "session_factory", session_factory)
+        stories = _stories(PayloadCompressor(level=3))
+        
+        async def archive_batch() -> int:
+            async with StoryContext.begin():
+                return await stories.archive_batch()
+        
+        assert await archive_batch() == 3
+        # Повторная пачка не находит уже архивированных событий
+        assert await archive_batch() == 0
+        
+        async with engine.connect() as conn:
+            rows = (await conn.execute(text("SELECT id, raw_data, updated_at FROM github_events"))).all()
+            payloads = (await conn.execute(text("SELECT event_id, data FROM github_event_payloads"))).all()
+        await engine.dispose()
+        
+        assert {id for id, raw_data, _ in rows if raw_data is None} == set(old)
+        assert all(row_updated_at == updated_at for _, _, row_updated_at in rows)
+        assert {event_id for event_id, _ in payloads} == set(old)
+        assert {
+            json.loads(zstandard.ZstdDecompressor().decompress(data))["n"] for _, data in payloads
+        } == {0, 1, 2}
+    
+    asyncio.run(run())
+
+
+def test_downgrade_restores_archived_payloads(db_schema):
+    url, schema = db_schema
+    spec = importlib.util.spec_from_file_location("payload_archive_migration", MIGRATION)
+    assert spec is not None and spec.loader is not None
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    
+    compressor = PayloadCompressor(level=3)
+    dictionary_id = uuid.uuid4()
+    dictionary = compressor.train_dictionary(
+        [json.dumps({"sha": uuid.uuid4().hex, "message": f"commit {n}"}).encode() for n in range(200)], 4096
+    )
+    compressor.add_dictionary(dictionary_id, dictionary)
+    payloads = {uuid.uuid4(): ({"n": n}, dictionary_id if n % 2 else None) for n in range(5)}
+    
+    def downgrade(conn) -> None:
+        with Operations.context(MigrationContext.configure(conn)):
+            migration.restore_payloads()
+    
+    async def run() -> None:
+        engine = schema_engine(url, schema)
+        async with engine.begin() as conn:
+            for table in TABLES:
+                await conn.execute(text(table))
+            await conn.execute(
+                text("INSERT INTO payload_dictionaries (id, data) VALUES (:id, :data)"),
+                {"id": dictionary_id, "data": dictionary}
+            )
+            await conn.execute(
+                text("INSERT INTO github_events (id, created_at) VALUES (:id, now())"),
+                [{"id": id} for id in payloads]
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO github_event_payloads (id, event_id, dictionary_id, data, raw_size) "
+                    "VALUES (gen_random_uuid(), :event_id, :dictionary_id, :data, 0)"
+                ),
+                [
+                    {
+                        "event_id": id,
+                        "dictionary_id": used,
+                        "data": compressor.compress(json.dumps(raw_data).encode(), used),
+                    }
+                    for id, (raw_data, used) in payloads.items()
+                ]
+            )
+            await conn.run_sync(downgrade)
+            rows = (await conn.execute(text("SELECT id, raw_data FROM github_events"))).all()
+        await engine.dispose()
+        
+        assert {id: raw_data for id, raw_data in rows} == {id: raw_data for id, (raw_data, _) in payloads.items()}
+    
+    asyncio.run(run())
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+import json
+import uuid
+
+from application.schemes.task import EventType, GitHubSearchOut
+from presentation.api.responses import ModelResponse
+
+
+def _event(raw_data: dict) -> GitHubSearchOut:
+    return GitHubSearchOut(
+        id=uuid.uuid4(),
+        event_id="1",
+        event_type=EventType.COMMIT,
+        title="title",
+        description="",
+        author="author",
+        url="https://github.com",
+        repository="owner/name",
+        raw_data=raw_data,
+        commit_hash="abc",
+        issue_number=None,
+        release_version=None,
+        created_at=datetime(2026, 10, 17, 14, 35, 39, 123456, tzinfo=timezone.utc),
+        rank=0.5,
+        snippet="title"
+    )
+
+
+def test_fallback_matches_orjson_output():
+    event = _event({"x": 1})
+    fast = json.loads(ModelResponse([event]).body)
+    
+    # 2**70 не кодируется orjson и уходит в запасной путь
+    fallback = json.loads(ModelResponse([event.model_copy(update={"raw_data": {"x": 2 ** 70}})]).body)
+    
+    assert fallback[0]["raw_data"] == {"x": 2 ** 70}
+    fallback[0]["raw_data"] = fast[0]["raw_data"]
+    assert fallback == fast
+    assert fast[0]["event_type"] == EventType.COMMIT.value
+    assert fast[0]["created_at"] == "2026-10-17T14:35:39.123456Z"
+
+
+def test_search_validates_rows_straight_into_search_out():
+    import asyncio
+    from types import SimpleNamespace
+    
+    from application.stories.github_event_stories import TaskStories
+    
+    event = _event({"x": 1})
+    obj = SimpleNamespace(**event.model_dump(exclude={"rank", "snippet"}))
+    
+    class _Repo:
+        async def search(self, query, limit):
+            return [(obj, 0.25, "<b>title</b>")]
+    
+    stories = TaskStories.__new__(TaskStories)
+    stories.repo = _Repo()
+    
+    [found] = asyncio.run(stories.search("title"))
+    
+    assert found == event.model_copy(update={"rank": 0.25, "snippet": "<b>title</b>"})